@@ -6,14 +6,146 @@ Implements the core "Statistical Arbitrage" logic for binary options.
 import time
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 from loguru import logger
 
 from config import Config
 from market_manager import Market
 from websocket_manager import WebSocketManager
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; kernels run as plain Python
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+
+@njit(
+    "Tuple((f8, f8, f8, f8, f8, f8, b1))(f8, f8, f8, f8, f8)",
+    cache=True,
+    fastmath=True,
+)
+def _compute_arb(yes_ask, no_ask, threshold, min_profit, fixed_investment):
+    """
+    Compiled arbitrage arithmetic for a single YES/NO pair.
+    
+    Returns:
+        Tuple of (implied_sum, profit_pct, yes_investment, no_investment,
+        yes_size, no_size, ok); ok is False when the pair does not clear
+        the trigger threshold or the minimum profit.
+    """
+    implied_sum = yes_ask + no_ask
+    if implied_sum >= threshold or implied_sum <= 0.0:
+        return implied_sum, 0.0, 0.0, 0.0, 0.0, 0.0, False
+    
+    # (1 - s) / s >= min_profit  <=>  s * (1 + min_profit) <= 1, no division
+    if implied_sum * (1.0 + min_profit) > 1.0:
+        return implied_sum, 0.0, 0.0, 0.0, 0.0, 0.0, False
+    
+    # One division, reused for the profit and the allocation split
+    inv_implied = 1.0 / implied_sum
+    profit_pct = inv_implied - 1.0
+    
+    yes_investment = fixed_investment * yes_ask * inv_implied
+    no_investment = fixed_investment * no_ask * inv_implied
+    yes_size = yes_investment / yes_ask
+    no_size = no_investment / no_ask
+    
+    return implied_sum, profit_pct, yes_investment, no_investment, yes_size, no_size, True
+
+
+@njit(
+    "Tuple((f8, f8, f8, f8, f8, f8, b1))(f8, f8, f8, f8, f8, i8[:], i8, i8, i8)",
+    cache=True,
+)
+def _check_market(yes_ask, no_ask, threshold, min_profit, fixed_investment, last_times, row, now_ns, cooldown_ns):
+    """
+    Compiled per-tick check: cooldown gate followed by _compute_arb.
+    
+    Returns:
+        Same tuple as _compute_arb; ok is also False while the market's row
+        in last_times is still cooling down.
+    """
+    if now_ns - last_times[row] < cooldown_ns:
+        return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, False
+    return _compute_arb(yes_ask, no_ask, threshold, min_profit, fixed_investment)
+
+
+# validate_opportunity outcomes from _validate
+VALID = 0
+EXPIRED = 1
+PRICES_MOVED = 2
+
+
+@njit("i8(i8, i8, i8, i8, i8, i8, i8, f8, f8, f8)", cache=True)
+def _validate(now_ns, detected_ns, max_age_ns, yes_seq, no_seq, seen_yes_seq, seen_no_seq, yes_ask, no_ask, threshold):
+    """
+    Compiled re-check of a detected opportunity against the current books.
+    
+    Returns:
+        VALID, EXPIRED or PRICES_MOVED
+    """
+    if now_ns - detected_ns > max_age_ns:
+        return EXPIRED
+    
+    # Neither book has moved since detection
+    if yes_seq == seen_yes_seq and no_seq == seen_no_seq:
+        return VALID
+    
+    if yes_ask + no_ask >= threshold:
+        return PRICES_MOVED
+    return VALID
+
+
+# No fastmath here: rows without an orderbook carry NaN prices.
+# The explicit signature compiles eagerly at import instead of on first scan.
+@njit(
+    "i8(f8[:], f8[:], b1[:], i8[:], i8, f8, f8, i8, i4[:])",
+    parallel=True,
+    cache=True,
+)
+def _scan(yes_asks, no_asks, valid, last_times, now_ns, threshold, min_profit, cooldown_ns, out_idx):
+    """
+    Compiled parallel filter over market price arrays.
+    
+    The per-row mask is computed branch-free across cores with prange, then
+    compacted serially into out_idx.
+    
+    Returns:
+        Number of hit row indices written to the front of out_idx
+    """
+    count = yes_asks.size
+    hits = np.empty(count, dtype=np.bool_)
+    gross = 1.0 + min_profit
+    
+    # Branchless: every condition is evaluated and combined with &
+    for i in prange(count):
+        implied_sum = yes_asks[i] + no_asks[i]
+        hits[i] = (
+            valid[i]
+            & (implied_sum < threshold)
+            & (implied_sum * gross <= 1.0)
+            & (now_ns - last_times[i] >= cooldown_ns)
+        )
+    
+    # Write unconditionally, advance only on hits
+    found = 0
+    for i in range(count):
+        out_idx[found] = i
+        found += hits[i]
+    
+    return found
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ArbitrageOpportunity:
     """Represents a detected arbitrage opportunity."""
     
@@ -25,12 +157,15 @@ class ArbitrageOpportunity:
     yes_size: float
     no_size: float
     total_investment: float
-    timestamp: float
+    timestamp: float  # Wall-clock time, for logging
+    timestamp_ns: int  # time.monotonic_ns() at detection, for ageing
+    yes_seq: int = 0  # Orderbook sequence numbers the prices were read from
+    no_seq: int = 0
     
     def __repr__(self) -> str:
         return (
             f"ArbitrageOpportunity("
-            f"market='{self.market.question[:40]}...', "
+            f"market='{self.market.question_short}...', "
             f"implied_sum={self.implied_sum:.4f}, "
             f"profit={self.expected_profit_pct * 100:.2f}%)"
         )
@@ -57,14 +192,105 @@ class ArbitrageEngine:
         self.config = config
         self.ws_manager = ws_manager
         
-        # Opportunity tracking
-        self.last_opportunity_time: Dict[str, float] = {}
-        self.opportunity_cooldown = config.opportunity_cooldown  # Seconds between opportunities for same market
+        # Hot-path thresholds, bound once instead of read through config per call
+        self._trig = config.trigger_threshold
+        self._min_p = config.min_profit_threshold
+        self._inv_amt = config.fixed_investment_amount
+        
+        # Specialized pure-Python scanner, rebuilt when the market set changes
+        self._scan_fn = None
+        self._scan_key: Tuple[str, ...] = ()
+        
+        # Opportunity tracking: monotonic ns per market row (see register_markets)
+        self._cooldown_ns = int(config.opportunity_cooldown * 1e9)  # Between opportunities for same market
+        self._cid_to_row: Dict[str, int] = {}
+        self._rows_key: Tuple[str, ...] = ()
+        self._last_opp_ns = np.empty(0, dtype=np.int64)
+        
+        if HAS_NUMBA:
+            self._warm_kernels()
         
         logger.info("ArbitrageEngine initialized")
         logger.info(f"Trigger threshold: {config.trigger_threshold}")
         logger.info(f"Min profit threshold: {config.min_profit_threshold * 100:.1f}%")
     
+    def _warm_kernels(self):
+        """
+        Run the numba kernels once on dummy data.
+        
+        Loads the compiled code (or the on-disk cache) during startup so the
+        first real market check does not pay for it.
+        """
+        try:
+            _compute_arb(0.5, 0.5, self._trig, self._min_p, self._inv_amt)
+            _check_market(
+                0.5,
+                0.5,
+                self._trig,
+                self._min_p,
+                self._inv_amt,
+                np.zeros(1, dtype=np.int64),
+                0,
+                0,
+                self._cooldown_ns,
+            )
+            _validate(0, 0, 0, 0, 0, 0, 0, 0.5, 0.5, self._trig)
+            _scan(
+                np.zeros(1),
+                np.zeros(1),
+                np.zeros(1, dtype=np.bool_),
+                np.zeros(1, dtype=np.int64),
+                0,
+                self._trig,
+                self._min_p,
+                self._cooldown_ns,
+                np.zeros(1, dtype=np.int32),
+            )
+            logger.info("Numba scanner warmed")
+        except Exception as e:
+            logger.warning(f"Numba warm-up failed: {e}")
+    
+    def register_markets(self, markets: list[Market]):
+        """
+        Assign each market a row in the cooldown array.
+        
+        Rows follow the order of markets, so scan_all_markets can use the
+        array directly. Cooldowns of markets that were already known are kept.
+        
+        Args:
+            markets: Markets to track, in scan order
+        """
+        previous_rows = self._cid_to_row
+        previous_times = self._last_opp_ns
+        
+        self._cid_to_row = {market.condition_id: row for row, market in enumerate(markets)}
+        self._rows_key = tuple(market.condition_id for market in markets)
+        self._last_opp_ns = np.full(len(markets), -self._cooldown_ns, dtype=np.int64)
+        
+        for cid, row in self._cid_to_row.items():
+            old_row = previous_rows.get(cid)
+            if old_row is not None:
+                self._last_opp_ns[row] = previous_times[old_row]
+        
+        logger.debug(f"Registered {len(markets)} markets for cooldown tracking")
+    
+    def _row(self, condition_id: str) -> int:
+        """
+        Get the cooldown row for a market, appending one if it is unknown.
+        
+        Args:
+            condition_id: Market condition ID
+        
+        Returns:
+            Row index into the cooldown array
+        """
+        row = self._cid_to_row.get(condition_id)
+        if row is None:
+            row = len(self._cid_to_row)
+            self._cid_to_row[condition_id] = row
+            self._last_opp_ns = np.append(self._last_opp_ns, np.int64(-self._cooldown_ns))
+        return row
+    
     def check_arbitrage_opportunity(
         self,
         market: Market
@@ -78,56 +304,74 @@ class ArbitrageEngine:
         Returns:
             ArbitrageOpportunity if found, None otherwise
         """
-        # Get best ask prices for YES and NO tokens
-        prices = self.ws_manager.get_best_prices(
+        # Get best ask prices (and book sequence numbers) for YES and NO tokens
+        quote = self.ws_manager.get_best_prices_seq(
             market.yes_token_id,
             market.no_token_id
         )
         
-        if not prices:
+        if not quote:
             return None
         
-        yes_ask = prices["yes_ask"]
-        no_ask = prices["no_ask"]
-        
-        # Calculate implied probability sum
-        implied_sum = yes_ask + no_ask
-        
-        # Check if sum is below trigger threshold
-        if implied_sum >= self.config.trigger_threshold:
-            # No arbitrage opportunity
-            return None
-        
-        # Calculate expected profit
-        # When market resolves, we get 1.00 for the winning side
-        # Since we buy both, we're guaranteed to get 1.00 total
-        expected_payout = 1.00
-        expected_profit_pct = (expected_payout - implied_sum) / implied_sum
-        
-        # Check if profit meets minimum threshold
-        if expected_profit_pct < self.config.min_profit_threshold:
-            return None
+        yes_ask, no_ask, yes_seq, no_seq = quote
+        
+        # Cooldown (avoid spam for same market), implied sum, profit and
+        # delta-neutral sizing in one compiled call.
+        # When market resolves, we get 1.00 for the winning side; since we
+        # buy both, we're guaranteed to get 1.00 total.
+        now_ns = time.monotonic_ns()
+        row = self._row(market.condition_id)
+        arb = _check_market(
+            yes_ask,
+            no_ask,
+            self._trig,
+            self._min_p,
+            self._inv_amt,
+            self._last_opp_ns,
+            row,
+            now_ns,
+            self._cooldown_ns,
+        )
         
-        # Check cooldown (avoid spam for same market)
-        now = time.time()
-        last_opp = self.last_opportunity_time.get(market.condition_id, 0)
-        if now - last_opp < self.opportunity_cooldown:
+        # Cooled down, below trigger threshold and above minimum profit?
+        if not arb[6]:
             return None
         
-        # Calculate position sizes (delta-neutral)
-        # We want to invest proportionally to maintain equal expected value
-        total_investment = self.config.fixed_investment_amount
+        return self._create_opportunity(
+            market, yes_ask, no_ask, arb, now_ns, yes_seq, no_seq
+        )
+    
+    def _create_opportunity(
+        self,
+        market: Market,
+        yes_ask: float,
+        no_ask: float,
+        arb: Tuple[float, float, float, float, float, float, bool],
+        now_ns: int,
+        yes_seq: int,
+        no_seq: int
+    ) -> ArbitrageOpportunity:
+        """
+        Record the cooldown for a detected opportunity and build the result.
         
-        # Calculate optimal allocation
-        yes_investment = total_investment * (yes_ask / implied_sum)
-        no_investment = total_investment * (no_ask / implied_sum)
+        Args:
+            market: Market with the opportunity
+            yes_ask: YES best ask price
+            no_ask: NO best ask price
+            arb: Result tuple from _compute_arb
+            now_ns: Detection time from time.monotonic_ns()
+            yes_seq: Sequence number of the YES orderbook
+            no_seq: Sequence number of the NO orderbook
         
-        # Size in tokens (investment / price)
-        yes_size = yes_investment / yes_ask
-        no_size = no_investment / no_ask
+        Returns:
+            ArbitrageOpportunity for the market
+        """
+        implied_sum, expected_profit_pct, yes_investment, no_investment, yes_size, no_size, _ = arb
+        total_investment = self._inv_amt
         
         # Record opportunity time
-        self.last_opportunity_time[market.condition_id] = now
+        row = self._row(market.condition_id)
+        self._last_opp_ns[row] = now_ns
         
         # Create opportunity object
         opportunity = ArbitrageOpportunity(
@@ -139,14 +383,17 @@ class ArbitrageEngine:
             yes_size=yes_size,
             no_size=no_size,
             total_investment=total_investment,
-            timestamp=now,
+            timestamp=time.time(),
+            timestamp_ns=now_ns,
+            yes_seq=yes_seq,
+            no_seq=no_seq,
         )
         
         logger.success(
             f"🎯 ARBITRAGE OPPORTUNITY DETECTED!\n"
             f"  Market: {market.question}\n"
             f"  YES Price: ${yes_ask:.4f} | NO Price: ${no_ask:.4f}\n"
-            f"  Implied Sum: {implied_sum:.4f} (Threshold: {self.config.trigger_threshold})\n"
+            f"  Implied Sum: {implied_sum:.4f} (Threshold: {self._trig})\n"
             f"  Expected Profit: {expected_profit_pct * 100:.2f}%\n"
             f"  Investment: ${total_investment:.2f} "
             f"(YES: ${yes_investment:.2f}, NO: ${no_investment:.2f})\n"
@@ -155,10 +402,54 @@ class ArbitrageEngine:
         
         return opportunity
     
+    def compile_scanner(self, markets: list[Market]):
+        """
+        Generate a scanner specialized for a fixed market set.
+        
+        Thresholds and cooldown are inlined as literals and the row loop is
+        unrolled by 4 for the exact market count. Used in place of the _scan
+        kernel when numba is not installed.
+        
+        Args:
+            markets: Markets the scanner will be called with, in order
+        """
+        count = len(markets)
+        gross = 1.0 + self._min_p
+        
+        def row(i: str) -> str:
+            return (
+                f"s = yes_asks[{i}] + no_asks[{i}]\n"
+                f"if s < {self._trig!r} and s * {gross!r} <= 1.0 "
+                f"and now_ns - last_times[{i}] >= {self._cooldown_ns}:\n"
+                f"    out.append({i})\n"
+            )
+        
+        unrolled = count - count % 4
+        lines = ["def scan(yes_asks, no_asks, last_times, now_ns):", "    out = []"]
+        if unrolled:
+            lines.append(f"    for i in range(0, {unrolled}, 4):")
+            for offset in ("i", "i + 1", "i + 2", "i + 3"):
+                lines.extend("        " + line for line in row(offset).splitlines())
+        for i in range(unrolled, count):
+            lines.extend("    " + line for line in row(str(i)).splitlines())
+        lines.append("    return out")
+        
+        namespace: Dict[str, object] = {}
+        exec("\n".join(lines), namespace)
+        
+        self._scan_fn = namespace["scan"]
+        self._scan_key = tuple(market.condition_id for market in markets)
+        logger.debug(f"Compiled scanner for {count} markets")
+    
     def scan_all_markets(self, markets: list[Market]) -> list[ArbitrageOpportunity]:
         """
         Scan all markets for arbitrage opportunities.
         
+        Prices for every market are gathered into arrays once and the
+        threshold, profit and cooldown filters run in the parallel _scan
+        kernel (or the compile_scanner output without numba); opportunities
+        are only built for the rows that survive.
+        
         Args:
             markets: List of markets to scan
         
@@ -167,10 +458,71 @@ class ArbitrageEngine:
         """
         opportunities = []
         
-        for market in markets:
-            opportunity = self.check_arbitrage_opportunity(market)
-            if opportunity:
-                opportunities.append(opportunity)
+        if not markets:
+            return opportunities
+        
+        yes_asks, no_asks, valid = self.ws_manager.get_best_prices_batch(
+            [market.yes_token_id for market in markets],
+            [market.no_token_id for market in markets],
+        )
+        
+        # Rows line up with markets once registered in this order
+        market_key = tuple(market.condition_id for market in markets)
+        if market_key != self._rows_key:
+            self.register_markets(markets)
+        last_times = self._last_opp_ns
+        now_ns = time.monotonic_ns()
+        
+        if HAS_NUMBA:
+            hit_rows = np.empty(len(markets), dtype=np.int32)
+            found = _scan(
+                yes_asks,
+                no_asks,
+                valid,
+                last_times,
+                now_ns,
+                self._trig,
+                self._min_p,
+                self._cooldown_ns,
+                hit_rows,
+            )
+            hit_rows = hit_rows[:found]
+        else:
+            # NaN rows (no orderbook) fail the literal compares on their own
+            if self._scan_key != market_key:
+                self.compile_scanner(markets)
+            hit_rows = self._scan_fn(
+                yes_asks.tolist(), no_asks.tolist(), last_times.tolist(), now_ns
+            )
+        
+        for i in hit_rows:
+            market = markets[i]
+            quote = self.ws_manager.get_best_prices_seq(
+                market.yes_token_id,
+                market.no_token_id
+            )
+            if not quote:
+                continue
+            
+            yes_ask, no_ask, yes_seq, no_seq = quote
+            arb = _compute_arb(
+                yes_ask,
+                no_ask,
+                self._trig,
+                self._min_p,
+                self._inv_amt,
+            )
+            
+            # The scan and _compute_arb kernels can disagree right at the
+            # threshold; only rows that pass the full gate here count
+            if not arb[6]:
+                continue
+            
+            opportunities.append(
+                self._create_opportunity(
+                    market, yes_ask, no_ask, arb, now_ns, yes_seq, no_seq
+                )
+            )
         
         if opportunities:
             logger.info(f"Found {len(opportunities)} arbitrage opportunities")
@@ -192,34 +544,65 @@ class ArbitrageEngine:
         Returns:
             True if still valid, False otherwise
         """
-        # Check age
-        age = time.time() - opportunity.timestamp
-        if age > max_age_seconds:
-            logger.warning(
-                f"Opportunity expired: {age:.2f}s > {max_age_seconds}s"
-            )
-            return False
+        now_ns = time.monotonic_ns()
         
         # Re-check prices (they might have changed)
-        prices = self.ws_manager.get_best_prices(
+        quote = self.ws_manager.get_best_prices_seq(
             opportunity.market.yes_token_id,
             opportunity.market.no_token_id
         )
         
-        if not prices:
+        if not quote:
+            if now_ns - opportunity.timestamp_ns > max_age_seconds * 1e9:
+                return self._validate_failed(EXPIRED, opportunity, now_ns, max_age_seconds, 0.0)
             logger.warning("Orderbook data no longer available")
             return False
         
-        # Check if prices are still favorable
-        current_sum = prices["yes_ask"] + prices["no_ask"]
-        if current_sum >= self.config.trigger_threshold:
+        yes_ask, no_ask, yes_seq, no_seq = quote
+        
+        # Age, book sequence and price checks in one compiled call
+        status = _validate(
+            now_ns,
+            opportunity.timestamp_ns,
+            int(max_age_seconds * 1e9),
+            yes_seq,
+            no_seq,
+            opportunity.yes_seq,
+            opportunity.no_seq,
+            yes_ask,
+            no_ask,
+            self._trig,
+        )
+        if status == VALID:
+            return True
+        
+        return self._validate_failed(status, opportunity, now_ns, max_age_seconds, yes_ask + no_ask)
+    
+    def _validate_failed(
+        self,
+        status: int,
+        opportunity: ArbitrageOpportunity,
+        now_ns: int,
+        max_age_seconds: float,
+        current_sum: float
+    ) -> bool:
+        """
+        Log why validation failed (kept off the compiled path).
+        
+        Returns:
+            Always False
+        """
+        if status == EXPIRED:
+            age = (now_ns - opportunity.timestamp_ns) / 1e9
+            logger.warning(
+                f"Opportunity expired: {age:.2f}s > {max_age_seconds}s"
+            )
+        else:
             logger.warning(
                 f"Prices moved unfavorably: "
                 f"{opportunity.implied_sum:.4f} → {current_sum:.4f}"
             )
-            return False
-        
-        return True
+        return False
     
     def calculate_expected_pnl(
         self,
@@ -261,11 +644,55 @@ class ArbitrageEngine:
             "expected_profit": expected_profit,
             "profit_pct": profit_pct,
         }
+    
+    def calculate_expected_pnl_batch(
+        self,
+        opportunities: list[ArbitrageOpportunity]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate expected P&L for many opportunities at once.
+        
+        Same breakdown as calculate_expected_pnl, computed over float64
+        arrays so reporting on large batches stays vectorized.
+        
+        Args:
+            opportunities: Arbitrage opportunities
+        
+        Returns:
+            Dictionary of P&L arrays aligned with the input order
+        """
+        count = len(opportunities)
+        
+        def column(field: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(opp, field) for opp in opportunities),
+                dtype=np.float64,
+                count=count,
+            )
+        
+        yes_cost = column("yes_size") * column("yes_price")
+        no_cost = column("no_size") * column("no_price")
+        total_cost = yes_cost + no_cost
+        
+        expected_revenue = column("total_investment") / column("implied_sum")
+        expected_profit = expected_revenue - total_cost
+        
+        profit_pct = np.zeros(count, dtype=np.float64)
+        np.divide(expected_profit * 100, total_cost, out=profit_pct, where=total_cost > 0)
+        
+        return {
+            "yes_cost": yes_cost,
+            "no_cost": no_cost,
+            "total_cost": total_cost,
+            "expected_revenue": expected_revenue,
+            "expected_profit": expected_profit,
+            "profit_pct": profit_pct,
+        }
 
 
 async def test_arbitrage_engine():
     """Test arbitrage engine functionality."""
-    from config import Config
+    from config import load_config
     from market_manager import MarketManager
     from rate_limiter import RateLimiter
     import asyncio
@@ -274,12 +701,12 @@ async def test_arbitrage_engine():
     
     # Create config
     try:
-        config = Config()
+        config = load_config()
     except Exception as e:
         print(f"⚠️  Config error: {e}")
         import os
         os.environ["POLY_PRIVATE_KEY"] = "test"
-        config = Config()
+        config = load_config()
     
     # Create managers
     rate_limiter = RateLimiter(max_calls=10, period=60.0)
@@ -4,8 +4,11 @@ Provides async balance and allowance queries for trading validation.
 """
 
 import asyncio
+from functools import lru_cache
 from typing import Optional
-from web3 import AsyncWeb3
+import aiohttp
+from eth_abi import decode
+from web3 import AsyncWeb3, Web3
 from web3.providers import AsyncHTTPProvider
 from web3.exceptions import Web3Exception
 from loguru import logger
@@ -41,26 +44,152 @@ ERC20_ABI = [
     },
 ]
 
+# Multicall3 is deployed at the same address on every major EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Multicall3 ABI (minimal - only aggregate3)
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+# 4-byte function selectors for raw ERC20 calldata
+BALANCE_OF_SELECTOR = Web3.keccak(text="balanceOf(address)")[:4]
+ALLOWANCE_SELECTOR = Web3.keccak(text="allowance(address,address)")[:4]
+
+
+def _address_word(address: str) -> bytes:
+    """
+    ABI-encode an address as a left-padded 32-byte word.
+    
+    Args:
+        address: 0x-prefixed hex address
+    
+    Returns:
+        32-byte ABI word
+    
+    Raises:
+        ValueError: If the address is not 0x-prefixed 20-byte hex
+    """
+    if not address.startswith(("0x", "0X")):
+        raise ValueError(f"Address must be 0x-prefixed: {address!r}")
+    raw = bytes.fromhex(address[2:])
+    if len(raw) != 20:
+        raise ValueError(f"Address must be 20 bytes, got {len(raw)}: {address!r}")
+    return raw.rjust(32, b"\x00")
+
+
+# Gas price smoothing: EMA weight for new samples and refresh period (seconds)
+GAS_EMA_ALPHA = 0.3
+GAS_REFRESH_INTERVAL = 2.0
+
 
 class BalanceChecker:
     """
     Async USDC balance checker for Polygon network.
     """
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize balance checker.
         
         Args:
             config: Configuration object
+            session: Shared aiohttp session (owned and closed by the caller).
+                If omitted, a private keep-alive session is created on connect.
         """
         self.config = config
         self.w3: Optional[AsyncWeb3] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.usdc_contract = None
+        self.multicall3 = None
         self.usdc_decimals = 6  # USDC has 6 decimals on Polygon
         
+        # Gas price EMA maintained off the trading path
+        self._gas_cache: dict = {}
+        self._gas_ema_wei: Optional[float] = None
+        self._gas_task: Optional[asyncio.Task] = None
+        
         logger.info(f"BalanceChecker initialized for {config.usdc_address}")
     
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _checksum(address: str) -> str:
+        """
+        EIP-55 checksum an address, memoized per raw string.
+        
+        Args:
+            address: Hex address in any case
+        
+        Returns:
+            Checksummed address
+        """
+        return Web3.to_checksum_address(address)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _encode_balance(owner_address: str) -> bytes:
+        """
+        Build balanceOf(owner) calldata, memoized per owner.
+        
+        Args:
+            owner_address: Token owner address
+        
+        Returns:
+            ABI-encoded calldata
+        
+        Raises:
+            ValueError: If the address is malformed
+        """
+        return BALANCE_OF_SELECTOR + _address_word(owner_address)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _encode_allowance(owner_address: str, spender_address: str) -> bytes:
+        """
+        Build allowance(owner, spender) calldata, memoized per pair.
+        
+        Args:
+            owner_address: Token owner address
+            spender_address: Spender address
+        
+        Returns:
+            ABI-encoded calldata
+        
+        Raises:
+            ValueError: If either address is malformed
+        """
+        return (
+            ALLOWANCE_SELECTOR
+            + _address_word(owner_address)
+            + _address_word(spender_address)
+        )
+    
     async def connect(self):
         """
         Connect to Polygon RPC and initialize USDC contract.
@@ -69,11 +198,26 @@ class BalanceChecker:
             Web3Exception: If connection fails
         """
         try:
-            # Initialize AsyncWeb3 with HTTP provider
-            provider = AsyncHTTPProvider(self.config.polygon_rpc_url)
+            # Long-lived keep-alive pool so RPCs reuse warm TCP/TLS connections
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=32,
+                    keepalive_timeout=75,
+                    force_close=False,
+                    ttl_dns_cache=600,
+                )
+                self._session = aiohttp.ClientSession(connector=connector)
+                self._owns_session = True
+            
+            # Initialize AsyncWeb3 with HTTP provider bound to our session
+            provider = AsyncHTTPProvider(
+                self.config.polygon_rpc_url,
+                request_kwargs={"timeout": aiohttp.ClientTimeout(total=5)},
+            )
+            await provider.cache_async_session(self._session)
             self.w3 = AsyncWeb3(provider)
             
-            # Check connection
+            # Check connection (also primes the pool before the first trade)
             is_connected = await self.w3.is_connected()
             if not is_connected:
                 raise Web3Exception(
@@ -87,12 +231,23 @@ class BalanceChecker:
                     f"Connected to chain ID {chain_id} (expected 137 for Polygon)"
                 )
             
+            # Warm the checksum cache with the addresses used on every trade
+            for address in (self.config.poly_proxy_address, self.config.ctf_exchange_address):
+                if address:
+                    self._checksum(address)
+            
             # Initialize USDC contract
             self.usdc_contract = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(self.config.usdc_address),
+                address=self._checksum(self.config.usdc_address),
                 abi=ERC20_ABI,
             )
             
+            # Multicall3 lets balance + allowance share one eth_call
+            self.multicall3 = self.w3.eth.contract(
+                address=self._checksum(MULTICALL3_ADDRESS),
+                abi=MULTICALL3_ABI,
+            )
+            
             # Verify decimals
             try:
                 decimals = await self.usdc_contract.functions.decimals().call()
@@ -101,6 +256,10 @@ class BalanceChecker:
             except Exception as e:
                 logger.warning(f"Could not verify USDC decimals: {e}")
             
+            # Keep gas prices fresh in the background
+            if self._gas_task is None or self._gas_task.done():
+                self._gas_task = asyncio.create_task(self._gas_refresh_loop())
+            
             logger.success(
                 f"Connected to Polygon RPC (Chain ID: {chain_id})"
             )
@@ -126,16 +285,17 @@ class BalanceChecker:
             await self.connect()
         
         try:
-            # Get balance in wei (raw units)
-            checksum_address = self.w3.to_checksum_address(wallet_address)
-            balance_raw = await self.usdc_contract.functions.balanceOf(
-                checksum_address
-            ).call()
+            # Get balance in wei (raw units) with prebuilt calldata
+            raw = await self.w3.eth.call({
+                "to": self._checksum(self.config.usdc_address),
+                "data": self._encode_balance(wallet_address),
+            })
+            balance_raw = int.from_bytes(raw, "big")
             
             # Convert to human-readable (divide by 10^decimals)
             balance = balance_raw / (10 ** self.usdc_decimals)
             
-            logger.debug(f"USDC balance for {wallet_address[:10]}...: ${balance:.2f}")
+            logger.debug("USDC balance for {:.10}...: ${:.2f}", wallet_address, balance)
             
             return balance
             
@@ -165,20 +325,18 @@ class BalanceChecker:
             await self.connect()
         
         try:
-            checksum_owner = self.w3.to_checksum_address(owner_address)
-            checksum_spender = self.w3.to_checksum_address(spender_address)
-            
-            allowance_raw = await self.usdc_contract.functions.allowance(
-                checksum_owner,
-                checksum_spender
-            ).call()
+            raw = await self.w3.eth.call({
+                "to": self._checksum(self.config.usdc_address),
+                "data": self._encode_allowance(owner_address, spender_address),
+            })
+            allowance_raw = int.from_bytes(raw, "big")
             
             # Convert to human-readable
             allowance = allowance_raw / (10 ** self.usdc_decimals)
             
             logger.debug(
-                f"USDC allowance for {owner_address[:10]}... → "
-                f"{spender_address[:10]}...: ${allowance:.2f}"
+                "USDC allowance for {:.10}... → {:.10}...: ${:.2f}",
+                owner_address, spender_address, allowance,
             )
             
             return allowance
@@ -190,6 +348,122 @@ class BalanceChecker:
             )
             raise
     
+    async def snapshot(
+        self,
+        owner_address: str,
+        spender_address: str
+    ) -> tuple[float, float]:
+        """
+        Get USDC balance and allowance in a single Multicall3 round-trip.
+        
+        Args:
+            owner_address: Token owner address
+            spender_address: Spender address (e.g., CTF Exchange contract)
+        
+        Returns:
+            Tuple of (balance, allowance) in human-readable format
+        
+        Raises:
+            Web3Exception: If query fails
+        """
+        if not self.w3 or not self.multicall3:
+            await self.connect()
+        
+        try:
+            usdc = self._checksum(self.config.usdc_address)
+            
+            calls = [
+                (usdc, False, self._encode_balance(owner_address)),
+                (usdc, False, self._encode_allowance(owner_address, spender_address)),
+            ]
+            (_, balance_data), (_, allowance_data) = await self.multicall3.functions.aggregate3(
+                calls
+            ).call()
+            
+            scale = 10 ** self.usdc_decimals
+            balance = decode(["uint256"], balance_data)[0] / scale
+            allowance = decode(["uint256"], allowance_data)[0] / scale
+            
+            logger.debug(
+                "USDC snapshot for {:.10}...: balance ${:.2f}, allowance ${:.2f}",
+                owner_address, balance, allowance,
+            )
+            
+            return balance, allowance
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to get USDC snapshot for "
+                f"{owner_address} → {spender_address}: {e}"
+            )
+            raise
+    
+    async def check_balance_and_allowance(
+        self,
+        owner_address: str,
+        spender_address: str,
+        required_amount: float
+    ) -> tuple[bool, bool, float, float]:
+        """
+        Check balance and allowance against a required amount in one RPC.
+        
+        Args:
+            owner_address: Token owner address
+            spender_address: Spender address
+            required_amount: Required USDC amount
+        
+        Returns:
+            Tuple of (has_balance, has_allowance, current_balance, current_allowance)
+        """
+        try:
+            balance, allowance = await self.snapshot(owner_address, spender_address)
+            has_balance = balance >= required_amount
+            has_allowance = allowance >= required_amount
+            
+            if not has_balance:
+                logger.warning(
+                    f"Insufficient USDC balance: ${balance:.2f} < ${required_amount:.2f}"
+                )
+            if not has_allowance:
+                logger.warning(
+                    f"Insufficient USDC allowance: ${allowance:.2f} < ${required_amount:.2f}. "
+                    f"Owner needs to approve {spender_address}"
+                )
+            
+            return has_balance, has_allowance, balance, allowance
+            
+        except Exception as e:
+            logger.error(f"Failed to check balance and allowance: {e}")
+            return False, False, 0.0, 0.0
+    
+    async def preflight(
+        self,
+        owner_address: str,
+        spender_address: str,
+        required_amount: float
+    ) -> tuple[bool, bool, float, float, dict]:
+        """
+        Run every pre-trade check concurrently.
+        
+        The balance/allowance snapshot and the gas price lookup are awaited
+        together, so the latency is the slower of the two rather than the sum.
+        
+        Args:
+            owner_address: Token owner address
+            spender_address: Spender address
+            required_amount: Required USDC amount
+        
+        Returns:
+            Tuple of (has_balance, has_allowance, current_balance,
+            current_allowance, gas_prices)
+        """
+        (has_balance, has_allowance, balance, allowance), gas_prices = await asyncio.gather(
+            self.check_balance_and_allowance(owner_address, spender_address, required_amount),
+            self.get_gas_price(),
+        )
+        
+        return has_balance, has_allowance, balance, allowance, gas_prices
+    
     async def check_sufficient_balance(
         self,
         wallet_address: str,
@@ -253,35 +527,46 @@ class BalanceChecker:
             logger.error(f"Failed to check allowance: {e}")
             return False, 0.0
     
-    async def get_gas_price(self) -> dict:
+    @staticmethod
+    def _gas_dict(gas_price_wei: int) -> dict:
         """
-        Get current gas prices on Polygon.
+        Build the gas price summary for a base price.
+        
+        Args:
+            gas_price_wei: Base gas price in wei
         
         Returns:
-            Dictionary with gas price info in gwei
+            Dictionary with gas price info in gwei and wei
+        """
+        gas_price_gwei = gas_price_wei / 10**9
+        
+        # Polygon is fast, so we add 10% buffer for next block inclusion
+        fast_gas_price_gwei = gas_price_gwei * 1.1
+        
+        return {
+            "standard_gwei": round(gas_price_gwei, 2),
+            "fast_gwei": round(fast_gas_price_gwei, 2),
+            "standard_wei": gas_price_wei,
+            "fast_wei": int(gas_price_wei * 1.1),
+        }
+    
+    async def _raw_gas_price(self) -> dict:
+        """
+        Query the current gas price from the RPC node.
+        
+        Returns:
+            Dictionary with gas price info in gwei (defaults if the query fails)
         """
         if not self.w3:
             await self.connect()
         
         try:
-            # Get base gas price
             gas_price_wei = await self.w3.eth.gas_price
-            gas_price_gwei = gas_price_wei / 10**9
-            
-            # Calculate recommended gas prices
-            # Polygon is fast, so we add 10% buffer for next block inclusion
-            fast_gas_price_gwei = gas_price_gwei * 1.1
-            
-            result = {
-                "standard_gwei": round(gas_price_gwei, 2),
-                "fast_gwei": round(fast_gas_price_gwei, 2),
-                "standard_wei": gas_price_wei,
-                "fast_wei": int(gas_price_wei * 1.1),
-            }
+            result = self._gas_dict(gas_price_wei)
             
             logger.debug(
-                f"Gas price: {result['standard_gwei']} gwei "
-                f"(fast: {result['fast_gwei']} gwei)"
+                "Gas price: {} gwei (fast: {} gwei)",
+                result["standard_gwei"], result["fast_gwei"],
             )
             
             return result
@@ -296,23 +581,71 @@ class BalanceChecker:
                 "fast_wei": 55_000_000_000,
             }
     
+    async def _gas_refresh_loop(self):
+        """
+        Background task that folds fresh gas samples into an EMA.
+        
+        Failed samples are skipped so the EMA never absorbs fallback values.
+        """
+        while True:
+            try:
+                sample = await self.w3.eth.gas_price
+                if self._gas_ema_wei is None:
+                    self._gas_ema_wei = float(sample)
+                else:
+                    self._gas_ema_wei += GAS_EMA_ALPHA * (sample - self._gas_ema_wei)
+                self._gas_cache = self._gas_dict(int(self._gas_ema_wei))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug("Gas price refresh failed: {}", e)
+            
+            await asyncio.sleep(GAS_REFRESH_INTERVAL)
+    
+    async def get_gas_price(self) -> dict:
+        """
+        Get current gas prices on Polygon.
+        
+        Served from the background EMA cache; only queries the node
+        before the first sample has arrived.
+        
+        Returns:
+            Dictionary with gas price info in gwei
+        """
+        return self._gas_cache or await self._raw_gas_price()
+    
     async def close(self):
         """Close web3 connection."""
+        if self._gas_task:
+            self._gas_task.cancel()
+            try:
+                await self._gas_task
+            except asyncio.CancelledError:
+                pass
+            self._gas_task = None
+        self._gas_cache = {}
+        self._gas_ema_wei = None
+        
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
         if self.w3:
             # AsyncWeb3 doesn't have explicit close, but we can clean up
             self.w3 = None
             self.usdc_contract = None
+            self.multicall3 = None
             logger.info("BalanceChecker connection closed")
 
 
 async def test_balance_checker():
     """Test balance checker functionality."""
-    from config import Config
+    from config import load_config
     
     print("Testing BalanceChecker...")
     
     # Create mock config
-    config = Config()
+    config = load_config()
     
     # Create balance checker
     checker = BalanceChecker(config)
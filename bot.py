@@ -4,22 +4,41 @@ Main orchestration module that coordinates all components.
 """
 
 import asyncio
+import json
 import signal
 import sys
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import aiohttp
 from loguru import logger
 
 from config import Config, init_config
 from logger import setup_logger
 from rate_limiter import RateLimiter
-from market_manager import MarketManager
+from market_manager import MarketManager, Market
 from websocket_manager import WebSocketManager
-from arbitrage_engine import ArbitrageEngine
+from arbitrage_engine import ArbitrageEngine, ArbitrageOpportunity
 from balance_checker import BalanceChecker
-from clob_client_wrapper import ClobClientWrapper
-from order_executor import OrderExecutor
 from paper_trade_executor import PaperTradeExecutor
 
+if TYPE_CHECKING:
+    # py-clob-client is imported lazily, only when live trading starts
+    from clob_client_wrapper import ClobClientWrapper
+    from order_executor import OrderExecutor
+
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> str:
+        """Serialize request bodies with orjson."""
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    _json_dumps = json.dumps
+
+
+# Detected opportunities waiting for the executor; older ones are dropped first
+OPPORTUNITY_QUEUE_SIZE = 8
+
 
 class PolymarketArbitrageBot:
     """
@@ -43,18 +62,40 @@ class PolymarketArbitrageBot:
         self.config = config
         
         # Components
+        self.http_session: Optional[aiohttp.ClientSession] = None
         self.rate_limiter: Optional[RateLimiter] = None
         self.market_manager: Optional[MarketManager] = None
         self.ws_manager: Optional[WebSocketManager] = None
         self.arbitrage_engine: Optional[ArbitrageEngine] = None
         self.balance_checker: Optional[BalanceChecker] = None
-        self.clob_client: Optional[ClobClientWrapper] = None
-        self.order_executor: Optional[OrderExecutor] = None
+        self.clob_client: Optional["ClobClientWrapper"] = None
+        self.order_executor: Optional["OrderExecutor"] = None
         self.paper_trade_executor: Optional[PaperTradeExecutor] = None
         
         # State
         self.running = False
         self.markets = []
+        self._pipeline: Optional[asyncio.Future] = None
+        
+        # Stage 1 -> 2: markets with unprocessed book updates (insertion-ordered, coalesced)
+        self._pending_markets: Dict[str, Market] = {}
+        self._pending_event = asyncio.Event()
+        
+        # Stage 2 -> 3: detected opportunities awaiting execution
+        self._opportunity_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=OPPORTUNITY_QUEUE_SIZE
+        )
+        
+        # Trading wallet never changes for the process lifetime; derive it once
+        if config.uses_proxy:
+            self._wallet_address = config.poly_proxy_address
+        else:
+            from eth_account import Account
+            self._wallet_address = Account.from_key(config.poly_private_key).address
+        
+        # Short-lived USDC balance cache: (balance, monotonic timestamp)
+        self._balance_cache: Optional[tuple[float, float]] = None
+        self._balance_cache_ttl = 0.5  # seconds
         
         logger.info("PolymarketArbitrageBot initialized")
     
@@ -62,6 +103,20 @@ class PolymarketArbitrageBot:
         """Initialize all bot components."""
         logger.info("Initializing bot components...")
         
+        # Shared HTTP session: one keep-alive pool for Gamma API and Polygon RPC
+        # so calls reuse warm TCP/TLS connections instead of handshaking anew
+        connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=50,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        self.http_session = aiohttp.ClientSession(
+            connector=connector,
+            json_serialize=_json_dumps,
+        )
+        logger.success("✓ HTTP session initialized")
+        
         # Rate limiter
         self.rate_limiter = RateLimiter(
             max_calls=self.config.max_api_calls_per_minute,
@@ -70,7 +125,10 @@ class PolymarketArbitrageBot:
         logger.success("✓ Rate limiter initialized")
         
         # Market manager
-        self.market_manager = MarketManager(self.config, self.rate_limiter)
+        self.market_manager = MarketManager(
+            self.config, self.rate_limiter, session=self.http_session
+        )
+        await self.market_manager.warmup()
         logger.success("✓ Market manager initialized")
         
         # WebSocket manager
@@ -94,13 +152,16 @@ class PolymarketArbitrageBot:
             logger.success("✓ Paper trade executor initialized")
             
             # Still initialize balance checker for validation (but won't be used for trading)
-            self.balance_checker = BalanceChecker(self.config)
+            self.balance_checker = BalanceChecker(self.config, session=self.http_session)
             await self.balance_checker.connect()
             logger.success("✓ Balance checker connected (for validation only)")
         else:
             # Real trading mode - initialize all components
+            from clob_client_wrapper import ClobClientWrapper
+            from order_executor import OrderExecutor
+            
             # Balance checker
-            self.balance_checker = BalanceChecker(self.config)
+            self.balance_checker = BalanceChecker(self.config, session=self.http_session)
             await self.balance_checker.connect()
             logger.success("✓ Balance checker connected")
             
@@ -144,11 +205,14 @@ class PolymarketArbitrageBot:
         
         logger.success(f"Fetched {len(self.markets)} markets to monitor")
         
+        # Give every market a fixed cooldown row in the arbitrage engine
+        self.arbitrage_engine.register_markets(self.markets)
+        
         # Log top markets
         logger.info("Top markets by volume:")
         for i, market in enumerate(self.markets[:5], 1):
             logger.info(
-                f"  {i}. {market.question[:60]}... "
+                f"  {i}. {market.question_display}... "
                 f"(${market.volume_24hr:.2f})"
             )
         
@@ -159,67 +223,112 @@ class PolymarketArbitrageBot:
         logger.info("Subscribing to WebSocket Market Channel...")
         
         await self.ws_manager.connect()
-        await self.ws_manager.subscribe_to_markets(self.markets)
         
-        # Set up callbacks
-        self.ws_manager.on_book_update = self.on_orderbook_update
+        # Each market is bound to its own callback, so updates need no lookup
+        await self.ws_manager.subscribe_to_markets(
+            self.markets, callback=self.on_orderbook_update
+        )
         
         logger.success("WebSocket subscription active!")
     
-    async def on_orderbook_update(self, market_id: str, asset_id: str, orderbook):
+    async def on_orderbook_update(self, market: Market, asset_id: str, orderbook):
         """
         Callback for orderbook updates.
         
+        Only marks the market as pending for the opportunity detector, so the
+        WebSocket reader never waits on validation or order submission.
+        Repeated updates for a market that is still pending coalesce.
+        
         Args:
-            market_id: Market condition ID
+            market: Market bound to this asset at subscription time
             asset_id: Token ID
             orderbook: OrderbookSnapshot
         """
-        # Find the market
-        market = self.market_manager.get_market(market_id)
-        
-        if not market:
-            return
-        
-        # Check for arbitrage opportunity
-        opportunity = self.arbitrage_engine.check_arbitrage_opportunity(market)
-        
-        if not opportunity:
-            return
+        self._pending_markets[market.condition_id] = market
+        self._pending_event.set()
+    
+    async def _opportunity_detector(self):
+        """
+        Pipeline stage 2: check pending markets against their latest books.
         
-        # We found an opportunity!
-        logger.info("🎯 Arbitrage opportunity detected, validating...")
+        Detected opportunities are queued for the executor; when the queue is
+        full the oldest entry is dropped, since stale opportunities are worse
+        than missed ones.
+        """
+        while True:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            
+            while self._pending_markets:
+                market_id = next(iter(self._pending_markets))
+                market = self._pending_markets.pop(market_id)
+                
+                try:
+                    opportunity = self.arbitrage_engine.check_arbitrage_opportunity(market)
+                except Exception as e:
+                    logger.error("Error checking market {}: {}", market_id, e)
+                    continue
+                
+                if not opportunity:
+                    continue
+                
+                logger.info("🎯 Arbitrage opportunity detected, queued for execution")
+                
+                if self._opportunity_queue.full():
+                    self._opportunity_queue.get_nowait()
+                    logger.warning("Opportunity queue full, dropped the oldest entry")
+                self._opportunity_queue.put_nowait(opportunity)
+                
+                # Let the executor pick it up between markets
+                await asyncio.sleep(0)
+    
+    async def _opportunity_executor(self):
+        """Pipeline stage 3: validate and trade queued opportunities."""
+        while True:
+            opportunity = await self._opportunity_queue.get()
+            
+            try:
+                await self._execute_opportunity(opportunity)
+            except Exception as e:
+                logger.error("Error processing opportunity: {}", e)
+    
+    async def _execute_opportunity(self, opportunity: ArbitrageOpportunity):
+        """
+        Trade an opportunity if it is still valid and funds allow.
         
+        Args:
+            opportunity: Opportunity from the detector stage
+        """
         # Validate opportunity (check if still valid)
         if not self.arbitrage_engine.validate_opportunity(opportunity):
             logger.warning("Opportunity validation failed, skipping")
             return
         
-        # Check balance before execution
-        wallet_address = (
-            self.config.poly_proxy_address
-            if self.config.uses_proxy
-            else self._get_wallet_address()
-        )
-        
-        sufficient, balance = await self.balance_checker.check_sufficient_balance(
-            wallet_address,
-            opportunity.total_investment
-        )
+        # Check balance before execution (reuse a fresh cached balance if any)
+        now = time.monotonic()
+        cached = self._balance_cache
+        if cached is not None and now - cached[1] < self._balance_cache_ttl:
+            balance = cached[0]
+            sufficient = balance >= opportunity.total_investment
+        else:
+            sufficient, balance = await self.balance_checker.check_sufficient_balance(
+                self._wallet_address,
+                opportunity.total_investment
+            )
+            self._balance_cache = (balance, now)
         
         if not sufficient:
             logger.warning(
-                f"Skipping opportunity: Insufficient balance "
-                f"(${balance:.2f} < ${opportunity.total_investment:.2f})"
+                "Skipping opportunity: Insufficient balance (${:.2f} < ${:.2f})",
+                balance, opportunity.total_investment,
             )
             return
         
         # Check if balance is above minimum threshold
         if balance < self.config.min_usdc_balance:
             logger.warning(
-                f"Balance below minimum threshold: "
-                f"${balance:.2f} < ${self.config.min_usdc_balance:.2f}. "
-                f"Pausing trading."
+                "Balance below minimum threshold: ${:.2f} < ${:.2f}. Pausing trading.",
+                balance, self.config.min_usdc_balance,
             )
             return
         
@@ -232,27 +341,31 @@ class PolymarketArbitrageBot:
                 
                 if result.success:
                     logger.success(
-                        f"📝 [PAPER TRADE] Trade simulated successfully! "
-                        f"Execution time: {result.execution_time_ms:.2f}ms"
+                        "📝 [PAPER TRADE] Trade simulated successfully! "
+                        "Execution time: {:.2f}ms",
+                        result.execution_time_ms,
                     )
                 else:
                     logger.warning(
-                        f"Paper trade simulation failed: YES={result.yes_status}, "
-                        f"NO={result.no_status}"
+                        "Paper trade simulation failed: YES={}, NO={}",
+                        result.yes_status, result.no_status,
                     )
             
             except Exception as e:
-                logger.error(f"Error simulating paper trade: {e}")
+                logger.error("Error simulating paper trade: {}", e)
         else:
             logger.info("💰 Executing arbitrage trade...")
             
             try:
                 result = await self.order_executor.execute_arbitrage(opportunity)
                 
+                # Any real execution may have moved USDC; force a fresh read
+                self._balance_cache = None
+                
                 if result.success:
                     logger.success(
-                        f"✅ Arbitrage executed successfully! "
-                        f"Execution time: {result.execution_time_ms:.2f}ms"
+                        "✅ Arbitrage executed successfully! Execution time: {:.2f}ms",
+                        result.execution_time_ms,
                     )
                 elif result.is_partial_fill():
                     logger.error(
@@ -260,21 +373,16 @@ class PolymarketArbitrageBot:
                     )
                 else:
                     logger.warning(
-                        f"Execution failed: YES={result.yes_status}, "
-                        f"NO={result.no_status}"
+                        "Execution failed: YES={}, NO={}",
+                        result.yes_status, result.no_status,
                     )
             
             except Exception as e:
-                logger.error(f"Error executing arbitrage: {e}")
+                logger.error("Error executing arbitrage: {}", e)
     
     def _get_wallet_address(self) -> str:
         """Get wallet address."""
-        if self.config.uses_proxy:
-            return self.config.poly_proxy_address
-        else:
-            from eth_account import Account
-            account = Account.from_key(self.config.poly_private_key)
-            return account.address
+        return self._wallet_address
     
     async def run(self):
         """Run the main bot loop."""
@@ -300,9 +408,20 @@ class PolymarketArbitrageBot:
             logger.success("BOT IS NOW RUNNING - Monitoring for arbitrage opportunities")
             logger.success("=" * 70)
             
-            # Start WebSocket listener
-            await self.ws_manager.listen()
+            # A signal may have arrived while we were starting up
+            if not self.running:
+                return
+            
+            # Run reader -> detector -> executor concurrently (cancelled by _initiate_shutdown)
+            self._pipeline = asyncio.gather(
+                self.ws_manager.listen(),
+                self._opportunity_detector(),
+                self._opportunity_executor(),
+            )
+            await self._pipeline
             
+        except asyncio.CancelledError:
+            logger.info("Pipeline stopped, shutting down...")
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt, shutting down...")
         except Exception as e:
@@ -311,6 +430,21 @@ class PolymarketArbitrageBot:
         finally:
             await self.shutdown()
     
+    def _initiate_shutdown(self, sig: signal.Signals):
+        """
+        Stop the bot from the event loop in response to a signal.
+        
+        Cancelling the pipeline lets run() fall through to shutdown().
+        
+        Args:
+            sig: Signal that was received
+        """
+        logger.info(f"Received signal {sig.name}, initiating shutdown...")
+        self.running = False
+        
+        if self._pipeline and not self._pipeline.done():
+            self._pipeline.cancel()
+    
     async def shutdown(self):
         """Graceful shutdown."""
         logger.info("=" * 70)
@@ -319,6 +453,15 @@ class PolymarketArbitrageBot:
         
         self.running = False
         
+        # Stop the pipeline stages if they are still running
+        if self._pipeline and not self._pipeline.done():
+            self._pipeline.cancel()
+            try:
+                await self._pipeline
+            except asyncio.CancelledError:
+                pass
+        self._pipeline = None
+        
         # Log final statistics
         if self.config.paper_trading_mode and self.paper_trade_executor:
             self.paper_trade_executor.log_statistics()
@@ -335,6 +478,13 @@ class PolymarketArbitrageBot:
         if self.balance_checker:
             await self.balance_checker.close()
         
+        if self.clob_client:
+            await self.clob_client.close()
+        
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        self.http_session = None
+        
         logger.info("Bot shutdown complete. Goodbye!")
 
 
@@ -342,16 +492,20 @@ def setup_signal_handlers(bot: PolymarketArbitrageBot):
     """
     Setup signal handlers for graceful shutdown.
     
+    Handlers run on the event loop, so run() still reaches its
+    shutdown() cleanup. Must be called with the loop running.
+    
     Args:
         bot: Bot instance
     """
-    def signal_handler(sig, frame):
-        logger.info(f"Received signal {sig}, initiating shutdown...")
-        bot.running = False
-        sys.exit(0)
+    loop = asyncio.get_running_loop()
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, bot._initiate_shutdown, sig)
+        except NotImplementedError:
+            # Windows: no loop signal handlers; Ctrl+C arrives as KeyboardInterrupt
+            pass
 
 
 async def main():
@@ -383,6 +537,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use libuv's event loop when uvloop is installed (not available on Windows)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
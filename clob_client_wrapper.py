@@ -4,15 +4,28 @@ Handles ClobClient initialization and API credential management.
 """
 
 import asyncio
-from typing import Optional, Dict, Any
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, List, Tuple
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs, OrderType, ApiCreds
 from py_clob_client.order_builder.constants import BUY, SELL
 from loguru import logger
 
+try:
+    from py_clob_client.clob_types import PostOrdersArgs
+except ImportError:  # older py-clob-client without the batch endpoint
+    PostOrdersArgs = None
+
 from config import Config
 
 
+# Upper bound on cached signed orders (oldest entries are evicted first)
+SIGNED_ORDER_CACHE_SIZE = 256
+
+
 class ClobClientWrapper:
     """
     Async wrapper for Polymarket ClobClient.
@@ -32,6 +45,15 @@ class ClobClientWrapper:
         self.client: Optional[ClobClient] = None
         self._initialized = False
         
+        # Dedicated pool so signing/HTTP calls don't queue behind other blocking work
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.clob_worker_threads,
+            thread_name_prefix="clob",
+        )
+        
+        # (token_id, side, price, size, negrisk) -> (signed_order, monotonic created_at)
+        self._signed_cache: Dict[Tuple, Tuple[Any, float]] = {}
+        
         logger.info("ClobClientWrapper initialized")
     
     def initialize(self):
@@ -90,7 +112,7 @@ class ClobClientWrapper:
     
     async def initialize_async(self):
         """Async wrapper for initialize()."""
-        await asyncio.get_event_loop().run_in_executor(None, self.initialize)
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.initialize)
     
     def create_order(self, order_args: OrderArgs) -> Dict[str, Any]:
         """
@@ -120,17 +142,47 @@ class ClobClientWrapper:
         """
         Create and sign an order (async).
         
+        With ENABLE_ORDER_SIGNATURE_CACHE set, an identical order signed
+        within ORDER_SIGNATURE_CACHE_TTL seconds is reused instead of re-signed.
+        
         Args:
             order_args: Order arguments
         
         Returns:
             Signed order dictionary
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None,
+        if not self.config.enable_order_signature_cache:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self.create_order,
+                order_args
+            )
+        
+        key = (
+            order_args.token_id,
+            order_args.side,
+            round(order_args.price, 3),
+            round(order_args.size, 4),
+            getattr(order_args, "negrisk", False),
+        )
+        now = time.monotonic()
+        
+        cached = self._signed_cache.get(key)
+        if cached is not None and now - cached[1] < self.config.order_signature_cache_ttl:
+            return cached[0]
+        
+        signed_order = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
             self.create_order,
             order_args
         )
+        
+        self._signed_cache.pop(key, None)
+        self._signed_cache[key] = (signed_order, now)
+        if len(self._signed_cache) > SIGNED_ORDER_CACHE_SIZE:
+            del self._signed_cache[next(iter(self._signed_cache))]
+        
+        return signed_order
     
     def post_order(
         self,
@@ -176,13 +228,75 @@ class ClobClientWrapper:
         Returns:
             Order response dictionary
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None,
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
             self.post_order,
             signed_order,
             order_type
         )
     
+    @property
+    def supports_batch_orders(self) -> bool:
+        """Check if the installed py-clob-client can post several orders at once."""
+        return PostOrdersArgs is not None and hasattr(self.client, "post_orders")
+    
+    def post_orders(
+        self,
+        signed_orders: List[Dict[str, Any]],
+        order_type: OrderType = OrderType.GTC
+    ) -> List[Dict[str, Any]]:
+        """
+        Post several signed orders in a single request (synchronous).
+        
+        Args:
+            signed_orders: Signed order dictionaries
+            order_type: Order type applied to every order (GTC, FOK, GTD)
+        
+        Returns:
+            Order response dictionaries, in the same order as signed_orders
+        
+        Raises:
+            Exception: If the batch submission fails
+        """
+        if not self._initialized or not self.client:
+            raise RuntimeError("ClobClient not initialized. Call initialize() first.")
+        
+        if not self.supports_batch_orders:
+            raise RuntimeError("Installed py-clob-client has no batch order endpoint")
+        
+        try:
+            response = self.client.post_orders([
+                PostOrdersArgs(order=signed_order, orderType=order_type)
+                for signed_order in signed_orders
+            ])
+            return response
+            
+        except Exception as e:
+            logger.error(f"Failed to post order batch: {e}")
+            raise
+    
+    async def post_orders_async(
+        self,
+        signed_orders: List[Dict[str, Any]],
+        order_type: OrderType = OrderType.GTC
+    ) -> List[Dict[str, Any]]:
+        """
+        Post several signed orders in a single request (async).
+        
+        Args:
+            signed_orders: Signed order dictionaries
+            order_type: Order type applied to every order (GTC, FOK, GTD)
+        
+        Returns:
+            Order response dictionaries, in the same order as signed_orders
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            self.post_orders,
+            signed_orders,
+            order_type
+        )
+    
     async def create_and_post_order(
         self,
         order_args: OrderArgs,
@@ -206,6 +320,38 @@ class ClobClientWrapper:
         
         return response
     
+    async def create_and_post_orders_batch(
+        self,
+        order_args_list: List[OrderArgs],
+        order_type: OrderType = OrderType.GTC
+    ) -> List[Any]:
+        """
+        Sign several orders concurrently, then submit them together (async).
+        
+        Signing runs across the worker pool in parallel. If any order fails
+        to sign, nothing is posted. Orders are then sent in one batch request
+        when supported, otherwise posted in parallel.
+        
+        Args:
+            order_args_list: Order arguments, one per leg
+            order_type: Order type applied to every order (GTC, FOK, GTD)
+        
+        Returns:
+            Order responses aligned with order_args_list; a failed leg holds
+            its exception instead of a response
+        """
+        signed_orders = await asyncio.gather(
+            *(self.create_order_async(order_args) for order_args in order_args_list)
+        )
+        
+        if self.supports_batch_orders:
+            return await self.post_orders_async(list(signed_orders), order_type)
+        
+        return await asyncio.gather(
+            *(self.post_order_async(signed_order, order_type) for signed_order in signed_orders),
+            return_exceptions=True
+        )
+    
     def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """
         Cancel an order (synchronous).
@@ -231,17 +377,25 @@ class ClobClientWrapper:
         """
         Cancel an order (async).
         
+        Also drops the signed-order cache used by create_order_async.
+        
         Args:
             order_id: Order ID to cancel
         
         Returns:
             Cancellation response
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None,
-            self.cancel_order,
-            order_id
-        )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self.cancel_order,
+                order_id
+            )
+        finally:
+            # Cache keys don't carry order IDs; drop everything so a (possibly)
+            # cancelled order is never resubmitted from the cache. Done here on
+            # the event loop thread, which is the only one touching the cache.
+            self._signed_cache.clear()
     
     def get_order(self, order_id: str) -> Dict[str, Any]:
         """
@@ -274,8 +428,8 @@ class ClobClientWrapper:
         Returns:
             Order details
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None,
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
             self.get_order,
             order_id
         )
@@ -311,18 +465,28 @@ class ClobClientWrapper:
         Returns:
             Orderbook data
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None,
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
             self.get_orderbook,
             token_id
         )
     
+    async def close(self):
+        """Shut down the worker thread pool."""
+        self._executor.shutdown(wait=False)
+        logger.info("ClobClientWrapper closed")
+    
     @property
     def is_initialized(self) -> bool:
         """Check if client is initialized."""
         return self._initialized
 
 
+# Preset constructors for the common non-negrisk case, bound once at import
+_buy_order_args = partial(OrderArgs, side=BUY)
+_sell_order_args = partial(OrderArgs, side=SELL)
+
+
 def create_buy_order_args(
     token_id: str,
     price: float,
@@ -341,6 +505,9 @@ def create_buy_order_args(
     Returns:
         OrderArgs object
     """
+    if not negrisk:
+        return _buy_order_args(token_id=token_id, price=price, size=size)
+    
     return OrderArgs(
         price=price,
         size=size,
@@ -368,6 +535,9 @@ def create_sell_order_args(
     Returns:
         OrderArgs object
     """
+    if not negrisk:
+        return _sell_order_args(token_id=token_id, price=price, size=size)
+    
     return OrderArgs(
         price=price,
         size=size,
@@ -379,13 +549,13 @@ def create_sell_order_args(
 
 async def test_clob_client():
     """Test CLOB client wrapper."""
-    from config import Config
+    from config import load_config
     
     print("Testing ClobClientWrapper...")
     
     # Create config
     try:
-        config = Config()
+        config = load_config()
     except Exception as e:
         print(f"⚠️  Config error (expected if .env not set): {e}")
         print("   Skipping CLOB client test (requires valid credentials)")
@@ -419,6 +589,8 @@ async def test_clob_client():
 
 
 if __name__ == "__main__":
+    # Fail loudly if the async wrappers regress to deprecated loop APIs
+    warnings.filterwarnings("error", category=DeprecationWarning, module="__main__")
     asyncio.run(test_clob_client())
 
 
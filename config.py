@@ -4,9 +4,11 @@ Parses .env file and validates all required settings.
 """
 
 import os
-from typing import List, Optional
-from dotenv import load_dotenv
-from loguru import logger
+import sys
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from typing import Dict, List, Mapping, Optional
+from dotenv import dotenv_values
 
 
 class ConfigError(Exception):
@@ -14,210 +16,374 @@ class ConfigError(Exception):
     pass
 
 
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, mtime: float) -> Dict[str, Optional[str]]:
+    """
+    Parse a .env file once per (path, mtime).
+    
+    The modification time is part of the cache key, so editing the file
+    invalidates the cached values.
+    """
+    return dict(dotenv_values(path))
+
+
+def _load_env_file(env_file: str) -> bool:
+    """
+    Load a .env file into os.environ without overriding existing variables.
+    
+    Args:
+        env_file: Path to .env file
+    
+    Returns:
+        True if the file exists and defines at least one variable
+    """
+    try:
+        mtime = os.stat(env_file).st_mtime
+    except OSError:
+        return False
+    
+    values = _parse_env_file(env_file, mtime)
+    for key, value in values.items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+    return bool(values)
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer setting from an environment snapshot."""
+    return int(env.get(key, default))
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    """Read a float setting from an environment snapshot."""
+    return float(env.get(key, default))
+
+
+def _get_required(env: Mapping[str, str], key: str) -> str:
+    """
+    Get required environment variable.
+    
+    Args:
+        env: Environment snapshot
+        key: Environment variable name
+    
+    Returns:
+        Environment variable value
+    
+    Raises:
+        ConfigError: If environment variable is not set
+    """
+    value = env.get(key)
+    if not value:
+        raise ConfigError(
+            f"Required environment variable {key} is not set. "
+            f"Please check your .env file."
+        )
+    return value
+
+
+def _parse_tags(tags_str: str) -> List[str]:
+    """
+    Parse comma-separated tags string.
+    
+    Args:
+        tags_str: Comma-separated tags (e.g., "crypto,politics")
+    
+    Returns:
+        List of interned, lowercased tag strings
+    """
+    tags = []
+    for tag in tags_str.split(","):
+        tag = tag.strip()
+        if tag:
+            tags.append(sys.intern(tag.lower()))
+    return tags
+
+
+# Declarative constraints: (attribute, env var, predicate, requirement message)
+_CONFIG_RULES = (
+    (
+        "poly_signature_type",
+        "POLY_SIGNATURE_TYPE",
+        lambda v: v in (0, 1, 2),
+        "Must be 0 (EOA), 1 (Email/Magic), or 2 (Browser Wallet).",
+    ),
+    (
+        "trigger_threshold",
+        "TRIGGER_THRESHOLD",
+        lambda v: 0.5 <= v <= 1.0,
+        "Must be between 0.5 and 1.0.",
+    ),
+    (
+        "fixed_investment_amount",
+        "FIXED_INVESTMENT_AMOUNT",
+        lambda v: v > 0,
+        "Must be greater than 0.",
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
-    Configuration management for the Polymarket arbitrage bot.
-    Loads environment variables and validates required settings.
+    Configuration for the Polymarket arbitrage bot.
+    
+    Immutable once created; build it with load_config(), which reads the
+    environment. Settings are validated on construction.
     """
     
-    def __init__(self, env_file: str = ".env"):
+    # Wallet Configuration
+    poly_private_key: str
+    poly_proxy_address: str
+    poly_signature_type: int
+    
+    # Trading Parameters
+    trigger_threshold: float
+    fixed_investment_amount: float
+    min_profit_threshold: float
+    min_usdc_balance: float
+    opportunity_cooldown: float
+    
+    # Market Selection
+    market_mode: str
+    btc_eth_duration_minutes: int
+    target_tags: List[str]
+    min_market_volume: float
+    min_liquidity: float
+    
+    # Network Endpoints
+    polygon_rpc_url: str
+    clob_api_url: str
+    gamma_api_url: str
+    wss_url: str
+    
+    # Rate Limiting
+    max_api_calls_per_minute: int
+    max_ws_subscriptions: int
+    
+    # Order Execution
+    clob_worker_threads: int
+    enable_order_signature_cache: bool
+    order_signature_cache_ttl: float
+    
+    # Logging
+    log_level: str
+    log_file: str
+    
+    # Paper Trading Mode
+    paper_trading_mode: bool
+    paper_trading_file: str
+    
+    # Market Maker Settings
+    mm_paper_trading: bool
+    mm_paper_trading_file: str
+    mm_target_spread: float
+    mm_skew_factor: float
+    mm_max_inventory: int
+    mm_quote_update_interval: float
+    
+    # Polygon chain ID (fixed for Polygon mainnet)
+    chain_id: int = 137
+    
+    # Polygon USDC contract address (6 decimals)
+    usdc_address: str = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+    
+    # CTF Exchange contract address (for monitoring)
+    ctf_exchange_address: str = "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E"
+    
+    def __post_init__(self):
+        """Validate all constrained settings in one pass."""
+        self._validate()
+    
+    def _validate(self):
         """
-        Initialize configuration from environment file.
-        
-        Args:
-            env_file: Path to .env file (default: ".env")
+        Check parsed settings against _CONFIG_RULES.
         
         Raises:
-            ConfigError: If required configuration is missing or invalid
+            ConfigError: On the first setting that violates its rule
         """
-        # Load environment variables
-        if not load_dotenv(env_file):
-            logger.warning(f"No {env_file} file found. Using environment variables.")
+        for attr, key, is_valid, requirement in _CONFIG_RULES:
+            value = getattr(self, attr)
+            if not is_valid(value):
+                raise ConfigError(f"Invalid {key}: {value}. {requirement}")
+    
+    def _log_config_summary(self):
+        """Log configuration summary (without sensitive data) as one record."""
+        from loguru import logger
         
-        # Wallet Configuration
-        self.poly_private_key = self._get_required("POLY_PRIVATE_KEY")
-        self.poly_proxy_address = os.getenv("POLY_PROXY_ADDRESS", "")
-        self.poly_signature_type = int(os.getenv("POLY_SIGNATURE_TYPE", "1"))
+        # Skip building the summary if the configured level would hide it
+        try:
+            if logger.level(self.log_level).no > logger.level("INFO").no:
+                return
+        except ValueError:
+            pass  # Unknown level name; let the logger setup report it
         
-        # Validate signature type
-        if self.poly_signature_type not in [0, 1, 2]:
-            raise ConfigError(
-                f"Invalid POLY_SIGNATURE_TYPE: {self.poly_signature_type}. "
-                "Must be 0 (EOA), 1 (Email/Magic), or 2 (Browser Wallet)."
-            )
+        if self.poly_proxy_address:
+            proxy = f"Proxy Address: {self.poly_proxy_address[:10]}..."
+        else:
+            proxy = "Proxy Address: Not set (EOA mode)"
         
-        # Trading Parameters
-        self.trigger_threshold = float(os.getenv("TRIGGER_THRESHOLD", "0.98"))
-        self.fixed_investment_amount = float(os.getenv("FIXED_INVESTMENT_AMOUNT", "50.0"))
-        self.min_profit_threshold = float(os.getenv("MIN_PROFIT_THRESHOLD", "0.02"))
-        self.min_usdc_balance = float(os.getenv("MIN_USDC_BALANCE", "100.0"))
-        self.opportunity_cooldown = float(os.getenv("OPPORTUNITY_COOLDOWN", "5.0"))
+        if self.market_mode == "btc_eth":
+            market_mode = f"Market Mode: BTC/ETH {self.btc_eth_duration_minutes}-minute markets ONLY"
+        else:
+            market_mode = f"Market Mode: Tag-based ({', '.join(self.target_tags)})"
         
-        # Validate trading parameters
-        if not 0.5 <= self.trigger_threshold <= 1.0:
-            raise ConfigError(
-                f"Invalid TRIGGER_THRESHOLD: {self.trigger_threshold}. "
-                "Must be between 0.5 and 1.0."
-            )
+        paper_file = (
+            f"\nPaper Trading File: {self.paper_trading_file}"
+            if self.paper_trading_mode
+            else ""
+        )
         
-        if self.fixed_investment_amount <= 0:
-            raise ConfigError(
-                f"Invalid FIXED_INVESTMENT_AMOUNT: {self.fixed_investment_amount}. "
-                "Must be greater than 0."
-            )
+        logger.info(
+            f"{'=' * 60}\n"
+            f"POLYMARKET ARBITRAGE BOT CONFIGURATION\n"
+            f"{'=' * 60}\n"
+            f"Signature Type: {self._get_signature_type_name()}\n"
+            f"{proxy}\n"
+            f"Trigger Threshold: {self.trigger_threshold} (YES + NO < {self.trigger_threshold})\n"
+            f"Investment Amount: ${self.fixed_investment_amount:.2f} per trade\n"
+            f"Min Profit Threshold: {self.min_profit_threshold * 100:.1f}%\n"
+            f"Opportunity Cooldown: {self.opportunity_cooldown}s\n"
+            f"Min USDC Balance: ${self.min_usdc_balance:.2f}\n"
+            f"{market_mode}\n"
+            f"Min Market Volume: ${self.min_market_volume:.2f}\n"
+            f"Min Liquidity: ${self.min_liquidity:.2f}\n"
+            f"Max WS Subscriptions: {self.max_ws_subscriptions} markets\n"
+            f"Rate Limit: {self.max_api_calls_per_minute} calls/minute\n"
+            f"Log Level: {self.log_level}\n"
+            f"Paper Trading Mode: {'ENABLED' if self.paper_trading_mode else 'DISABLED'}"
+            f"{paper_file}\n"
+            f"{'=' * 60}"
+        )
+    
+    def _get_signature_type_name(self) -> str:
+        """Get human-readable signature type name."""
+        signature_types = {
+            0: "EOA (Direct Wallet)",
+            1: "Polymarket Proxy (Email/Magic)",
+            2: "Polymarket Proxy (Browser Wallet)"
+        }
+        return signature_types.get(self.poly_signature_type, "Unknown")
+    
+    @property
+    def uses_proxy(self) -> bool:
+        """Check if configuration uses proxy wallet."""
+        return self.poly_signature_type in [1, 2]
+
+
+def load_config(env_file: str = ".env") -> Config:
+    """
+    Load configuration from environment file.
+    
+    Args:
+        env_file: Path to .env file (default: ".env")
+    
+    Returns:
+        Validated, immutable Config
+    
+    Raises:
+        ConfigError: If required configuration is missing or invalid
+    """
+    # Imported here so that importing config alone does not initialize loguru
+    from loguru import logger
+    
+    # Load environment variables
+    if not _load_env_file(env_file):
+        logger.warning(f"No {env_file} file found. Using environment variables.")
+    
+    # Snapshot the environment once; every setting below is a plain dict lookup
+    env = dict(os.environ)
+    
+    config = Config(
+        # Wallet Configuration
+        poly_private_key=_get_required(env, "POLY_PRIVATE_KEY"),
+        poly_proxy_address=env.get("POLY_PROXY_ADDRESS", ""),
+        poly_signature_type=_env_int(env, "POLY_SIGNATURE_TYPE", 1),
+        
+        # Trading Parameters
+        trigger_threshold=_env_float(env, "TRIGGER_THRESHOLD", 0.98),
+        fixed_investment_amount=_env_float(env, "FIXED_INVESTMENT_AMOUNT", 50.0),
+        min_profit_threshold=_env_float(env, "MIN_PROFIT_THRESHOLD", 0.02),
+        min_usdc_balance=_env_float(env, "MIN_USDC_BALANCE", 100.0),
+        opportunity_cooldown=_env_float(env, "OPPORTUNITY_COOLDOWN", 5.0),
         
         # Market Selection
-        self.market_mode = os.getenv("MARKET_MODE", "btc_eth").lower()
-        self.btc_eth_duration_minutes = int(os.getenv("BTC_ETH_DURATION_MINUTES", "15"))
-        self.target_tags = self._parse_tags(os.getenv("TARGET_TAGS", "crypto,politics"))
-        self.min_market_volume = float(os.getenv("MIN_MARKET_VOLUME", "1000.0"))
-        self.min_liquidity = float(os.getenv("MIN_LIQUIDITY", "500.0"))
+        market_mode=env.get("MARKET_MODE", "btc_eth").lower(),
+        btc_eth_duration_minutes=_env_int(env, "BTC_ETH_DURATION_MINUTES", 15),
+        target_tags=_parse_tags(env.get("TARGET_TAGS", "crypto,politics")),
+        min_market_volume=_env_float(env, "MIN_MARKET_VOLUME", 1000.0),
+        min_liquidity=_env_float(env, "MIN_LIQUIDITY", 500.0),
         
         # Network Endpoints
-        self.polygon_rpc_url = os.getenv(
+        polygon_rpc_url=env.get(
             "POLYGON_RPC_URL",
             "https://polygon-rpc.com/"
-        )
-        self.clob_api_url = os.getenv(
+        ),
+        clob_api_url=env.get(
             "CLOB_API_URL",
             "https://clob.polymarket.com"
-        )
-        self.gamma_api_url = os.getenv(
+        ),
+        gamma_api_url=env.get(
             "GAMMA_API_URL",
             "https://gamma-api.polymarket.com"
-        )
+        ),
         # WebSocket URL - Market Channel requires /ws/market path
-        self.wss_url = os.getenv(
+        wss_url=env.get(
             "WSS_URL",
             "wss://ws-subscriptions-clob.polymarket.com/ws/market"
-        )
+        ),
         
         # Rate Limiting
-        self.max_api_calls_per_minute = int(os.getenv("MAX_API_CALLS_PER_MINUTE", "80"))
-        self.max_ws_subscriptions = int(os.getenv("MAX_WS_SUBSCRIPTIONS", "50"))
+        max_api_calls_per_minute=_env_int(env, "MAX_API_CALLS_PER_MINUTE", 80),
+        max_ws_subscriptions=_env_int(env, "MAX_WS_SUBSCRIPTIONS", 50),
+        
+        # Order Execution
+        clob_worker_threads=_env_int(env, "CLOB_WORKER_THREADS", 8),
+        # Reuse signed orders for identical legs (off by default: reposting a
+        # signed order reuses its salt, which the CLOB may reject as a duplicate)
+        enable_order_signature_cache=env.get("ENABLE_ORDER_SIGNATURE_CACHE", "false").lower() == "true",
+        order_signature_cache_ttl=_env_float(env, "ORDER_SIGNATURE_CACHE_TTL", 2.0),
         
         # Logging
-        self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        self.log_file = os.getenv("LOG_FILE", "logs/arbitrage.log")
+        log_level=env.get("LOG_LEVEL", "INFO").upper(),
+        log_file=env.get("LOG_FILE", "logs/arbitrage.log"),
         
         # Paper Trading Mode
-        self.paper_trading_mode = os.getenv("PAPER_TRADING_MODE", "false").lower() == "true"
-        self.paper_trading_file = os.getenv("PAPER_TRADING_FILE", "paper_trades.csv")
+        paper_trading_mode=env.get("PAPER_TRADING_MODE", "false").lower() == "true",
+        paper_trading_file=env.get("PAPER_TRADING_FILE", "paper_trades.csv"),
         
         # Market Maker Settings
-        self.mm_paper_trading = os.getenv("MM_PAPER_TRADING", "true").lower() == "true"
-        self.mm_paper_trading_file = os.getenv("MM_PAPER_TRADING_FILE", "mm_paper_trades.csv")
-        self.mm_target_spread = float(os.getenv("MM_TARGET_SPREAD", "0.02"))
-        self.mm_skew_factor = float(os.getenv("MM_SKEW_FACTOR", "0.0001"))
-        self.mm_max_inventory = int(os.getenv("MM_MAX_INVENTORY", "1000"))
-        self.mm_quote_update_interval = float(os.getenv("MM_QUOTE_UPDATE_INTERVAL", "5.0"))
-        
-        # Polygon chain ID (fixed for Polygon mainnet)
-        self.chain_id = 137
-        
-        # Polygon USDC contract address (6 decimals)
-        self.usdc_address = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-        
-        # CTF Exchange contract address (for monitoring)
-        self.ctf_exchange_address = "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E"
-        
-        logger.info("Configuration loaded successfully")
-        self._log_config_summary()
+        mm_paper_trading=env.get("MM_PAPER_TRADING", "true").lower() == "true",
+        mm_paper_trading_file=env.get("MM_PAPER_TRADING_FILE", "mm_paper_trades.csv"),
+        mm_target_spread=_env_float(env, "MM_TARGET_SPREAD", 0.02),
+        mm_skew_factor=_env_float(env, "MM_SKEW_FACTOR", 0.0001),
+        mm_max_inventory=_env_int(env, "MM_MAX_INVENTORY", 1000),
+        mm_quote_update_interval=_env_float(env, "MM_QUOTE_UPDATE_INTERVAL", 5.0),
+    )
     
-    def _get_required(self, key: str) -> str:
-        """
-        Get required environment variable.
-        
-        Args:
-            key: Environment variable name
-        
-        Returns:
-            Environment variable value
-        
-        Raises:
-            ConfigError: If environment variable is not set
-        """
-        value = os.getenv(key)
-        if not value:
-            raise ConfigError(
-                f"Required environment variable {key} is not set. "
-                f"Please check your .env file."
-            )
-        return value
-    
-    def _parse_tags(self, tags_str: str) -> List[str]:
-        """
-        Parse comma-separated tags string.
-        
-        Args:
-            tags_str: Comma-separated tags (e.g., "crypto,politics")
-        
-        Returns:
-            List of tag strings
-        """
-        return [tag.strip().lower() for tag in tags_str.split(",") if tag.strip()]
-    
-    def _log_config_summary(self):
-        """Log configuration summary (without sensitive data)."""
-        logger.info("=" * 60)
-        logger.info("POLYMARKET ARBITRAGE BOT CONFIGURATION")
-        logger.info("=" * 60)
-        logger.info(f"Signature Type: {self._get_signature_type_name()}")
-        logger.info(f"Proxy Address: {self.poly_proxy_address[:10]}..." if self.poly_proxy_address else "Proxy Address: Not set (EOA mode)")
-        logger.info(f"Trigger Threshold: {self.trigger_threshold} (YES + NO < {self.trigger_threshold})")
-        logger.info(f"Investment Amount: ${self.fixed_investment_amount:.2f} per trade")
-        logger.info(f"Min Profit Threshold: {self.min_profit_threshold * 100:.1f}%")
-        logger.info(f"Opportunity Cooldown: {self.opportunity_cooldown}s")
-        logger.info(f"Min USDC Balance: ${self.min_usdc_balance:.2f}")
-        
-        if self.market_mode == "btc_eth":
-            logger.info(f"Market Mode: BTC/ETH {self.btc_eth_duration_minutes}-minute markets ONLY")
-        else:
-            logger.info(f"Market Mode: Tag-based ({', '.join(self.target_tags)})")
-        
-        logger.info(f"Min Market Volume: ${self.min_market_volume:.2f}")
-        logger.info(f"Min Liquidity: ${self.min_liquidity:.2f}")
-        logger.info(f"Max WS Subscriptions: {self.max_ws_subscriptions} markets")
-        logger.info(f"Rate Limit: {self.max_api_calls_per_minute} calls/minute")
-        logger.info(f"Log Level: {self.log_level}")
-        logger.info(f"Paper Trading Mode: {'ENABLED' if self.paper_trading_mode else 'DISABLED'}")
-        if self.paper_trading_mode:
-            logger.info(f"Paper Trading File: {self.paper_trading_file}")
-        logger.info("=" * 60)
-    
-    def _get_signature_type_name(self) -> str:
-        """Get human-readable signature type name."""
-        signature_types = {
-            0: "EOA (Direct Wallet)",
-            1: "Polymarket Proxy (Email/Magic)",
-            2: "Polymarket Proxy (Browser Wallet)"
-        }
-        return signature_types.get(self.poly_signature_type, "Unknown")
-    
-    @property
-    def uses_proxy(self) -> bool:
-        """Check if configuration uses proxy wallet."""
-        return self.poly_signature_type in [1, 2]
+    logger.info("Configuration loaded successfully")
+    config._log_config_summary()
+    return config
 
 
-# Global config instance (initialized when imported)
-_config: Optional[Config] = None
+# .env file used by get_config on a cache miss; set by init_config
+_env_file: str = ".env"
 
 
+@cache
 def get_config() -> Config:
     """
     Get global configuration instance (singleton pattern).
     
+    Loaded on first call and cached; init_config() replaces it.
+    
     Returns:
         Config instance
     
     Raises:
-        ConfigError: If configuration is not initialized
+        ConfigError: If configuration is invalid
     """
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return load_config(_env_file)
 
 
 def init_config(env_file: str = ".env") -> Config:
@@ -230,15 +396,16 @@ def init_config(env_file: str = ".env") -> Config:
     Returns:
         Config instance
     """
-    global _config
-    _config = Config(env_file)
-    return _config
+    global _env_file
+    _env_file = env_file
+    get_config.cache_clear()
+    return get_config()
 
 
 if __name__ == "__main__":
     # Test configuration loading
     try:
-        config = Config()
+        config = load_config()
         print("✓ Configuration loaded successfully!")
         print(f"  Chain ID: {config.chain_id}")
         print(f"  Signature Type: {config._get_signature_type_name()}")
@@ -0,0 +1,118 @@
+"""
+Background CSV writer shared by the market maker loggers.
+Rows are appended from the hot path and written to disk in batches by a
+dedicated thread.
+"""
+
+import atexit
+import csv
+import io
+import os
+import threading
+from collections import deque
+from typing import Any, Deque, List, Sequence
+from loguru import logger
+
+
+# Rows written per batch and the longest a row waits before its batch is written
+CSV_BATCH_SIZE = 1024
+CSV_WRITE_INTERVAL = 0.1  # seconds
+
+
+class BackgroundCsvWriter:
+    """
+    Append-only CSV file written from a background thread.
+    
+    append() only pushes the row onto a deque (thread-safe, no lock), so
+    callers on the orderbook path never wait for disk. The writer thread
+    wakes every CSV_WRITE_INTERVAL seconds, formats up to CSV_BATCH_SIZE rows
+    at a time into one string and writes it with a single call, then
+    fsyncs once per wake-up instead of once per row.
+    
+    Call flush() before reading the file back and close() when done; close
+    also runs at interpreter exit so queued rows are not lost.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = CSV_BATCH_SIZE,
+        interval: float = CSV_WRITE_INTERVAL,
+    ):
+        """
+        Open the CSV file for appending and start the writer thread.
+        
+        Args:
+            path: CSV file path (header handling is up to the caller)
+            batch_size: Maximum rows formatted per write call
+            interval: Seconds between writer wake-ups
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.interval = interval
+        
+        self._rows: Deque[Sequence[Any]] = deque()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        
+        self._thread = threading.Thread(target=self._run, name=f"csv-writer:{path}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def append(self, row: Sequence[Any]):
+        """Queue a row for writing."""
+        self._rows.append(row)
+    
+    def flush(self):
+        """Write every queued row now and fsync the file."""
+        with self._write_lock:
+            if self._file.closed:
+                return
+            written = self._write_pending()
+            if written:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+    
+    def close(self):
+        """Stop the writer thread, write the remaining rows and close the file."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        with self._write_lock:
+            self._file.close()
+        atexit.unregister(self.close)
+    
+    def _run(self):
+        """Writer thread: drain queued rows every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to write CSV rows to {self.path}: {e}")
+    
+    def _write_pending(self) -> int:
+        """
+        Format and write queued rows in batches (caller holds the write lock).
+        
+        Returns:
+            Number of rows written
+        """
+        rows = self._rows
+        total = 0
+        while rows:
+            batch: List[Sequence[Any]] = []
+            popleft = rows.popleft
+            try:
+                for _ in range(self.batch_size):
+                    batch.append(popleft())
+            except IndexError:
+                pass  # Deque drained
+            
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(batch)
+            self._file.write(buffer.getvalue())
+            total += len(batch)
+        return total
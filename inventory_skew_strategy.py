@@ -13,12 +13,130 @@ Core Logic:
 Author: Senior Quantitative Developer
 """
 
-from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+import numpy as np
 from loguru import logger
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; the kernel runs as plain Python
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Polymarket price constraints
+MIN_PRICE = 0.01  # Minimum valid price (1 cent)
+MAX_PRICE = 0.99  # Maximum valid price (99 cents)
+
+# Parameter constraints checked in order by InventorySkewStrategy:
+# (predicate on the strategy, ValueError message formatted with s=strategy)
+_STRATEGY_RULES = (
+    (lambda s: s.target_spread > 0, "target_spread must be positive, got {s.target_spread}"),
+    (lambda s: s.skew_factor > 0, "skew_factor must be positive, got {s.skew_factor}"),
+    (lambda s: s.max_inventory > 0, "max_inventory must be positive, got {s.max_inventory}"),
+    (lambda s: 0 < s.min_spread < 1, "min_spread must be in (0, 1), got {s.min_spread}"),
+    (
+        lambda s: s.min_spread < s.max_spread < 1,
+        "max_spread must be in (min_spread, 1), got {s.max_spread}",
+    ),
+    (
+        lambda s: s.target_spread >= s.min_spread,
+        "target_spread ({s.target_spread}) cannot be less than min_spread ({s.min_spread})",
+    ),
+    (
+        lambda s: s.target_spread <= s.max_spread,
+        "target_spread ({s.target_spread}) cannot exceed max_spread ({s.max_spread})",
+    ),
+)
+
+# Multi-line debug record for _log_quote_calculation, filled by loguru on demand
+_QUOTE_LOG_TEMPLATE = "\n".join([
+    "=" * 60,
+    "QUOTE CALCULATION",
+    "=" * 60,
+    "Market Data:",
+    "  Best Bid: ${:.4f}",
+    "  Best Ask: ${:.4f}",
+    "  Mid Price: ${:.4f}",
+    "  Market Spread: ${:.4f} ({:.2f}%)",
+    "",
+    "Inventory:",
+    "  Current: {:+d} tokens",
+    "  Max Allowed: ±{}",
+    "  Utilization: {:.1f}%",
+    "  Risk Adjustment: ${:+.6f}",
+    "",
+    "Calculated Quotes:",
+    "  Fair Value: ${:.4f}",
+    "  Our Bid: ${:.4f}",
+    "  Our Ask: ${:.4f}",
+    "  Our Spread: ${:.4f} ({:.2f}%)",
+    "",
+    "Risk Controls:",
+    "  Stop Buying: {}",
+    "  Stop Selling: {}",
+    "=" * 60,
+])
+
 
-@dataclass
+# No fastmath: results must round exactly like the pure-Python model
+@njit("Tuple((f8, f8, f8, f8, f8, b1))(f8, f8, f8, f8, f8, f8)", cache=True)
+def _quote_math(best_bid, best_ask, current_inventory, skew, half_spread, half_min_spread):
+    """
+    Compiled numeric core of calculate_quotes (Steps 1-5 of the model).
+    
+    Returns:
+        Tuple of (mid_price, inventory_adjustment, fair_value, bid_price,
+        ask_price, ok); ok is False when clamping leaves no feasible
+        bid < ask even at the minimum spread. Prices are not yet rounded.
+    """
+    mid_price = (best_bid + best_ask) / 2.0
+    inventory_adjustment = current_inventory * skew
+    # Deliberately not fused (math.fma / fastmath contraction): the product is
+    # returned anyway, and a single-rounding FMA can move fair_value by one ulp,
+    # which flips penny ties against calculate_quotes_batch and the no-numba path.
+    fair_value = mid_price - inventory_adjustment
+    
+    raw_bid = fair_value - half_spread
+    raw_ask = fair_value + half_spread
+    bid_price = min(max(raw_bid, MIN_PRICE), MAX_PRICE)
+    ask_price = min(max(raw_ask, MIN_PRICE), MAX_PRICE)
+    
+    # Ensure bid < ask (can be violated by clamping)
+    if bid_price >= ask_price:
+        mid = (bid_price + ask_price) / 2.0
+        bid_price = max(MIN_PRICE, mid - half_min_spread)
+        ask_price = min(MAX_PRICE, mid + half_min_spread)
+        if bid_price >= ask_price:
+            return mid_price, inventory_adjustment, fair_value, bid_price, ask_price, False
+    
+    return mid_price, inventory_adjustment, fair_value, bid_price, ask_price, True
+
+
+def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    np.round that agrees with the built-in round() used by calculate_quotes.
+    
+    np.round scales before rounding, which can turn a value just below a
+    half (e.g. 0.59499999...) into an exact tie and round it up; elements
+    that land near a tie are re-rounded with round().
+    """
+    out = np.round(values, ndigits)
+    scaled = values * 10.0 ** ndigits
+    near_tie = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    if near_tie.size:
+        out[near_tie] = [round(v, ndigits) for v in values[near_tie].tolist()]
+    return out
+
+
+@dataclass(slots=True)
 class QuoteResult:
     """Result of quote calculation."""
     bid_price: float
@@ -27,9 +145,12 @@ class QuoteResult:
     inventory_adjustment: float
     should_stop_buying: bool
     should_stop_selling: bool
+    mid_price: float
+    spread: float
     reason: Optional[str] = None
 
 
+@dataclass(slots=True)
 class InventorySkewStrategy:
     """
     Linear Inventory Skew Market Making Strategy.
@@ -45,6 +166,18 @@ class InventorySkewStrategy:
         4. My_Bid_Price = Fair_Value - (Spread / 2)
         5. My_Ask_Price = Fair_Value + (Spread / 2)
     
+    Args:
+        target_spread: Target spread between bid and ask (e.g., 0.02 = 2 cents profit)
+        skew_factor: How much to adjust price per token held (e.g., 0.0001)
+                    Higher = more aggressive inventory management
+        max_inventory: Maximum inventory position (positive or negative)
+                      Stop quoting when |inventory| exceeds this
+        min_spread: Minimum allowed spread (default: 0.01 = 1 cent)
+        max_spread: Maximum allowed spread (default: 0.10 = 10 cents)
+    
+    Raises:
+        ValueError: If parameters are invalid
+    
     Example:
         >>> strategy = InventorySkewStrategy(
         ...     target_spread=0.02,
@@ -56,57 +189,30 @@ class InventorySkewStrategy:
         ...     best_ask=0.50,
         ...     current_inventory=500
         ... )
-        >>> print(f"Bid: {quotes['bid_price']}, Ask: {quotes['ask_price']}")
+        >>> print(f"Bid: {quotes.bid_price}, Ask: {quotes.ask_price}")
     """
     
-    # Polymarket price constraints
-    MIN_PRICE = 0.01  # Minimum valid price (1 cent)
-    MAX_PRICE = 0.99  # Maximum valid price (99 cents)
+    target_spread: float
+    skew_factor: float
+    max_inventory: int
+    min_spread: float = 0.01
+    max_spread: float = 0.10
     
-    def __init__(
-        self,
-        target_spread: float,
-        skew_factor: float,
-        max_inventory: int,
-        min_spread: float = 0.01,
-        max_spread: float = 0.10
-    ):
-        """
-        Initialize the Inventory Skew Strategy.
-        
-        Args:
-            target_spread: Target spread between bid and ask (e.g., 0.02 = 2 cents profit)
-            skew_factor: How much to adjust price per token held (e.g., 0.0001)
-                        Higher = more aggressive inventory management
-            max_inventory: Maximum inventory position (positive or negative)
-                          Stop quoting when |inventory| exceeds this
-            min_spread: Minimum allowed spread (default: 0.01 = 1 cent)
-            max_spread: Maximum allowed spread (default: 0.10 = 10 cents)
-        
-        Raises:
-            ValueError: If parameters are invalid
-        """
+    # calculate_quotes specialized for the current parameters (see _make_quote_fn)
+    _quote_fn: Callable = field(init=False, repr=False, compare=False)
+    # 1 / max_inventory for get_strategy_stats
+    _inv_max_inventory: float = field(init=False, repr=False, compare=False)
+    
+    # Kept for external references; methods use the module constants
+    MIN_PRICE = MIN_PRICE
+    MAX_PRICE = MAX_PRICE
+    
+    def __post_init__(self):
+        """Validate parameters and log the strategy settings."""
         # Validate inputs
-        if target_spread <= 0:
-            raise ValueError(f"target_spread must be positive, got {target_spread}")
-        if skew_factor <= 0:
-            raise ValueError(f"skew_factor must be positive, got {skew_factor}")
-        if max_inventory <= 0:
-            raise ValueError(f"max_inventory must be positive, got {max_inventory}")
-        if min_spread <= 0 or min_spread >= 1:
-            raise ValueError(f"min_spread must be in (0, 1), got {min_spread}")
-        if max_spread <= min_spread or max_spread >= 1:
-            raise ValueError(f"max_spread must be in (min_spread, 1), got {max_spread}")
-        if target_spread < min_spread:
-            raise ValueError(f"target_spread ({target_spread}) cannot be less than min_spread ({min_spread})")
-        if target_spread > max_spread:
-            raise ValueError(f"target_spread ({target_spread}) cannot exceed max_spread ({max_spread})")
-        
-        self.target_spread = target_spread
-        self.skew_factor = skew_factor
-        self.max_inventory = max_inventory
-        self.min_spread = min_spread
-        self.max_spread = max_spread
+        for is_valid, message in _STRATEGY_RULES:
+            if not is_valid(self):
+                raise ValueError(message.format(s=self))
         
         logger.info("=" * 60)
         logger.info("INVENTORY SKEW STRATEGY INITIALIZED")
@@ -116,13 +222,16 @@ class InventorySkewStrategy:
         logger.info(f"Max Inventory: ±{self.max_inventory} tokens")
         logger.info(f"Spread Range: {self.min_spread * 100:.1f}% - {self.max_spread * 100:.1f}%")
         logger.info("=" * 60)
+        
+        self._inv_max_inventory = 1.0 / self.max_inventory
+        self._quote_fn = self._make_quote_fn()
     
     def calculate_quotes(
         self,
         best_bid: float,
         best_ask: float,
         current_inventory: int
-    ) -> Dict:
+    ) -> QuoteResult:
         """
         Calculate bid and ask quotes based on market state and inventory position.
         
@@ -136,91 +245,168 @@ class InventorySkewStrategy:
                               Negative = Short YES tokens (Long NO)
         
         Returns:
-            dict: {
-                "bid_price": float,              # Our bid quote (rounded to 2 decimals)
-                "ask_price": float,              # Our ask quote (rounded to 2 decimals)
-                "fair_value": float,             # Calculated fair value
-                "inventory_adjustment": float,   # Price adjustment due to inventory
-                "should_stop_buying": bool,      # True if inventory too high
-                "should_stop_selling": bool,     # True if inventory too low (short)
-                "mid_price": float,              # Market mid price
-                "spread": float,                 # Actual spread used
-                "reason": str or None            # Reason if quotes are invalid
-            }
+            QuoteResult with:
+                bid_price: Our bid quote (rounded to 2 decimals)
+                ask_price: Our ask quote (rounded to 2 decimals)
+                fair_value: Calculated fair value
+                inventory_adjustment: Price adjustment due to inventory
+                should_stop_buying: True if inventory too high
+                should_stop_selling: True if inventory too low (short)
+                mid_price: Market mid price
+                spread: Actual spread used
+                reason: Reason if quotes are invalid, else None
         
         Example:
             >>> result = strategy.calculate_quotes(0.48, 0.50, 500)
-            >>> if not result["should_stop_buying"]:
-            ...     place_bid_order(result["bid_price"])
-            >>> if not result["should_stop_selling"]:
-            ...     place_ask_order(result["ask_price"])
+            >>> if not result.should_stop_buying:
+            ...     place_bid_order(result.bid_price)
+            >>> if not result.should_stop_selling:
+            ...     place_ask_order(result.ask_price)
         """
-        # Input validation
-        validation_result = self._validate_inputs(best_bid, best_ask, current_inventory)
-        if validation_result:
-            return validation_result
+        return self._quote_fn(best_bid, best_ask, current_inventory)
+    
+    def _make_quote_fn(self) -> Callable:
+        """
+        Build calculate_quotes specialized for the current parameters.
         
-        # Step 1: Calculate Mid Price
-        mid_price = (best_bid + best_ask) / 2.0
+        The spread, skew and inventory limit are bound as closure constants
+        instead of being read from self on every call. Rebuilt by
+        __post_init__ and update_parameters; assigning fields directly
+        bypasses this, so use update_parameters.
         
-        # Step 2: Calculate Inventory Risk Adjustment
-        # Positive inventory (Long) → Negative adjustment → Lower fair value → Encourage selling
-        # Negative inventory (Short) → Positive adjustment → Higher fair value → Encourage buying
-        inventory_adjustment = current_inventory * self.skew_factor
+        Returns:
+            Function (best_bid, best_ask, current_inventory) -> QuoteResult
+        """
+        skew = self.skew_factor
+        half_spread = self.target_spread / 2.0
+        half_min_spread = self.min_spread / 2.0
+        max_inv = self.max_inventory
+        validate_inputs = self._validate_inputs
+        invalid_quote = self._create_invalid_quote_response
+        log_quote = self._log_quote_calculation
+        round_ = round  # closure cell instead of a builtins lookup per call
+        
+        def quote(best_bid: float, best_ask: float, current_inventory: int) -> QuoteResult:
+            # Input validation
+            validation_result = validate_inputs(best_bid, best_ask, current_inventory)
+            if validation_result:
+                return validation_result
+            
+            # Steps 1-5: mid price, inventory risk adjustment, fair value, bid/ask
+            # and price constraints, in one compiled call.
+            # Positive inventory (Long) → Negative adjustment → Lower fair value → Encourage selling
+            # Negative inventory (Short) → Positive adjustment → Higher fair value → Encourage buying
+            mid_price, inventory_adjustment, fair_value, bid_price, ask_price, ok = _quote_math(
+                best_bid,
+                best_ask,
+                current_inventory,
+                skew,
+                half_spread,
+                half_min_spread,
+            )
+            
+            # If still crossed after the minimum-spread adjustment, quotes are not feasible
+            if not ok:
+                return invalid_quote(
+                    mid_price, inventory_adjustment, current_inventory,
+                    "Bid >= Ask after constraint adjustments"
+                )
+            
+            # Step 6: Round to 2 decimal places (penny precision)
+            bid_price = round_(bid_price, 2)
+            ask_price = round_(ask_price, 2)
+            fair_value = round_(fair_value, 4)
+            actual_spread = round_(ask_price - bid_price, 4)
+            
+            # Step 7: Check Inventory Limits
+            # max_inv > 0, so the sign is implied by which bound is crossed
+            should_stop_buying = current_inventory >= max_inv
+            should_stop_selling = current_inventory <= -max_inv
+            
+            # Log quote calculation
+            log_quote(
+                best_bid, best_ask, mid_price, current_inventory,
+                inventory_adjustment, fair_value, bid_price, ask_price,
+                should_stop_buying, should_stop_selling
+            )
+            
+            return QuoteResult(
+                bid_price,
+                ask_price,
+                fair_value,
+                inventory_adjustment,
+                should_stop_buying,
+                should_stop_selling,
+                mid_price,
+                actual_spread,
+            )
         
-        # Step 3: Calculate Fair Value
-        fair_value = mid_price - inventory_adjustment
+        return quote
+    
+    def calculate_quotes_batch(
+        self,
+        best_bids: np.ndarray,
+        best_asks: np.ndarray,
+        inventories: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_quotes for many markets at once.
+        
+        Applies the same model, clamping, rounding and inventory limits as
+        calculate_quotes with NumPy array operations instead of a Python call
+        per market. Rows that fail validation (or have no feasible quotes)
+        get the same zeroed prices and stop flags as the scalar invalid
+        response; no per-row warnings are logged.
         
-        # Step 4: Calculate Bid and Ask Prices
+        Args:
+            best_bids: Market best bid per market
+            best_asks: Market best ask per market
+            inventories: Net inventory position per market
+        
+        Returns:
+            Dict of arrays keyed like calculate_quotes, with a boolean
+            "valid" mask in place of "reason"
+        """
+        bids = np.asarray(best_bids, dtype=np.float64)
+        asks = np.asarray(best_asks, dtype=np.float64)
+        inventory = np.asarray(inventories, dtype=np.float64)
         half_spread = self.target_spread / 2.0
-        raw_bid = fair_value - half_spread
-        raw_ask = fair_value + half_spread
+        max_inv = self.max_inventory
         
-        # Step 5: Apply Price Constraints (0 < price < 1)
-        bid_price = self._clamp_price(raw_bid)
-        ask_price = self._clamp_price(raw_ask)
+        # Input validation (NaN compares False, so missing prices are invalid)
+        inputs_ok = (bids > 0) & (bids < 1) & (asks > 0) & (asks < 1) & (bids < asks)
         
-        # Ensure bid < ask (can be violated by clamping)
-        if bid_price >= ask_price:
-            # Adjust to maintain minimum spread
+        mid_price = (bids + asks) / 2.0
+        inventory_adjustment = inventory * self.skew_factor
+        fair_value = mid_price - inventory_adjustment
+        bid_price = np.clip(fair_value - half_spread, MIN_PRICE, MAX_PRICE)
+        ask_price = np.clip(fair_value + half_spread, MIN_PRICE, MAX_PRICE)
+        
+        # Re-center quotes crossed by clamping on the minimum spread
+        crossed = bid_price >= ask_price
+        if crossed.any():
             mid = (bid_price + ask_price) / 2.0
-            bid_price = max(self.MIN_PRICE, mid - self.min_spread / 2.0)
-            ask_price = min(self.MAX_PRICE, mid + self.min_spread / 2.0)
-            
-            # If still invalid, quotes are not feasible
-            if bid_price >= ask_price:
-                return self._create_invalid_quote_response(
-                    mid_price, inventory_adjustment, current_inventory,
-                    "Bid >= Ask after constraint adjustments"
-                )
+            half_min = self.min_spread / 2.0
+            bid_price = np.where(crossed, np.maximum(MIN_PRICE, mid - half_min), bid_price)
+            ask_price = np.where(crossed, np.minimum(MAX_PRICE, mid + half_min), ask_price)
+        valid = inputs_ok & (bid_price < ask_price)
         
-        # Step 6: Round to 2 decimal places (penny precision)
-        bid_price = round(bid_price, 2)
-        ask_price = round(ask_price, 2)
-        fair_value = round(fair_value, 4)
-        actual_spread = round(ask_price - bid_price, 4)
-        
-        # Step 7: Check Inventory Limits
-        should_stop_buying = abs(current_inventory) >= self.max_inventory and current_inventory > 0
-        should_stop_selling = abs(current_inventory) >= self.max_inventory and current_inventory < 0
-        
-        # Log quote calculation
-        self._log_quote_calculation(
-            best_bid, best_ask, mid_price, current_inventory,
-            inventory_adjustment, fair_value, bid_price, ask_price,
-            should_stop_buying, should_stop_selling
-        )
+        # Round to penny precision
+        bid_price = _round_array(bid_price, 2)
+        ask_price = _round_array(ask_price, 2)
+        spread = _round_array(ask_price - bid_price, 4)
+        fair_value = _round_array(fair_value, 4)
         
         return {
-            "bid_price": bid_price,
-            "ask_price": ask_price,
-            "fair_value": fair_value,
-            "inventory_adjustment": inventory_adjustment,
-            "should_stop_buying": should_stop_buying,
-            "should_stop_selling": should_stop_selling,
-            "mid_price": mid_price,
-            "spread": actual_spread,
-            "reason": None
+            "bid_price": np.where(valid, bid_price, 0.0),
+            "ask_price": np.where(valid, ask_price, 0.0),
+            "fair_value": np.where(valid, fair_value, 0.0),
+            "inventory_adjustment": np.where(inputs_ok, inventory_adjustment, 0.0),
+            "should_stop_buying": ~valid | (inventory >= max_inv),
+            "should_stop_selling": ~valid | (inventory <= -max_inv),
+            "mid_price": np.where(inputs_ok, mid_price, 0.0),
+            "spread": np.where(valid, spread, 0.0),
+            "valid": valid,
         }
     
     def _validate_inputs(
@@ -228,12 +414,33 @@ class InventorySkewStrategy:
         best_bid: float,
         best_ask: float,
         current_inventory: int
-    ) -> Optional[Dict]:
+    ) -> Optional[QuoteResult]:
         """
         Validate input parameters.
         
         Returns:
-            Dict with error response if validation fails, None otherwise
+            QuoteResult with error response if validation fails, None otherwise
+        """
+        # Fast path for well-formed books: range, bid < ask and a normal spread
+        try:
+            if 0.0 < best_bid < best_ask < 1.0 and best_ask - best_bid <= 0.5:
+                return None
+        except TypeError:
+            pass  # None prices; reported below
+        
+        return self._validate_inputs_slow(best_bid, best_ask, current_inventory)
+    
+    def _validate_inputs_slow(
+        self,
+        best_bid: float,
+        best_ask: float,
+        current_inventory: int
+    ) -> Optional[QuoteResult]:
+        """
+        Run each input check separately to build a specific error response.
+        
+        Returns:
+            QuoteResult with error response if validation fails, None otherwise
         """
         # Check for None/NaN values
         if best_bid is None or best_ask is None:
@@ -272,25 +479,13 @@ class InventorySkewStrategy:
         
         return None
     
-    def _clamp_price(self, price: float) -> float:
-        """
-        Clamp price to valid Polymarket range (0.01 to 0.99).
-        
-        Args:
-            price: Raw calculated price
-        
-        Returns:
-            Clamped price within valid range
-        """
-        return max(self.MIN_PRICE, min(self.MAX_PRICE, price))
-    
     def _create_invalid_quote_response(
         self,
         mid_price: float,
         inventory_adjustment: float,
         current_inventory: int,
         reason: str
-    ) -> Dict:
+    ) -> QuoteResult:
         """
         Create response for invalid quote scenarios.
         
@@ -301,21 +496,21 @@ class InventorySkewStrategy:
             reason: Reason why quotes are invalid
         
         Returns:
-            Dict with invalid quote data
+            QuoteResult with zero prices and both sides stopped
         """
         logger.warning(f"⚠️ Invalid Quote: {reason}")
         
-        return {
-            "bid_price": 0.0,
-            "ask_price": 0.0,
-            "fair_value": 0.0,
-            "inventory_adjustment": inventory_adjustment,
-            "should_stop_buying": True,
-            "should_stop_selling": True,
-            "mid_price": mid_price,
-            "spread": 0.0,
-            "reason": reason
-        }
+        return QuoteResult(
+            bid_price=0.0,
+            ask_price=0.0,
+            fair_value=0.0,
+            inventory_adjustment=inventory_adjustment,
+            should_stop_buying=True,
+            should_stop_selling=True,
+            mid_price=mid_price,
+            spread=0.0,
+            reason=reason,
+        )
     
     def _log_quote_calculation(
         self,
@@ -330,32 +525,31 @@ class InventorySkewStrategy:
         should_stop_buying: bool,
         should_stop_selling: bool
     ):
-        """Log detailed quote calculation for debugging and monitoring."""
-        logger.debug("=" * 60)
-        logger.debug("QUOTE CALCULATION")
-        logger.debug("=" * 60)
-        logger.debug(f"Market Data:")
-        logger.debug(f"  Best Bid: ${best_bid:.4f}")
-        logger.debug(f"  Best Ask: ${best_ask:.4f}")
-        logger.debug(f"  Mid Price: ${mid_price:.4f}")
-        logger.debug(f"  Market Spread: ${best_ask - best_bid:.4f} ({(best_ask - best_bid) * 100:.2f}%)")
-        logger.debug(f"")
-        logger.debug(f"Inventory:")
-        logger.debug(f"  Current: {current_inventory:+d} tokens")
-        logger.debug(f"  Max Allowed: ±{self.max_inventory}")
-        logger.debug(f"  Utilization: {abs(current_inventory) / self.max_inventory * 100:.1f}%")
-        logger.debug(f"  Risk Adjustment: ${inventory_adjustment:+.6f}")
-        logger.debug(f"")
-        logger.debug(f"Calculated Quotes:")
-        logger.debug(f"  Fair Value: ${fair_value:.4f}")
-        logger.debug(f"  Our Bid: ${bid_price:.4f}")
-        logger.debug(f"  Our Ask: ${ask_price:.4f}")
-        logger.debug(f"  Our Spread: ${ask_price - bid_price:.4f} ({(ask_price - bid_price) * 100:.2f}%)")
-        logger.debug(f"")
-        logger.debug(f"Risk Controls:")
-        logger.debug(f"  Stop Buying: {should_stop_buying}")
-        logger.debug(f"  Stop Selling: {should_stop_selling}")
-        logger.debug("=" * 60)
+        """
+        Log detailed quote calculation for debugging and monitoring.
+        
+        Emitted as one record with deferred formatting, so nothing is
+        formatted unless DEBUG is enabled.
+        """
+        logger.debug(
+            _QUOTE_LOG_TEMPLATE,
+            best_bid,
+            best_ask,
+            mid_price,
+            best_ask - best_bid,
+            (best_ask - best_bid) * 100,
+            current_inventory,
+            self.max_inventory,
+            abs(current_inventory) / self.max_inventory * 100,
+            inventory_adjustment,
+            fair_value,
+            bid_price,
+            ask_price,
+            ask_price - bid_price,
+            (ask_price - bid_price) * 100,
+            should_stop_buying,
+            should_stop_selling,
+        )
     
     def get_strategy_stats(self, current_inventory: int) -> Dict:
         """
@@ -367,7 +561,7 @@ class InventorySkewStrategy:
         Returns:
             Dict with strategy statistics
         """
-        inventory_utilization = abs(current_inventory) / self.max_inventory
+        inventory_utilization = abs(current_inventory) * self._inv_max_inventory
         max_price_skew = self.max_inventory * self.skew_factor
         
         return {
@@ -416,7 +610,10 @@ class InventorySkewStrategy:
                 raise ValueError(f"Invalid max_inventory: {max_inventory}")
             old_max = self.max_inventory
             self.max_inventory = max_inventory
+            self._inv_max_inventory = 1.0 / max_inventory
             logger.info(f"Updated max_inventory: ±{old_max} → ±{max_inventory}")
+        
+        self._quote_fn = self._make_quote_fn()
 
 
 # Example usage and testing
@@ -452,19 +649,19 @@ if __name__ == "__main__":
         
         result = strategy.calculate_quotes(best_bid, best_ask, inventory)
         
-        if result["reason"]:
-            print(f"   [X] Invalid: {result['reason']}")
+        if result.reason:
+            print(f"   [X] Invalid: {result.reason}")
         else:
             print(f"   [OK] Valid Quotes:")
-            print(f"      Fair Value: ${result['fair_value']:.4f}")
-            print(f"      Our Bid: ${result['bid_price']:.2f}")
-            print(f"      Our Ask: ${result['ask_price']:.2f}")
-            print(f"      Spread: ${result['spread']:.4f} ({result['spread'] * 100:.2f}%)")
-            print(f"      Inventory Adj: ${result['inventory_adjustment']:+.6f}")
+            print(f"      Fair Value: ${result.fair_value:.4f}")
+            print(f"      Our Bid: ${result.bid_price:.2f}")
+            print(f"      Our Ask: ${result.ask_price:.2f}")
+            print(f"      Spread: ${result.spread:.4f} ({result.spread * 100:.2f}%)")
+            print(f"      Inventory Adj: ${result.inventory_adjustment:+.6f}")
             
-            if result["should_stop_buying"]:
+            if result.should_stop_buying:
                 print(f"      [!] STOP BUYING (inventory too high)")
-            if result["should_stop_selling"]:
+            if result.should_stop_selling:
                 print(f"      [!] STOP SELLING (inventory too low)")
     
     print("\n" + "=" * 80)
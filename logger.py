@@ -5,17 +5,336 @@ Provides console and file logging with rotation and formatting.
 
 import sys
 import os
+import queue
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
 from loguru import logger
 
+try:
+    import orjson
+    
+    def _json_line(obj) -> str:
+        """Serialize a record payload as one JSON line with orjson."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    import json
+    
+    def _json_line(obj) -> str:
+        """Serialize a record payload as one JSON line."""
+        return json.dumps(obj, default=str) + "\n"
+
+
+# Severity numbers of the built-in levels, for level_enabled()
+_LEVEL_NO = {
+    name: logger.level(name).no
+    for name in ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+}
+
+
+# Records the file sink may hold before producers block (backpressure)
+LOG_QUEUE_SIZE = 10000
+
+# File sink write buffer and the longest a record may sit in it
+LOG_BUFFER_SIZE = 128 * 1024
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+
+# File sink rotation and retention
+LOG_ROTATION_SECONDS = 24 * 60 * 60  # Rotate daily
+LOG_RETENTION_SECONDS = 30 * 24 * 60 * 60  # Keep logs for 30 days
+
+_STOP = object()  # Queue sentinel that ends the writer thread
+
+# Emoji removed from console output when stdout is not a terminal
+_EMOJI_TABLE = dict.fromkeys(
+    [
+        *range(0x1F300, 0x1FB00),  # Pictographs, emoticons, transport, supplemental symbols
+        *range(0x2600, 0x2700),    # Miscellaneous symbols (⚠ ...)
+        *range(0x23E9, 0x23FB),    # Media control symbols (⏭ ⏸ ...)
+        0x2705, 0x274C,            # ✅ ❌
+        0xFE0F,                    # Emoji presentation selector
+    ]
+)
+
+# log_websocket_event aggregation: (event_type, market) -> count since last summary
+WS_LOG_INTERVAL = 1.0  # seconds between DEBUG summaries
+_ws_counts: Dict[Tuple[str, str], int] = {}
+_ws_last_flush = time.monotonic()
+
+# Last logged state, used to skip repeats:
+# wallet -> (usdc_balance, balance_ok) and endpoint -> (monotonic time, hits suppressed since)
+RATE_LIMIT_LOG_INTERVAL = 1.0  # seconds
+_last_balance: Dict[str, Tuple[float, bool]] = {}
+_last_rate_limit: Dict[str, Tuple[float, int]] = {}
+
+# Human-readable body of log_arbitrage_opportunity, formatted by loguru
+_ARBITRAGE_TEMPLATE = "\n".join([
+    "🎯 ARBITRAGE OPPORTUNITY FOUND",
+    "  Market: {}",
+    "  YES Price: ${:.4f} | NO Price: ${:.4f}",
+    "  Implied Sum: {:.4f} (Expected: 1.00)",
+    "  Expected Profit: {:.2f}%",
+    "  Position: {:.2f} YES + {:.2f} NO tokens",
+])
+
+# Human-readable bodies of log_trade_execution
+_TRADE_SUCCESS_TEMPLATE = "\n".join([
+    "✅ TRADE EXECUTED SUCCESSFULLY",
+    "  Market: {}",
+    "  YES Order: {}... [{}]",
+    "  NO Order: {}... [{}]",
+    "  Execution Time: {:.2f}ms",
+])
+_TRADE_PARTIAL_TEMPLATE = "\n".join([
+    "❌ TRADE EXECUTION FAILED (Partial Fill)",
+    "  Market: {}",
+    "  YES Order: {}... [{}] (Filled: {})",
+    "  NO Order: {}... [{}] (Filled: {})",
+    "  ⚠️ ASYMMETRIC POSITION - MANUAL HEDGE REQUIRED!",
+])
+
+
+class QueuedFileSink:
+    """
+    Log file sink that writes from a background thread.
+    
+    Loguru hands each formatted record to write(), which only puts it on a
+    bounded in-process queue; a writer thread appends it to the file. When
+    the queue is full, write() blocks, so a stalled disk slows producers
+    down instead of growing memory. Writes go through a large file buffer
+    that is flushed at most every flush_interval seconds (and whenever the
+    writer goes idle with data pending), so bursts cost few write() calls.
+    The writer thread also rotates the file daily with a quick rename;
+    compressing the rotated file to zip and pruning old archives run on a
+    separate single-worker pool so logging never waits for them.
+    
+    Loguru calls stop() when the handler is removed (including at exit),
+    which drains the queue, closes the file and waits for any pending
+    compression.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = LOG_QUEUE_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        rotation: float = LOG_ROTATION_SECONDS,
+        retention: float = LOG_RETENTION_SECONDS,
+    ):
+        """
+        Open the log file and start the writer thread.
+        
+        Args:
+            path: Log file path
+            maxsize: Queue capacity in records
+            flush_interval: Maximum seconds between file flushes
+            rotation: Seconds between rotations
+            retention: Seconds to keep rotated archives
+        """
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.rotation = rotation
+        self.retention = retention
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._file = None
+        self._rotate_at = 0.0
+        self._open()
+        
+        self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+        self._thread = threading.Thread(target=self._run, name="log-file-writer", daemon=True)
+        self._thread.start()
+    
+    def write(self, message: str):
+        """Queue a formatted record; blocks while the queue is full."""
+        self._queue.put(message)
+    
+    def stop(self):
+        """Drain pending records, stop the writer thread and close the file."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._compressor.shutdown(wait=True)
+    
+    def _run(self):
+        """Writer thread: append queued records, rotating and flushing when due."""
+        get = self._queue.get
+        flush_interval = self.flush_interval
+        pending = False  # Data written since the last flush
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    message = get(timeout=flush_interval if pending else None)
+                except queue.Empty:
+                    # Idle with buffered data: flush so the file stays current
+                    self._file.flush()
+                    pending = False
+                    last_flush = time.monotonic()
+                    continue
+                if message is _STOP:
+                    break
+                if time.time() >= self._rotate_at:
+                    self._rotate()
+                self._file.write(message)
+                pending = True
+                
+                now = time.monotonic()
+                if now - last_flush >= flush_interval:
+                    self._file.flush()
+                    pending = False
+                    last_flush = now
+        finally:
+            self._file.close()
+    
+    def _open(self):
+        """Open the log file for appending and schedule the next rotation."""
+        self._file = open(self.path, "a", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
+        self._rotate_at = time.time() + self.rotation
+    
+    def _rotate(self):
+        """Rename the current file aside, start a new one and queue the archiving."""
+        self._file.close()
+        
+        rotated = None
+        if self.path.exists() and self.path.stat().st_size > 0:
+            stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+            rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+            os.replace(self.path, rotated)
+        
+        self._open()
+        self._compressor.submit(self._archive, rotated)
+    
+    def _archive(self, rotated: Optional[Path]):
+        """Compression worker: zip a rotated file, then prune old archives."""
+        if rotated is not None:
+            try:
+                with zipfile.ZipFile(
+                    f"{rotated}.zip", "w", zipfile.ZIP_DEFLATED, compresslevel=1
+                ) as archive:
+                    archive.write(rotated, rotated.name)
+                rotated.unlink()
+            except OSError as e:
+                sys.stderr.write(f"Log compression failed for {rotated}: {e}\n")
+        
+        self._prune()
+    
+    def _prune(self):
+        """Delete rotated archives older than the retention period."""
+        cutoff = time.time() - self.retention
+        for old in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}*"):
+            if old != self.path:
+                try:
+                    if old.stat().st_mtime < cutoff:
+                        old.unlink()
+                except OSError:
+                    pass
+
+
+def _timestamped_format(rest: str, time_format: str = "%Y-%m-%d %H:%M:%S") -> Callable:
+    """
+    Build a loguru format callable with a cached date/time prefix.
+    
+    Equivalent to "{time:YYYY-MM-DD HH:mm:ss.SSS}" + rest (for the default
+    time_format), but strftime runs once per second; records within that
+    second only append their milliseconds to the cached prefix.
+    
+    Args:
+        rest: Remainder of the loguru format string after the timestamp
+        time_format: strftime format for the whole-second part
+    
+    Returns:
+        Callable(record) -> format string
+    """
+    cached_second = -1
+    cached_prefix = ""
+    suffix = rest + "\n{exception}"
+    
+    def format_record(record) -> str:
+        nonlocal cached_second, cached_prefix
+        moment = record["time"]
+        second = int(moment.timestamp())
+        if second != cached_second:
+            cached_second = second
+            cached_prefix = moment.strftime(time_format)
+        return f"{cached_prefix}.{moment.microsecond // 1000:03d}" + suffix
+    
+    return format_record
+
+
+class PlainConsole:
+    """
+    Console stream for non-terminal stdout (systemd, Docker, pipes).
+    
+    Strips emoji from each formatted record before writing it to
+    sys.stdout; they are never rendered there and only add bytes.
+    """
+    
+    def write(self, message: str):
+        """Write a record without emoji."""
+        sys.stdout.write(message.translate(_EMOJI_TABLE))
+    
+    def flush(self):
+        """Flush stdout after each record, like loguru's stdout sink."""
+        sys.stdout.flush()
+
+
+class JsonEventSink:
+    """
+    JSON-lines sink for structured log records.
+    
+    Serializes the time, level, message and extra fields of each record
+    with orjson (stdlib json if unavailable) and hands the line to a
+    QueuedFileSink, so it shares the bounded queue, buffering and
+    rotation of the text log.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open the JSON log through a QueuedFileSink.
+        
+        Args:
+            path: JSON-lines file path
+        """
+        self._file_sink = QueuedFileSink(path)
+    
+    def write(self, message):
+        """Serialize one record and queue it for writing."""
+        record = message.record
+        self._file_sink.write(_json_line({
+            "time": record["time"].isoformat(),
+            "level": record["level"].name,
+            "message": record["message"],
+            **record["extra"],
+        }))
+    
+    def stop(self):
+        """Drain and close the underlying file sink."""
+        self._file_sink.stop()
+
 
-def setup_logger(log_level: str = "INFO", log_file: str = "logs/arbitrage.log"):
+def _is_structured(record) -> bool:
+    """Filter for JsonEventSink: records logged by the helpers below carry an event."""
+    return "event" in record["extra"]
+
+
+def setup_logger(
+    log_level: str = "INFO",
+    log_file: str = "logs/arbitrage.log",
+    json_file: Optional[str] = None,
+):
     """
     Setup Loguru logger with console and file outputs.
     
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Path to log file
+        json_file: Path to the JSON-lines file for structured events
+                   (default: log_file with a .jsonl suffix)
     """
     # Remove default handler
     logger.remove()
@@ -24,32 +343,64 @@ def setup_logger(log_level: str = "INFO", log_file: str = "logs/arbitrage.log"):
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Console handler with color formatting
+    # Console sinks write inline: loguru formats in the calling thread either
+    # way, and enqueue=True would only add a pickle of every record
+    if sys.stdout.isatty():
+        # Console handler with color formatting
+        logger.add(
+            sys.stdout,
+            format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+                   "<level>{level: <8}</level> | "
+                   "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+                   "<level>{message}</level>",
+            level=log_level,
+            colorize=True,
+        )
+    else:
+        # Redirected stdout: no markup or ANSI codes, emoji stripped
+        logger.add(
+            PlainConsole(),
+            format=_timestamped_format("|{level}|{message}", "%H:%M:%S"),
+            level=log_level,
+            colorize=False,
+        )
+    
+    # File handler: bounded queue + writer thread (daily rotation, 30-day retention, zip)
     logger.add(
-        sys.stdout,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-               "<level>{level: <8}</level> | "
-               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-               "<level>{message}</level>",
+        QueuedFileSink(log_file),
+        format=_timestamped_format(" | {level: <8} | {name}:{function}:{line} | {message}"),
         level=log_level,
-        colorize=True,
+        colorize=False,
     )
     
-    # File handler with rotation and retention
+    # Structured events (helpers that pass an event field) as JSON lines
     logger.add(
-        log_file,
-        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}",
+        JsonEventSink(json_file or str(log_path.with_suffix(".jsonl"))),
         level=log_level,
-        rotation="1 day",      # Rotate daily
-        retention="30 days",   # Keep logs for 30 days
-        compression="zip",     # Compress old logs
-        enqueue=True,          # Thread-safe logging
+        filter=_is_structured,
+        format="{message}",
+        colorize=False,
     )
     
     logger.info(f"Logger initialized with level: {log_level}")
     logger.info(f"Log file: {log_file}")
 
 
+def level_enabled(level: str) -> bool:
+    """
+    Check whether any sink would accept a record at the given level.
+    
+    Use it to skip building expensive messages that would be discarded.
+    
+    Args:
+        level: Level name (DEBUG, INFO, SUCCESS, WARNING, ...)
+    
+    Returns:
+        True if at least one sink accepts the level
+    """
+    return logger._core.min_level <= _LEVEL_NO[level]
+
+
 def log_arbitrage_opportunity(
     condition_id: str,
     question: str,
@@ -77,29 +428,31 @@ def log_arbitrage_opportunity(
         yes_size: YES token size to buy
         no_size: NO token size to buy
     """
+    if not level_enabled("INFO"):
+        return
+    
+    # One record: positional args fill the template, keyword args become extra fields
     logger.info(
-        "🎯 ARBITRAGE OPPORTUNITY FOUND",
-        extra={
-            "event": "arbitrage_opportunity",
-            "condition_id": condition_id,
-            "question": question,
-            "yes_token_id": yes_token_id,
-            "no_token_id": no_token_id,
-            "yes_price": yes_price,
-            "no_price": no_price,
-            "implied_sum": implied_sum,
-            "expected_profit_pct": expected_profit * 100,
-            "yes_size": yes_size,
-            "no_size": no_size,
-        }
+        _ARBITRAGE_TEMPLATE,
+        question,
+        yes_price,
+        no_price,
+        implied_sum,
+        expected_profit * 100,
+        yes_size,
+        no_size,
+        event="arbitrage_opportunity",
+        condition_id=condition_id,
+        question=question,
+        yes_token_id=yes_token_id,
+        no_token_id=no_token_id,
+        yes_price=yes_price,
+        no_price=no_price,
+        implied_sum=implied_sum,
+        expected_profit_pct=expected_profit * 100,
+        yes_size=yes_size,
+        no_size=no_size,
     )
-    
-    # Also log in human-readable format
-    logger.info(f"  Market: {question}")
-    logger.info(f"  YES Price: ${yes_price:.4f} | NO Price: ${no_price:.4f}")
-    logger.info(f"  Implied Sum: {implied_sum:.4f} (Expected: 1.00)")
-    logger.info(f"  Expected Profit: {expected_profit * 100:.2f}%")
-    logger.info(f"  Position: {yes_size:.2f} YES + {no_size:.2f} NO tokens")
 
 
 def log_trade_execution(
@@ -128,43 +481,49 @@ def log_trade_execution(
         execution_time_ms: Execution time in milliseconds
     """
     success = yes_filled and no_filled
+    if not level_enabled("SUCCESS" if success else "ERROR"):
+        return
+    
+    yes_prefix = (yes_order_id or "N/A")[:16]
+    no_prefix = (no_order_id or "N/A")[:16]
     
     if success:
         logger.success(
-            "✅ TRADE EXECUTED SUCCESSFULLY",
-            extra={
-                "event": "trade_success",
-                "condition_id": condition_id,
-                "question": question,
-                "yes_order_id": yes_order_id,
-                "no_order_id": no_order_id,
-                "execution_time_ms": execution_time_ms,
-            }
+            _TRADE_SUCCESS_TEMPLATE,
+            question,
+            yes_prefix,
+            yes_status,
+            no_prefix,
+            no_status,
+            execution_time_ms,
+            event="trade_success",
+            condition_id=condition_id,
+            question=question,
+            yes_order_id=yes_order_id,
+            no_order_id=no_order_id,
+            execution_time_ms=execution_time_ms,
         )
-        logger.success(f"  Market: {question}")
-        logger.success(f"  YES Order: {yes_order_id[:16]}... [{yes_status}]")
-        logger.success(f"  NO Order: {no_order_id[:16]}... [{no_status}]")
-        logger.success(f"  Execution Time: {execution_time_ms:.2f}ms")
     else:
         logger.error(
-            "❌ TRADE EXECUTION FAILED (Partial Fill)",
-            extra={
-                "event": "trade_partial_fill",
-                "condition_id": condition_id,
-                "question": question,
-                "yes_order_id": yes_order_id,
-                "no_order_id": no_order_id,
-                "yes_filled": yes_filled,
-                "no_filled": no_filled,
-                "yes_status": yes_status,
-                "no_status": no_status,
-                "execution_time_ms": execution_time_ms,
-            }
+            _TRADE_PARTIAL_TEMPLATE,
+            question,
+            yes_prefix,
+            yes_status,
+            yes_filled,
+            no_prefix,
+            no_status,
+            no_filled,
+            event="trade_partial_fill",
+            condition_id=condition_id,
+            question=question,
+            yes_order_id=yes_order_id,
+            no_order_id=no_order_id,
+            yes_filled=yes_filled,
+            no_filled=no_filled,
+            yes_status=yes_status,
+            no_status=no_status,
+            execution_time_ms=execution_time_ms,
         )
-        logger.error(f"  Market: {question}")
-        logger.error(f"  YES Order: {yes_order_id[:16] if yes_order_id else 'N/A'}... [{yes_status}] (Filled: {yes_filled})")
-        logger.error(f"  NO Order: {no_order_id[:16] if no_order_id else 'N/A'}... [{no_status}] (Filled: {no_filled})")
-        logger.error(f"  ⚠️ ASYMMETRIC POSITION - MANUAL HEDGE REQUIRED!")
 
 
 def log_opportunity_skipped(condition_id: str, question: str, reason: str):
@@ -176,14 +535,15 @@ def log_opportunity_skipped(condition_id: str, question: str, reason: str):
         question: Market question
         reason: Reason for skipping
     """
+    if not level_enabled("WARNING"):
+        return
+    
     logger.warning(
         f"⏭️ OPPORTUNITY SKIPPED: {reason}",
-        extra={
-            "event": "opportunity_skipped",
-            "condition_id": condition_id,
-            "question": question,
-            "reason": reason,
-        }
+        event="opportunity_skipped",
+        condition_id=condition_id,
+        question=question,
+        reason=reason,
     )
 
 
@@ -191,38 +551,51 @@ def log_balance_check(wallet_address: str, usdc_balance: float, min_balance: flo
     """
     Log USDC balance check.
     
+    Skipped when the wallet's balance is within a cent of the last logged
+    value and on the same side of min_balance.
+    
     Args:
         wallet_address: Wallet address
         usdc_balance: Current USDC balance
         min_balance: Minimum required balance
     """
-    if usdc_balance >= min_balance:
+    balance_ok = usdc_balance >= min_balance
+    if not level_enabled("INFO" if balance_ok else "WARNING"):
+        return
+    
+    last = _last_balance.get(wallet_address)
+    if last is not None and last[1] == balance_ok and abs(last[0] - usdc_balance) < 0.01:
+        return
+    _last_balance[wallet_address] = (usdc_balance, balance_ok)
+    
+    if balance_ok:
         logger.info(
             f"💰 Balance Check: ${usdc_balance:.2f} USDC",
-            extra={
-                "event": "balance_check",
-                "wallet_address": wallet_address,
-                "usdc_balance": usdc_balance,
-                "min_balance": min_balance,
-                "status": "ok",
-            }
+            event="balance_check",
+            wallet_address=wallet_address,
+            usdc_balance=usdc_balance,
+            min_balance=min_balance,
+            status="ok",
         )
     else:
         logger.warning(
             f"⚠️ Low Balance: ${usdc_balance:.2f} USDC (Min: ${min_balance:.2f})",
-            extra={
-                "event": "balance_check",
-                "wallet_address": wallet_address,
-                "usdc_balance": usdc_balance,
-                "min_balance": min_balance,
-                "status": "low",
-            }
+            event="balance_check",
+            wallet_address=wallet_address,
+            usdc_balance=usdc_balance,
+            min_balance=min_balance,
+            status="low",
         )
 
 
 def log_websocket_event(event_type: str, asset_id: str, market: str, details: dict):
     """
-    Log WebSocket events (DEBUG level).
+    Count a WebSocket event for the aggregated DEBUG summary.
+    
+    Events are tallied per (event_type, market) and emitted as one DEBUG
+    record, {event_type: {market: count}}, at most every WS_LOG_INTERVAL
+    seconds; the summary goes out on the first event after the interval
+    elapses. Returns immediately when DEBUG is filtered.
     
     Args:
         event_type: Event type (book, price_change, etc.)
@@ -230,37 +603,67 @@ def log_websocket_event(event_type: str, asset_id: str, market: str, details: di
         market: Market condition ID
         details: Event details
     """
-    logger.debug(
-        f"📡 WebSocket Event: {event_type}",
-        extra={
-            "event": "websocket_event",
-            "event_type": event_type,
-            "asset_id": asset_id,
-            "market": market,
-            "details": details,
-        }
-    )
+    global _ws_last_flush
+    if not level_enabled("DEBUG"):
+        return
+    
+    key = (event_type, market)
+    _ws_counts[key] = _ws_counts.get(key, 0) + 1
+    
+    now = time.monotonic()
+    elapsed = now - _ws_last_flush
+    if elapsed >= WS_LOG_INTERVAL:
+        counts = {}
+        for (counted_type, counted_market), count in _ws_counts.items():
+            counts.setdefault(counted_type, {})[counted_market] = count
+        _ws_counts.clear()
+        _ws_last_flush = now
+        logger.debug(
+            "📡 WebSocket events (last {:.1f}s): {}",
+            elapsed,
+            counts,
+            event="websocket_events",
+            counts=counts,
+        )
 
 
 def log_rate_limit_hit(endpoint: str, sleep_time: float):
     """
     Log rate limit event.
     
+    Logs at most once per RATE_LIMIT_LOG_INTERVAL seconds per endpoint;
+    hits in between are counted and reported with the next record.
+    
     Args:
         endpoint: API endpoint
         sleep_time: Sleep time in seconds
     """
+    if not level_enabled("WARNING"):
+        return
+    
+    now = time.monotonic()
+    last_logged, suppressed = _last_rate_limit.get(endpoint, (0.0, 0))
+    if now - last_logged < RATE_LIMIT_LOG_INTERVAL:
+        _last_rate_limit[endpoint] = (last_logged, suppressed + 1)
+        return
+    _last_rate_limit[endpoint] = (now, 0)
+    
+    more = f", {suppressed} more since last report" if suppressed else ""
     logger.warning(
-        f"⏸️ Rate Limit Hit: {endpoint} (sleeping {sleep_time:.2f}s)",
-        extra={
-            "event": "rate_limit",
-            "endpoint": endpoint,
-            "sleep_time": sleep_time,
-        }
+        f"⏸️ Rate Limit Hit: {endpoint} (sleeping {sleep_time:.2f}s{more})",
+        event="rate_limit",
+        endpoint=endpoint,
+        sleep_time=sleep_time,
+        suppressed=suppressed,
     )
 
 
-def log_error(error_msg: str, exception: Exception = None, context: dict = None):
+def log_error(
+    error_msg: str,
+    exception: Exception = None,
+    context: dict = None,
+    cheap: bool = False,
+):
     """
     Log error with optional exception and context.
     
@@ -268,15 +671,24 @@ def log_error(error_msg: str, exception: Exception = None, context: dict = None)
         error_msg: Error message
         exception: Exception object (optional)
         context: Additional context (optional)
+        cheap: Log only the exception type and text, without formatting a
+               traceback; for expected, recurring errors (rate limits,
+               reconnects)
     """
+    if not level_enabled("ERROR"):
+        return
+    
     extra_data = {"event": "error"}
     if context:
         extra_data.update(context)
     
-    if exception:
-        logger.exception(error_msg, extra=extra_data)
+    # Messages go in as arguments so braces in them are never treated as fields
+    if exception is None:
+        logger.error("{}", error_msg, **extra_data)
+    elif cheap:
+        logger.error("{}: {}: {}", error_msg, type(exception).__name__, exception, **extra_data)
     else:
-        logger.error(error_msg, extra=extra_data)
+        logger.opt(exception=exception).error("{}", error_msg, **extra_data)
 
 
 if __name__ == "__main__":
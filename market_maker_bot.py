@@ -15,22 +15,44 @@ import asyncio
 import signal
 import sys
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict
 from loguru import logger
 from datetime import datetime
 
 from config import Config, init_config
-from logger import setup_logger
+from logger import setup_logger, level_enabled
 from rate_limiter import RateLimiter
 from market_manager import MarketManager, Market
 from websocket_manager import WebSocketManager
-from inventory_skew_strategy import InventorySkewStrategy
+from inventory_skew_strategy import InventorySkewStrategy, QuoteResult
 from balance_checker import BalanceChecker
 from clob_client_wrapper import ClobClientWrapper
 from mm_trade_logger import MarketMakerLogger
 from mm_simulated_trade_logger import SimulatedTradeLogger
 
 
+# Tokens per simulated fill (paper trading)
+SIMULATED_FILL_SIZE = 10
+
+
+class MarketState:
+    """Quoting state of one market, fetched with a single lookup per orderbook event."""
+    
+    __slots__ = ("market", "inventory", "next_quote_at", "last_logged_quote")
+    
+    def __init__(self, market: Market):
+        """
+        Initialize state for a newly loaded market.
+        
+        Args:
+            market: Market object
+        """
+        self.market = market
+        self.inventory = 0  # Start with 0 inventory
+        self.next_quote_at = 0.0  # Monotonic deadline for the next quote update
+        self.last_logged_quote: Optional[tuple] = None  # (inventory, bid, ask) last logged
+
+
 class MarketMakerBot:
     """
     Market Maker Bot using Inventory Skew Strategy.
@@ -59,14 +81,18 @@ class MarketMakerBot:
         
         # State
         self.running = False
+        self.stop_event = asyncio.Event()  # Set to end start()
         self.markets: Dict[str, Market] = {}  # condition_id -> Market
-        self.inventories: Dict[str, int] = {}  # condition_id -> inventory
+        self.market_states: Dict[str, MarketState] = {}  # condition_id -> MarketState
         self.active_orders: Dict[str, Dict] = {}  # order_id -> order_info
-        self.last_quote_update: Dict[str, float] = {}  # condition_id -> timestamp
         
-        # Config
-        self.paper_trading = getattr(config, 'mm_paper_trading', True)
-        self.quote_update_interval = getattr(config, 'mm_quote_update_interval', 5.0)
+        # Config (read once; Config is immutable)
+        self.paper_trading = config.mm_paper_trading
+        self.quote_update_interval = float(config.mm_quote_update_interval)
+        self.target_spread = float(config.mm_target_spread)
+        self.skew_factor = float(config.mm_skew_factor)
+        self.max_inventory = int(config.mm_max_inventory)
+        self.quote_csv_file = config.mm_paper_trading_file
         
         logger.info("MarketMakerBot initialized")
     
@@ -83,6 +109,7 @@ class MarketMakerBot:
         
         # Market manager
         self.market_manager = MarketManager(self.config, self.rate_limiter)
+        await self.market_manager.warmup()
         logger.success("[OK] Market manager initialized")
         
         # WebSocket manager
@@ -93,21 +120,16 @@ class MarketMakerBot:
         logger.success("[OK] WebSocket manager initialized")
         
         # Strategy
-        mm_spread = getattr(self.config, 'mm_target_spread', 0.02)
-        mm_skew = getattr(self.config, 'mm_skew_factor', 0.0001)
-        mm_max_inv = getattr(self.config, 'mm_max_inventory', 1000)
-        
         self.strategy = InventorySkewStrategy(
-            target_spread=mm_spread,
-            skew_factor=mm_skew,
-            max_inventory=mm_max_inv
+            target_spread=self.target_spread,
+            skew_factor=self.skew_factor,
+            max_inventory=self.max_inventory
         )
         logger.success("[OK] Market maker strategy initialized")
         
         # CSV Logger (quotes)
-        mm_csv_file = getattr(self.config, 'mm_paper_trading_file', 'mm_paper_trades.csv')
-        self.logger = MarketMakerLogger(mm_csv_file)
-        logger.success(f"[OK] Quote logger initialized: {mm_csv_file}")
+        self.logger = MarketMakerLogger(self.quote_csv_file)
+        logger.success(f"[OK] Quote logger initialized: {self.quote_csv_file}")
         
         # Trade Logger (simulated fills)
         self.trade_logger = SimulatedTradeLogger("mm_simulated_trades.csv")
@@ -149,11 +171,10 @@ class MarketMakerBot:
             logger.error("No markets found for market making!")
             return False
         
-        # Store markets and initialize inventories
+        # Store markets and initialize their quoting state
         for market in markets:
             self.markets[market.condition_id] = market
-            self.inventories[market.condition_id] = 0  # Start with 0 inventory
-            self.last_quote_update[market.condition_id] = 0.0
+            self.market_states[market.condition_id] = MarketState(market)
         
         logger.success(f"[OK] Loaded {len(markets)} markets for market making")
         return True
@@ -180,10 +201,9 @@ class MarketMakerBot:
         logger.success(f"Paper Trading: {self.paper_trading}")
         logger.success("=" * 60)
         
-        # Keep running
+        # Keep running until shutdown is requested
         try:
-            while self.running:
-                await asyncio.sleep(1)
+            await self.stop_event.wait()
         except asyncio.CancelledError:
             logger.info("Bot task cancelled")
     
@@ -196,102 +216,123 @@ class MarketMakerBot:
             asset_id: Asset ID (token ID)
             orderbook: OrderbookSnapshot object
         """
-        # Find market by condition_id
-        market = self.markets.get(market_id)
-        if not market:
-            logger.debug(f"Market {market_id} not found in tracked markets")
+        # One lookup for all per-market state
+        state = self.market_states.get(market_id)
+        if state is None:
+            logger.debug("Market {} not found in tracked markets", market_id)
             return
         
-        # Check if we should update quotes
-        now = time.time()
-        last_update = self.last_quote_update.get(market_id, 0)
-        
-        if now - last_update < self.quote_update_interval:
+        # Throttle: most book events arrive before the market is due again
+        now = time.monotonic()
+        if now < state.next_quote_at:
             return  # Too soon to update
         
+        market = state.market
+        
         # Extract best bid/ask from OrderbookSnapshot
         best_bid_order = orderbook.get_best_bid()
         best_ask_order = orderbook.get_best_ask()
         
         if not best_bid_order or not best_ask_order:
-            logger.debug(f"Empty orderbook for {market.question[:50]}...")
+            logger.debug("Empty orderbook for {}...", market.question_display)
             return
         
         best_bid = best_bid_order["price"]
         best_ask = best_ask_order["price"]
         
         if best_bid <= 0 or best_ask <= 0 or best_bid >= best_ask:
-            logger.debug(f"Invalid orderbook for {market.question[:50]}...")
+            logger.debug("Invalid orderbook for {}...", market.question_display)
             return
         
+        strategy = self.strategy
+        trade_logger = self.trade_logger
+        quote_logger = self.logger
+        
         # Get current inventory from trade logger (real simulated inventory)
-        current_inventory = self.trade_logger.get_inventory(market_id) if self.trade_logger else 0
+        current_inventory = trade_logger.get_inventory(market_id) if trade_logger else 0
         
         # Also update local inventory tracking
-        self.inventories[market_id] = current_inventory
+        state.inventory = current_inventory
         
         # Calculate quotes
-        quotes = self.strategy.calculate_quotes(
+        quotes = strategy.calculate_quotes(
             best_bid=best_bid,
             best_ask=best_ask,
             current_inventory=current_inventory
         )
         
-        if quotes["reason"]:
+        if quotes.reason:
             logger.warning(
-                f"Cannot quote {market.question[:40]}...: {quotes['reason']}"
+                f"Cannot quote {market.question_short}...: {quotes.reason}"
             )
             return
         
-        # Log quote decision
-        logger.info(
-            f"\n{'='*60}\n"
-            f"Market: {market.question[:60]}...\n"
-            f"  Current: Bid=${best_bid:.4f}, Ask=${best_ask:.4f}\n"
-            f"  Inventory: {current_inventory:+d} (Util: {abs(current_inventory)/self.strategy.max_inventory*100:.1f}%)\n"
-            f"  Our Quotes: Bid=${quotes['bid_price']:.4f}, Ask=${quotes['ask_price']:.4f}\n"
-            f"  Fair Value: ${quotes['fair_value']:.4f} (Adj: ${quotes['inventory_adjustment']:+.6f})\n"
-            f"  Spread: ${quotes['spread']:.4f} ({quotes['spread']*100:.2f}%)"
-        )
+        # Log quote decision only when the quote moved (and INFO is not filtered out)
+        quote_key = (current_inventory, quotes.bid_price, quotes.ask_price)
+        if state.last_logged_quote != quote_key and level_enabled("INFO"):
+            state.last_logged_quote = quote_key
+            logger.info(
+                f"\n{'='*60}\n"
+                f"Market: {market.question_display}...\n"
+                f"  Current: Bid=${best_bid:.4f}, Ask=${best_ask:.4f}\n"
+                f"  Inventory: {current_inventory:+d} (Util: {abs(current_inventory)/strategy.max_inventory*100:.1f}%)\n"
+                f"  Our Quotes: Bid=${quotes.bid_price:.4f}, Ask=${quotes.ask_price:.4f}\n"
+                f"  Fair Value: ${quotes.fair_value:.4f} (Adj: ${quotes.inventory_adjustment:+.6f})\n"
+                f"  Spread: ${quotes.spread:.4f} ({quotes.spread*100:.2f}%)"
+            )
         
         # Risk warnings
-        if quotes["should_stop_buying"]:
+        if quotes.should_stop_buying:
             logger.warning("  [!] STOP BUYING - Inventory too HIGH")
-        if quotes["should_stop_selling"]:
+        if quotes.should_stop_selling:
             logger.warning("  [!] STOP SELLING - Inventory too LOW")
         
         # Log quote to CSV
-        if self.logger:
-            self.logger.log_quote(
+        if quote_logger:
+            quote_logger.log_quote(
                 market_question=market.question,
                 condition_id=market_id,
                 inventory=current_inventory,
-                max_inventory=self.strategy.max_inventory,
+                max_inventory=strategy.max_inventory,
                 market_best_bid=best_bid,
                 market_best_ask=best_ask,
                 quotes=quotes
             )
         
         # SIMULATE FILLS: Check if market hit our quotes
-        if self.trade_logger:
-            await self.simulate_fills(
-                market=market,
-                market_id=market_id,
-                best_bid=best_bid,
-                best_ask=best_ask,
-                our_bid=quotes['bid_price'],
-                our_ask=quotes['ask_price'],
-                should_stop_buying=quotes['should_stop_buying'],
-                should_stop_selling=quotes['should_stop_selling']
-            )
+        # A quote inside the market spread that is at or better than the market
+        # (bid >= best_bid, ask <= best_ask) provides liquidity and is assumed
+        # filled at our price, unless the risk flags stop that side.
+        if trade_logger:
+            our_bid = quotes.bid_price
+            our_ask = quotes.ask_price
+            fills = []
+            if not quotes.should_stop_buying and best_bid <= our_bid < best_ask:
+                fills.append(("BUY", our_bid))
+            if not quotes.should_stop_selling and best_bid < our_ask <= best_ask:
+                fills.append(("SELL", our_ask))
+            
+            for action, fill_price in fills:
+                trade_logger.simulate_fill(
+                    action=action,
+                    market_question=market.question,
+                    condition_id=market_id,
+                    price=fill_price,
+                    size=SIMULATED_FILL_SIZE
+                )
+                logger.info(
+                    f"[FILL] {action} {SIMULATED_FILL_SIZE} @ ${fill_price:.4f} | "
+                    f"Market: Bid=${best_bid:.4f} Ask=${best_ask:.4f} | "
+                    f"{market.question_short}..."
+                )
         
         # Update quotes (paper trading only logs)
         await self.update_quotes(market, quotes)
         
-        # Update last quote time
-        self.last_quote_update[market_id] = now
+        # Schedule the next quote update
+        state.next_quote_at = now + self.quote_update_interval
     
-    async def update_quotes(self, market: Market, quotes: Dict[str, Any]):
+    async def update_quotes(self, market: Market, quotes: QuoteResult):
         """
         Update/place orders for a market.
         
@@ -303,101 +344,25 @@ class MarketMakerBot:
             # Paper trading: just log
             logger.info(
                 f"  [PAPER] Would place orders:\n"
-                f"    BID: {quotes['bid_price']:.4f} (skip: {quotes['should_stop_buying']})\n"
-                f"    ASK: {quotes['ask_price']:.4f} (skip: {quotes['should_stop_selling']})"
+                f"    BID: {quotes.bid_price:.4f} (skip: {quotes.should_stop_buying})\n"
+                f"    ASK: {quotes.ask_price:.4f} (skip: {quotes.should_stop_selling})"
             )
             return
         
         # Real trading: place orders
         # TODO: Implement real order placement
         # 1. Cancel existing orders for this market
-        # 2. Place new bid order (if not should_stop_buying)
-        # 3. Place new ask order (if not should_stop_selling)
+        # 2. Post the bid (if not should_stop_buying) and ask (if not
+        #    should_stop_selling) together in one request via
+        #    ClobClientWrapper.create_and_post_orders_batch
         
         logger.warning("Real trading not yet implemented!")
     
-    async def simulate_fills(
-        self,
-        market: Market,
-        market_id: str,
-        best_bid: float,
-        best_ask: float,
-        our_bid: float,
-        our_ask: float,
-        should_stop_buying: bool,
-        should_stop_selling: bool
-    ):
-        """
-        Simulate order fills based on market prices.
-        
-        REALISTIC MARKET MAKER LOGIC:
-        - If our bid >= best_bid (we're at or better than market) → Likely to get filled
-        - If our ask <= best_ask (we're at or better than market) → Likely to get filled
-        - Market makers get filled when they provide tight spreads
-        
-        Args:
-            market: Market object
-            market_id: Market condition ID
-            best_bid: Market's best bid
-            best_ask: Market's best ask
-            our_bid: Our bid quote
-            our_ask: Our ask quote
-            should_stop_buying: Risk flag - don't buy
-            should_stop_selling: Risk flag - don't sell
-        """
-        fill_size = 10  # Fixed size per fill
-        
-        # BUY simulation: Our bid is competitive (at or better than market bid)
-        # AND our bid is inside the spread (between best_bid and best_ask)
-        # This means we're providing liquidity and would likely get filled
-        if not should_stop_buying:
-            # Check if our bid is competitive
-            if our_bid >= best_bid and our_bid < best_ask:
-                # We're providing a better bid than the market
-                # Assume we get filled at our price
-                fill_price = our_bid
-                
-                self.trade_logger.simulate_fill(
-                    action="BUY",
-                    market_question=market.question,
-                    condition_id=market_id,
-                    price=fill_price,
-                    size=fill_size
-                )
-                
-                logger.info(
-                    f"[FILL] BUY {fill_size} @ ${fill_price:.4f} | "
-                    f"Market: Bid=${best_bid:.4f} Ask=${best_ask:.4f} | "
-                    f"{market.question[:40]}..."
-                )
-        
-        # SELL simulation: Our ask is competitive (at or better than market ask)
-        # AND our ask is inside the spread
-        if not should_stop_selling:
-            # Check if our ask is competitive
-            if our_ask <= best_ask and our_ask > best_bid:
-                # We're providing a better ask than the market
-                # Assume we get filled at our price
-                fill_price = our_ask
-                
-                self.trade_logger.simulate_fill(
-                    action="SELL",
-                    market_question=market.question,
-                    condition_id=market_id,
-                    price=fill_price,
-                    size=fill_size
-                )
-                
-                logger.info(
-                    f"[FILL] SELL {fill_size} @ ${fill_price:.4f} | "
-                    f"Market: Bid=${best_bid:.4f} Ask=${best_ask:.4f} | "
-                    f"{market.question[:40]}..."
-                )
-    
     async def shutdown(self):
         """Shutdown the bot gracefully."""
         logger.info("Shutting down Market Maker Bot...")
         self.running = False
+        self.stop_event.set()
         
         # Stop WebSocket
         if self.ws_manager:
@@ -409,6 +374,9 @@ class MarketMakerBot:
             # TODO: Cancel all active orders
             pass
         
+        if self.clob_client:
+            await self.clob_client.close()
+        
         # Log final statistics
         logger.info("=" * 60)
         logger.info("FINAL STATISTICS - Market Maker")
@@ -416,14 +384,12 @@ class MarketMakerBot:
         logger.info(f"Markets Tracked: {len(self.markets)}")
         logger.info(f"Paper Trading: {self.paper_trading}")
         
-        total_inventory = sum(abs(inv) for inv in self.inventories.values())
+        total_inventory = sum(abs(state.inventory) for state in self.market_states.values())
         logger.info(f"Total Inventory (absolute): {total_inventory}")
         
-        for condition_id, inventory in self.inventories.items():
-            if inventory != 0:
-                market = self.markets.get(condition_id)
-                question = market.question[:60] if market else condition_id
-                logger.info(f"  {question}...: {inventory:+d}")
+        for state in self.market_states.values():
+            if state.inventory != 0:
+                logger.info(f"  {state.market.question_display}...: {state.inventory:+d}")
         
         # Quote logger stats
         if self.logger:
@@ -438,6 +404,12 @@ class MarketMakerBot:
             logger.info("")
             self.trade_logger.log_statistics()
         
+        # Write out queued CSV rows
+        if self.logger:
+            self.logger.close()
+        if self.trade_logger:
+            self.trade_logger.close()
+        
         logger.info("=" * 60)
         logger.success("Market Maker Bot stopped")
 
@@ -461,10 +433,12 @@ async def main():
     # Create bot
     bot = MarketMakerBot(config)
     
-    # Setup signal handlers
+    # Setup signal handlers: wake start(); main's finally block runs shutdown
+    loop = asyncio.get_running_loop()
+    
     def signal_handler(sig, frame):
         logger.warning(f"Received signal {sig}, shutting down...")
-        asyncio.create_task(bot.shutdown())
+        loop.call_soon_threadsafe(bot.stop_event.set)
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
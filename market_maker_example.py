@@ -5,8 +5,9 @@ Bu dosya, InventorySkewStrategy'nin nasıl kullanılacağını gösterir.
 """
 
 import asyncio
+from collections import defaultdict
 from inventory_skew_strategy import InventorySkewStrategy
-from typing import Dict, Any
+from typing import Dict, Any, List, Set, Tuple
 
 # Simülasyon için örnek market data
 EXAMPLE_MARKETS = [
@@ -22,6 +23,9 @@ EXAMPLE_MARKETS = [
     }
 ]
 
+# Market ID -> (best_bid, best_ask), modül yüklenirken bir kez kurulur
+_PRICES_BY_ID = {m["id"]: (m["best_bid"], m["best_ask"]) for m in EXAMPLE_MARKETS}
+
 
 class SimpleMarketMaker:
     """Basit market maker örneği."""
@@ -42,22 +46,17 @@ class SimpleMarketMaker:
         
         # Aktif orderlar (simülasyon)
         self.active_orders: Dict[str, Dict[str, Any]] = {}
+        # Market bazında order_id indeksi (iptal tüm orderları taramaz)
+        self.orders_by_market: Dict[str, Set[str]] = defaultdict(set)
+        # Son quote'un girdileri: market_id -> (best_bid, best_ask, inventory)
+        self._last_inputs: Dict[str, Tuple[float, float, int]] = {}
     
     def get_market_data(self, market_id: str) -> tuple[float, float]:
         """Market datasını al (simülasyon)."""
-        for market in EXAMPLE_MARKETS:
-            if market["id"] == market_id:
-                return market["best_bid"], market["best_ask"]
-        return 0.0, 0.0
+        return _PRICES_BY_ID.get(market_id, (0.0, 0.0))
     
-    async def place_order(
-        self,
-        market_id: str,
-        side: str,
-        price: float,
-        size: int = 10
-    ):
-        """Order gönder (simülasyon)."""
+    def _add_order(self, market_id: str, side: str, price: float, size: int):
+        """Orderı aktif orderlara ve market indeksine ekle."""
         order_id = f"{market_id}_{side}_{price}"
         
         print(f"  [ORDER] {side} {size} @ ${price:.2f} on {market_id}")
@@ -69,19 +68,57 @@ class SimpleMarketMaker:
             "size": size,
             "filled": 0
         }
+        self.orders_by_market[market_id].add(order_id)
+    
+    async def place_order(
+        self,
+        market_id: str,
+        side: str,
+        price: float,
+        size: int = 10
+    ):
+        """Order gönder (simülasyon)."""
+        self._add_order(market_id, side, price, size)
+    
+    async def replace_quotes(
+        self,
+        market_id: str,
+        cancel_ids: List[str],
+        new_orders: List[Dict[str, Any]],
+    ):
+        """
+        Eski orderları iptal et ve yenilerini tek istekte gönder (simülasyon).
+        
+        Gerçek borsada iptal + BUY + SELL için üç round trip yerine tek bir
+        batch isteğine karşılık gelir.
+        
+        Args:
+            market_id: Market ID
+            cancel_ids: İptal edilecek order ID'leri
+            new_orders: Yeni orderlar ({"side", "price", "size"})
+        """
+        for order_id in cancel_ids:
+            self.active_orders.pop(order_id, None)
+        self.orders_by_market.pop(market_id, None)
+        
+        if cancel_ids:
+            print(f"  [X] Cancelled {len(cancel_ids)} orders for {market_id}")
+        
+        print(f"\n[ORDERS] Placing new orders:")
+        
+        for order in new_orders:
+            self._add_order(market_id, order["side"], order["price"], order["size"])
     
     async def cancel_orders(self, market_id: str):
         """Tüm orderları iptal et (simülasyon)."""
-        to_remove = [
-            order_id for order_id, order in self.active_orders.items()
-            if order["market_id"] == market_id
-        ]
+        to_remove = self.orders_by_market.pop(market_id, None)
+        if not to_remove:
+            return
         
         for order_id in to_remove:
             del self.active_orders[order_id]
         
-        if to_remove:
-            print(f"  [X] Cancelled {len(to_remove)} orders for {market_id}")
+        print(f"  [X] Cancelled {len(to_remove)} orders for {market_id}")
     
     def on_order_filled(self, market_id: str, side: str, price: float, size: int):
         """Order fill event (simülasyon)."""
@@ -97,14 +134,20 @@ class SimpleMarketMaker:
     
     async def update_quotes(self, market_id: str):
         """Market için quote'ları güncelle."""
+        best_bid, best_ask = self.get_market_data(market_id)
+        current_inventory = self.inventories[market_id]
+        
+        # Girdiler birebir aynıysa quote da aynı: hesaplama ve iptal/yeniden gönderme yok
+        inputs = (best_bid, best_ask, current_inventory)
+        if self._last_inputs.get(market_id) == inputs:
+            print(f"\n[SKIP] {market_id}: inputs unchanged, keeping quotes")
+            return
+        self._last_inputs[market_id] = inputs
+        
         print(f"\n{'='*60}")
         print(f"Updating quotes for {market_id}")
         print(f"{'='*60}")
         
-        # Market data al
-        best_bid, best_ask = self.get_market_data(market_id)
-        current_inventory = self.inventories[market_id]
-        
         print(f"Market: Bid=${best_bid:.2f}, Ask=${best_ask:.2f}")
         print(f"Current Inventory: {current_inventory:+d}")
         
@@ -116,46 +159,37 @@ class SimpleMarketMaker:
         )
         
         # Hata kontrolü
-        if result["reason"]:
-            print(f"[ERROR] Cannot quote: {result['reason']}")
+        if result.reason:
+            print(f"[ERROR] Cannot quote: {result.reason}")
             await self.cancel_orders(market_id)
             return
         
         print(f"\n[QUOTES] Calculated Quotes:")
-        print(f"  Fair Value: ${result['fair_value']:.4f}")
-        print(f"  Our Bid: ${result['bid_price']:.2f}")
-        print(f"  Our Ask: ${result['ask_price']:.2f}")
-        print(f"  Spread: ${result['spread']:.4f} ({result['spread']*100:.2f}%)")
-        print(f"  Inventory Adjustment: ${result['inventory_adjustment']:+.6f}")
+        print(f"  Fair Value: ${result.fair_value:.4f}")
+        print(f"  Our Bid: ${result.bid_price:.2f}")
+        print(f"  Our Ask: ${result.ask_price:.2f}")
+        print(f"  Spread: ${result.spread:.4f} ({result.spread*100:.2f}%)")
+        print(f"  Inventory Adjustment: ${result.inventory_adjustment:+.6f}")
         
         # Risk kontrolü
-        if result["should_stop_buying"]:
+        if result.should_stop_buying:
             print(f"\n[!] RISK: Inventory too HIGH -> Only SELL orders")
-        if result["should_stop_selling"]:
+        if result.should_stop_selling:
             print(f"\n[!] RISK: Inventory too LOW -> Only BUY orders")
         
-        # Eski orderları iptal et
-        await self.cancel_orders(market_id)
+        # Yeni orderlar: bid (alış) ve ask (satış)
+        new_orders = []
+        if not result.should_stop_buying:
+            new_orders.append({"side": "BUY", "price": result.bid_price, "size": 10})
+        if not result.should_stop_selling:
+            new_orders.append({"side": "SELL", "price": result.ask_price, "size": 10})
         
-        print(f"\n[ORDERS] Placing new orders:")
-        
-        # Bid order (alış)
-        if not result["should_stop_buying"]:
-            await self.place_order(
-                market_id=market_id,
-                side="BUY",
-                price=result["bid_price"],
-                size=10
-            )
-        
-        # Ask order (satış)
-        if not result["should_stop_selling"]:
-            await self.place_order(
-                market_id=market_id,
-                side="SELL",
-                price=result["ask_price"],
-                size=10
-            )
+        # Eski orderları iptal et ve yenilerini tek istekte gönder
+        await self.replace_quotes(
+            market_id,
+            list(self.orders_by_market.get(market_id, ())),
+            new_orders,
+        )
     
     async def run_simulation(self):
         """Market maker simülasyonu çalıştır."""
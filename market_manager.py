@@ -5,74 +5,148 @@ Handles tag-based market discovery and filtering.
 
 import asyncio
 import json
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Tuple
 import aiohttp
 from loguru import logger
 
-from config import get_config
+from config import Config
+from logger import level_enabled
 from rate_limiter import RateLimiter
 
-# Get config instance
-config = get_config()
+# _json_loads is fed raw response bytes (both codecs accept bytes), which
+# skips aiohttp's charset detection and bytes -> str decode of every body
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        """Serialize request bodies with orjson."""
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+# Maximum Gamma detail requests in flight at once
+GAMMA_MAX_CONCURRENCY = 8
+
+# Gamma request timeout for the private session (seconds)
+GAMMA_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=1)
+
+# BTC/ETH "Up or Down" question filter (matched against Market.question_lower)
+_UPDOWN = "up or down"
+
+
+def _extract_token_ids(data: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Pull the YES/NO token IDs out of Gamma market data.
+    
+    Reads the "tokens" array first and falls back to "clobTokenIds" only
+    if either side is still missing.
+    
+    Args:
+        data: Market data dictionary from Gamma API
+    
+    Returns:
+        Tuple of (yes_token_id, no_token_id); empty strings if not found
+    """
+    yes_token_id = ""
+    no_token_id = ""
+    
+    # Standard format: array of dicts with outcome info
+    for token in data.get("tokens") or ():
+        if isinstance(token, dict):
+            outcome = token.get("outcome", "").lower()
+            token_id = token.get("token_id", "") or token.get("tokenId", "")
+            
+            if outcome == "yes":
+                yes_token_id = token_id
+            elif outcome == "no":
+                no_token_id = token_id
+    
+    if yes_token_id and no_token_id:
+        return yes_token_id, no_token_id
+    
+    # If tokens not found, try clobTokenIds
+    clob_token_ids = data.get("clobTokenIds", [])
+    
+    # clobTokenIds can be a string (JSON array) or a list
+    if isinstance(clob_token_ids, str):
+        try:
+            clob_token_ids = _json_loads(clob_token_ids)
+        except (json.JSONDecodeError, ValueError):
+            clob_token_ids = []
+    
+    # Index 0 = NO, Index 1 = YES (Polymarket convention for binary markets)
+    if isinstance(clob_token_ids, list) and len(clob_token_ids) >= 2:
+        return str(clob_token_ids[1]), str(clob_token_ids[0])
+    
+    return yes_token_id, no_token_id
 
 
+@dataclass(slots=True, eq=False)
 class Market:
-    """Represents a Polymarket market with YES/NO tokens."""
+    """
+    Represents a Polymarket market with YES/NO tokens.
+    
+    Build from Gamma API data with Market.from_api(). Not frozen: the
+    market channel updates tick_size in place. Equality stays identity-based
+    so markets remain hashable.
+    """
+    
+    condition_id: str
+    question: str
+    slug: str
+    yes_token_id: str
+    no_token_id: str
+    volume_24hr: float = 0.0
+    liquidity: float = 0.0
+    tick_size: str = "0.01"
+    active: bool = True
+    closed: bool = False
+    tags: List[str] = field(default_factory=list)
+    
+    # Derived from question in __post_init__
+    question_lower: str = field(init=False)
+    # Truncated questions for log lines, sliced once here
+    question_short: str = field(init=False)
+    question_display: str = field(init=False)
+    
+    def __post_init__(self):
+        """Precompute the lowercased and truncated question strings."""
+        self.question_lower = self.question.lower()
+        self.question_short = self.question[:40]
+        self.question_display = self.question[:60]
     
-    def __init__(self, data: Dict[str, Any]):
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Market":
         """
-        Initialize market from API data.
+        Create a market from API data.
         
         Args:
             data: Market data dictionary from Gamma API
-        """
-        # conditionId can be in camelCase (from API) or condition_id (from our code)
-        self.condition_id = data.get("conditionId", "") or data.get("condition_id", "")
-        self.question = data.get("question", "")
-        self.slug = data.get("slug", "")
-        
-        # Extract token IDs from tokens array
-        tokens = data.get("tokens", [])
-        self.yes_token_id = ""
-        self.no_token_id = ""
-        
-        if tokens:
-            # Standard format: array of dicts with outcome info
-            for token in tokens:
-                if isinstance(token, dict):
-                    outcome = token.get("outcome", "").lower()
-                    token_id = token.get("token_id", "") or token.get("tokenId", "")
-                    
-                    if outcome == "yes":
-                        self.yes_token_id = token_id
-                    elif outcome == "no":
-                        self.no_token_id = token_id
-        
-        # If tokens not found, try clobTokenIds
-        if not self.yes_token_id or not self.no_token_id:
-            clob_token_ids = data.get("clobTokenIds", [])
-            
-            # clobTokenIds can be a string (JSON array) or a list
-            if isinstance(clob_token_ids, str):
-                try:
-                    clob_token_ids = json.loads(clob_token_ids)
-                except (json.JSONDecodeError, ValueError):
-                    clob_token_ids = []
-            
-            # Index 0 = NO, Index 1 = YES (Polymarket convention for binary markets)
-            if isinstance(clob_token_ids, list) and len(clob_token_ids) >= 2:
-                self.no_token_id = str(clob_token_ids[0])
-                self.yes_token_id = str(clob_token_ids[1])
-        
-        # Market metadata
-        self.volume_24hr = float(data.get("volume24hr", 0.0))
-        self.liquidity = float(data.get("liquidity", 0.0))
-        self.tick_size = data.get("tick_size", "0.01")
-        self.active = data.get("active", True)
-        self.closed = data.get("closed", False)
         
-        # Tags
-        self.tags = [tag.lower() for tag in data.get("tags", [])]
+        Returns:
+            Market object (check is_valid() before use)
+        """
+        yes_token_id, no_token_id = _extract_token_ids(data)
+        get = data.get
+        
+        return cls(
+            # conditionId can be in camelCase (from API) or condition_id (from our code)
+            condition_id=get("conditionId") or get("condition_id", ""),
+            question=get("question") or "",
+            slug=get("slug", ""),
+            yes_token_id=yes_token_id,
+            no_token_id=no_token_id,
+            volume_24hr=float(get("volume24hr") or 0.0),
+            liquidity=float(get("liquidity") or 0.0),
+            tick_size=get("tick_size", "0.01"),
+            active=get("active", True),
+            closed=get("closed", False),
+            tags=[tag.lower() for tag in get("tags") or ()],
+        )
     
     def is_valid(self) -> bool:
         """Check if market has all required data."""
@@ -90,35 +164,94 @@ class Market:
         )
 
 
+def _log_first_market(market_data: Dict[str, Any], market: Market):
+    """
+    Log the raw token fields of the first fetched market (DEBUG aid).
+    
+    Args:
+        market_data: Raw market data from Gamma API
+        market: Market parsed from it
+    """
+    logger.debug("      First market question: {}", market.question)
+    logger.debug("      Raw clobTokenIds: {}", market_data.get("clobTokenIds", "NOT FOUND"))
+    logger.debug("      Raw tokens: {}", market_data.get("tokens", "NOT FOUND"))
+    logger.debug("      Is valid: {}", market.is_valid())
+    logger.debug("      YES token: {:.10}", market.yes_token_id or "None")
+    logger.debug("      NO token: {:.10}", market.no_token_id or "None")
+
+
 class MarketManager:
     """
     Manages market discovery and caching from Gamma API.
     """
     
-    def __init__(self, config: Config, rate_limiter: RateLimiter):
+    def __init__(
+        self,
+        config: Config,
+        rate_limiter: RateLimiter,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize market manager.
         
         Args:
             config: Configuration object
             rate_limiter: Rate limiter for API calls
+            session: Shared aiohttp session (owned and closed by the caller).
+                If omitted, a private session is created on first use.
         """
         self.config = config
         self.rate_limiter = rate_limiter
         self.markets: Dict[str, Market] = {}  # condition_id -> Market
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._fetch_semaphore = asyncio.Semaphore(GAMMA_MAX_CONCURRENCY)
         
         logger.info("MarketManager initialized")
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """
+        Get or create aiohttp session.
+        
+        A private session is only created when none was shared or the
+        previous one was closed; it keeps one long-lived keep-alive pool so
+        Gamma calls reuse warm TCP/TLS connections.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=GAMMA_TIMEOUT,
+                json_serialize=_json_dumps,
+            )
+            self._owns_session = True
         return self._session
     
+    async def warmup(self):
+        """
+        Open a connection to the Gamma API ahead of the first real fetch.
+        
+        The response itself is ignored; the point is to pay the DNS, TCP and
+        TLS setup cost at startup and leave a warm connection in the pool.
+        """
+        try:
+            session = await self._get_session()
+            await self.rate_limiter.acquire("gamma_api")
+            async with session.get(self.config.gamma_api_url) as resp:
+                await resp.read()
+            logger.debug(f"Gamma API connection warmed up (HTTP {resp.status})")
+        except Exception as e:
+            logger.debug(f"Gamma API warmup failed: {e}")
+    
     async def close(self):
-        """Close aiohttp session."""
-        if self._session and not self._session.closed:
+        """Close aiohttp session and its connector (shared sessions are left to their owner)."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
             logger.info("MarketManager session closed")
     
@@ -134,13 +267,13 @@ class MarketManager:
         """
         try:
             session = await self._get_session()
-            url = f"{config.gamma_api_url}/events/slug/{slug}"
+            url = f"{self.config.gamma_api_url}/events/slug/{slug}"
             
             await self.rate_limiter.acquire("gamma_api")
             
             async with session.get(url) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return _json_loads(await resp.read())
                 else:
                     logger.warning(f"Failed to fetch event {slug}: HTTP {resp.status}")
                     return None
@@ -162,14 +295,15 @@ class MarketManager:
             session = await self._get_session()
             url = f"{self.config.gamma_api_url}/markets/slug/{slug}"
             
-            await self.rate_limiter.acquire("gamma_api")
-            
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                else:
-                    logger.debug(f"Failed to fetch market {slug}: HTTP {resp.status}")
-                    return None
+            async with self._fetch_semaphore:
+                await self.rate_limiter.acquire("gamma_api")
+                
+                async with session.get(url) as resp:
+                    if resp.status == 200:
+                        return _json_loads(await resp.read())
+                    else:
+                        logger.debug(f"Failed to fetch market {slug}: HTTP {resp.status}")
+                        return None
         except Exception as e:
             logger.debug(f"Error fetching market {slug}: {e}")
             return None
@@ -193,12 +327,12 @@ class MarketManager:
         markets = []
         market_slugs = set()  # Track slugs to avoid duplicates
         
-        # Search terms for "Up or Down" markets
+        # Search terms for "Up or Down" markets. Polymarket titles these with
+        # the full coin name, so the BTC/ETH ticker variants only returned
+        # duplicates; off-topic hits are dropped by the question filter below.
         search_terms = [
             "Bitcoin Up or Down",
-            "BTC Up or Down",
             "Ethereum Up or Down",
-            "ETH Up or Down",
         ]
         
         logger.info(f"Searching for BTC/ETH 'Up or Down' markets...")
@@ -224,7 +358,7 @@ class MarketManager:
                         logger.debug(f"Search failed: HTTP {resp.status}")
                         continue
                     
-                    result = await resp.json()
+                    result = _json_loads(await resp.read())
                     events = result.get("events", [])
                     
                     if not events:
@@ -243,58 +377,66 @@ class MarketManager:
             
             logger.info(f"Found {len(market_slugs)} unique market slugs, fetching details...")
             
-            # Step 2: Fetch full market details for each slug
-            for i, market_slug in enumerate(market_slugs, 1):
-                if len(markets) >= limit:
-                    break
-                
-                await self.rate_limiter.acquire("gamma_api")
-                
-                market_data = await self._fetch_market_by_slug(market_slug)
-                if not market_data:
-                    continue
-                
-                # Create Market object
-                market = Market(market_data)
-                
-                # DEBUG: Log first market details
-                if len(markets) == 0:
-                    logger.debug(f"      First market question: {market.question}")
-                    logger.debug(f"      Raw clobTokenIds: {market_data.get('clobTokenIds', 'NOT FOUND')}")
-                    logger.debug(f"      Raw tokens: {market_data.get('tokens', 'NOT FOUND')}")
-                    logger.debug(f"      Is valid: {market.is_valid()}")
-                    logger.debug(f"      YES token: {market.yes_token_id[:10] if market.yes_token_id else 'None'}")
-                    logger.debug(f"      NO token: {market.no_token_id[:10] if market.no_token_id else 'None'}")
-                
-                # Check if already added
-                if market.condition_id in self.markets:
-                    continue
-                
-                if not market.is_valid():
-                    logger.debug(f"    Market invalid: {market.question[:50]}...")
-                    continue
-                
-                # Check if question contains coin name and "up or down"
-                question_lower = market.question.lower() if market.question else ""
-                
-                # Must contain coin name
-                has_coin = any(kw in question_lower for kw in ["btc", "bitcoin", "eth", "ethereum"])
-                if not has_coin:
-                    continue
-                
-                # Must contain "up or down"
-                if "up or down" not in question_lower:
-                    continue
-                
-                # Add to list
-                markets.append(market)
-                self.markets[market.condition_id] = market
-                
-                logger.info(
-                    f"✓ [{i}/{len(market_slugs)}] {market.question[:70]}... "
-                    f"(YES: {market.yes_token_id[:10] if market.yes_token_id else 'None'}, "
-                    f"NO: {market.no_token_id[:10] if market.no_token_id else 'None'})"
-                )
+            # Step 2: Fetch full market details concurrently and take them as
+            # they arrive (_fetch_market_by_slug rate-limits and caps in-flight
+            # requests); once `limit` markets are accepted the rest are
+            # cancelled so no further rate-limit tokens are spent
+            async def fetch(slug: str):
+                try:
+                    return slug, await self._fetch_market_by_slug(slug)
+                except Exception as e:
+                    logger.debug("Error fetching market {}: {}", slug, e)
+                    return slug, None
+            
+            tasks = [asyncio.create_task(fetch(slug)) for slug in market_slugs]
+            log_found = level_enabled("INFO")
+            try:
+                for i, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                    market_slug, market_data = await next_result
+                    if not market_data:
+                        logger.debug("    No market data for slug {}", market_slug)
+                        continue
+                    
+                    # Create Market object
+                    market = Market.from_api(market_data)
+                    
+                    if not markets and level_enabled("DEBUG"):
+                        _log_first_market(market_data, market)
+                    
+                    # Check if already added
+                    if market.condition_id in self.markets:
+                        continue
+                    
+                    if not market.is_valid():
+                        logger.debug("    Market invalid: {:.50}...", market.question)
+                        continue
+                    
+                    # Must contain coin name and "up or down". Chained substring
+                    # tests beat both a regex and any() over a keyword tuple here;
+                    # "ethereum" is covered by "eth".
+                    question_lower = market.question_lower
+                    if not ("btc" in question_lower or "bitcoin" in question_lower
+                            or "eth" in question_lower):
+                        continue
+                    if _UPDOWN not in question_lower:
+                        continue
+                    
+                    # Add to list
+                    markets.append(market)
+                    self.markets[market.condition_id] = market
+                    
+                    if log_found:
+                        logger.info(
+                            "✓ [{}/{}] {:.70}... (YES: {:.10}, NO: {:.10})",
+                            i, len(market_slugs), market.question,
+                            market.yes_token_id, market.no_token_id,
+                        )
+                    
+                    if len(markets) >= limit:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
             
             logger.success(
                 f"Fetched {len(markets)} valid BTC/ETH markets (from {len(market_slugs)} slugs)"
@@ -308,7 +450,7 @@ class MarketManager:
                 logger.info("Top markets by volume:")
                 for i, market in enumerate(markets[:5], 1):
                     logger.info(
-                        f"  {i}. {market.question[:60]}... "
+                        f"  {i}. {market.question_display}... "
                         f"(${market.volume_24hr:.2f})"
                     )
             
@@ -367,13 +509,13 @@ class MarketManager:
                     )
                     return []
                 
-                events = await resp.json()
+                events = _json_loads(await resp.read())
                 
                 if not events:
                     logger.warning(f"No events found for tag: {tag}")
                     return []
                 
-                logger.debug(f"Raw API response sample: {events[0] if events else 'empty'}")
+                logger.debug("Raw API response sample: {}", events[0])
                 
                 # Parse markets from events
                 markets = []
@@ -391,27 +533,25 @@ class MarketManager:
                         market_data["condition_id"] = event.get("condition_id", "")
                         
                         # Create Market object
-                        market = Market(market_data)
+                        market = Market.from_api(market_data)
                         
                         # Validate market
                         if not market.is_valid():
-                            logger.debug(
-                                f"Skipping invalid market: {market.question}"
-                            )
+                            logger.debug("Skipping invalid market: {}", market.question)
                             continue
                         
                         # Apply filters
                         if min_volume and market.volume_24hr < min_volume:
                             logger.debug(
-                                f"Skipping low volume market: "
-                                f"{market.question} (${market.volume_24hr:.2f})"
+                                "Skipping low volume market: {} (${:.2f})",
+                                market.question, market.volume_24hr
                             )
                             continue
                         
                         if min_liquidity and market.liquidity < min_liquidity:
                             logger.debug(
-                                f"Skipping low liquidity market: "
-                                f"{market.question} (${market.liquidity:.2f})"
+                                "Skipping low liquidity market: {} (${:.2f})",
+                                market.question, market.liquidity
                             )
                             continue
                         
@@ -443,41 +583,38 @@ class MarketManager:
         """
         logger.info(f"Fetching markets for tags: {self.config.target_tags}")
         
-        all_markets = []
-        
-        # Fetch markets for each tag in parallel
-        tasks = [
-            self.fetch_markets_by_tag(
-                tag=tag,
-                limit=self.config.max_ws_subscriptions,
-                min_volume=self.config.min_market_volume,
-                min_liquidity=self.config.min_liquidity,
-            )
-            for tag in self.config.target_tags
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(
-                    f"Failed to fetch markets for tag "
-                    f"'{self.config.target_tags[i]}': {result}"
-                )
-            else:
-                all_markets.extend(result)
-        
-        # Remove duplicates (same market might appear in multiple tags)
-        unique_markets = {}
-        for market in all_markets:
-            if market.condition_id not in unique_markets:
-                unique_markets[market.condition_id] = market
+        unique_markets: Dict[str, Market] = {}
+        fetched = 0
+        
+        async def fetch_tag(tag: str) -> List[Market]:
+            # Shares the detail-fetch semaphore so tags never open more than
+            # GAMMA_MAX_CONCURRENCY connections at once
+            try:
+                async with self._fetch_semaphore:
+                    return await self.fetch_markets_by_tag(
+                        tag=tag,
+                        limit=self.config.max_ws_subscriptions,
+                        min_volume=self.config.min_market_volume,
+                        min_liquidity=self.config.min_liquidity,
+                    )
+            except Exception as e:
+                logger.error(f"Failed to fetch markets for tag '{tag}': {e}")
+                return []
+        
+        # Fetch tags in parallel and dedupe each result as soon as it arrives
+        # (same market might appear in multiple tags)
+        tasks = [fetch_tag(tag) for tag in self.config.target_tags]
+        for next_result in asyncio.as_completed(tasks):
+            markets = await next_result
+            fetched += len(markets)
+            for market in markets:
+                unique_markets.setdefault(market.condition_id, market)
         
         final_markets = list(unique_markets.values())
         
         logger.success(
             f"Total unique markets fetched: {len(final_markets)} "
-            f"(before dedup: {len(all_markets)})"
+            f"(before dedup: {fetched})"
         )
         
         return final_markets
@@ -508,7 +645,7 @@ class MarketManager:
                     )
                     return None
                 
-                event = await resp.json()
+                event = _json_loads(await resp.read())
                 
                 # Extract first market from event
                 markets = event.get("markets", [])
@@ -519,7 +656,7 @@ class MarketManager:
                 market_data = markets[0]
                 market_data["condition_id"] = event.get("condition_id", "")
                 
-                market = Market(market_data)
+                market = Market.from_api(market_data)
                 
                 if not market.is_valid():
                     logger.error(f"Invalid market data for slug: {slug}")
@@ -567,20 +704,20 @@ class MarketManager:
 
 async def test_market_manager():
     """Test market manager functionality."""
-    from config import Config
+    from config import load_config
     
     print("Testing MarketManager...")
     
     # Create config and rate limiter
     try:
-        config = Config()
+        config = load_config()
     except Exception as e:
         print(f"⚠️  Config error: {e}")
         print("   Using default config for testing")
         # Create minimal config for testing
         import os
         os.environ["POLY_PRIVATE_KEY"] = "test"
-        config = Config()
+        config = load_config()
     
     rate_limiter = RateLimiter(max_calls=10, period=60.0)
     
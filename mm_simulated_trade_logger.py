@@ -11,6 +11,8 @@ from typing import Dict, Optional, Literal
 from dataclasses import dataclass
 from loguru import logger
 
+from csv_writer import BackgroundCsvWriter
+
 
 @dataclass
 class Trade:
@@ -51,6 +53,7 @@ class SimulatedTradeLogger:
         self.total_trades = 0
         
         self._initialize_csv()
+        self._writer = BackgroundCsvWriter(csv_file)
         logger.info(f"SimulatedTradeLogger initialized: {csv_file}")
     
     def _initialize_csv(self):
@@ -212,27 +215,23 @@ class SimulatedTradeLogger:
         return trade
     
     def _save_trade(self, trade: Trade):
-        """Save trade to CSV."""
-        try:
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    trade.timestamp,
-                    trade.action,
-                    trade.market_question,
-                    trade.condition_id,
-                    f"{trade.price:.4f}",
-                    trade.size,
-                    f"{trade.cost:.2f}",
-                    trade.inventory_after,
-                    f"{trade.pnl:.2f}",
-                    f"{trade.cumulative_pnl:.2f}",
-                ])
-                f.flush()
-                os.fsync(f.fileno())
-        
-        except Exception as e:
-            logger.error(f"Failed to save trade: {e}")
+        """Queue trade for the background CSV writer."""
+        self._writer.append([
+            trade.timestamp,
+            trade.action,
+            trade.market_question,
+            trade.condition_id,
+            f"{trade.price:.4f}",
+            trade.size,
+            f"{trade.cost:.2f}",
+            trade.inventory_after,
+            f"{trade.pnl:.2f}",
+            f"{trade.cumulative_pnl:.2f}",
+        ])
+    
+    def close(self):
+        """Write any queued trades and close the CSV file."""
+        self._writer.close()
     
     def get_inventory(self, condition_id: str) -> int:
         """Get current inventory for a market."""
@@ -240,6 +239,8 @@ class SimulatedTradeLogger:
     
     def get_statistics(self) -> Dict:
         """Get trading statistics."""
+        self._writer.flush()
+        
         # Count wins/losses
         try:
             with open(self.csv_file, 'r', encoding='utf-8') as f:
@@ -319,6 +320,7 @@ if __name__ == "__main__":
     
     # Statistics
     trade_logger.log_statistics()
+    trade_logger.close()
     
     # Clean up
     if os.path.exists("test_trades.csv"):
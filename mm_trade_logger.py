@@ -7,9 +7,14 @@ CSV'ye canlı olarak market maker quote'larını kaydeder.
 import csv
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from loguru import logger
 
+from csv_writer import BackgroundCsvWriter
+
+if TYPE_CHECKING:
+    from inventory_skew_strategy import QuoteResult
+
 
 class MarketMakerLogger:
     """Market maker quote'larını CSV'ye kaydeder."""
@@ -23,6 +28,7 @@ class MarketMakerLogger:
         """
         self.csv_file = csv_file
         self._initialize_csv()
+        self._writer = BackgroundCsvWriter(csv_file)
         logger.info(f"MarketMakerLogger initialized: {csv_file}")
     
     def _initialize_csv(self):
@@ -63,7 +69,7 @@ class MarketMakerLogger:
         max_inventory: int,
         market_best_bid: float,
         market_best_ask: float,
-        quotes: Dict[str, Any]
+        quotes: "QuoteResult"
     ):
         """
         Log a quote to CSV.
@@ -91,29 +97,31 @@ class MarketMakerLogger:
                 f"{market_best_bid:.4f}",
                 f"{market_best_ask:.4f}",
                 f"{market_spread:.4f}",
-                f"{quotes['bid_price']:.4f}",
-                f"{quotes['ask_price']:.4f}",
-                f"{quotes['spread']:.4f}",
-                f"{quotes['fair_value']:.4f}",
-                f"{quotes['inventory_adjustment']:+.6f}",
-                quotes['should_stop_buying'],
-                quotes['should_stop_selling'],
+                f"{quotes.bid_price:.4f}",
+                f"{quotes.ask_price:.4f}",
+                f"{quotes.spread:.4f}",
+                f"{quotes.fair_value:.4f}",
+                f"{quotes.inventory_adjustment:+.6f}",
+                quotes.should_stop_buying,
+                quotes.should_stop_selling,
             ]
             
-            # Append to CSV
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(row)
-                f.flush()  # Flush to OS buffer
-                os.fsync(f.fileno())  # Ensure OS buffer is written to disk
+            # Queue for the background writer (batched writes, one fsync per batch)
+            self._writer.append(row)
             
             logger.debug(f"Logged quote: {condition_id[:16]}... Inv:{inventory:+d}")
         
         except Exception as e:
             logger.error(f"Failed to log quote to CSV: {e}")
     
+    def close(self):
+        """Write any queued quotes and close the CSV file."""
+        self._writer.close()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics from CSV file."""
+        self._writer.flush()
+        
         if not os.path.exists(self.csv_file):
             return {
                 "total_quotes": 0,
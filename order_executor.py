@@ -5,17 +5,35 @@ Handles FOK order submission and error handling.
 
 import asyncio
 import time
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from dataclasses import dataclass
-from py_clob_client.clob_types import OrderType
 from loguru import logger
 
 from config import Config
-from clob_client_wrapper import ClobClientWrapper, create_buy_order_args
 from balance_checker import BalanceChecker
 from arbitrage_engine import ArbitrageOpportunity
 import logger as log_module
 
+if TYPE_CHECKING:
+    from clob_client_wrapper import ClobClientWrapper
+
+# Bound by _import_clob() when the first OrderExecutor is created
+OrderType = None
+create_buy_order_args = None
+
+
+def _import_clob():
+    """
+    Import the py-clob-client dependencies on first use.
+    
+    Keeps `from order_executor import ExecutionResult` (paper trading)
+    from loading py-clob-client.
+    """
+    global OrderType, create_buy_order_args
+    if OrderType is None:
+        from py_clob_client.clob_types import OrderType
+        from clob_client_wrapper import create_buy_order_args
+
 
 @dataclass
 class ExecutionResult:
@@ -47,7 +65,7 @@ class OrderExecutor:
     def __init__(
         self,
         config: Config,
-        clob_client: ClobClientWrapper,
+        clob_client: "ClobClientWrapper",
         balance_checker: BalanceChecker
     ):
         """
@@ -58,10 +76,19 @@ class OrderExecutor:
             clob_client: CLOB client wrapper
             balance_checker: Balance checker
         """
+        _import_clob()
+        
         self.config = config
         self.clob_client = clob_client
         self.balance_checker = balance_checker
         
+        # Resolve the trading wallet once instead of per execution
+        self._wallet_address = (
+            config.poly_proxy_address
+            if config.uses_proxy
+            else self._get_wallet_address_from_key()
+        )
+        
         # Execution tracking
         self.total_executions = 0
         self.successful_executions = 0
@@ -89,18 +116,21 @@ class OrderExecutor:
         market = opportunity.market
         
         logger.info(
-            f"Executing arbitrage trade for: {market.question[:60]}..."
+            f"Executing arbitrage trade for: {market.question_display}..."
         )
         
-        # Step 1: Check USDC balance
-        wallet_address = (
-            self.config.poly_proxy_address
-            if self.config.uses_proxy
-            else self._get_wallet_address_from_key()
-        )
+        # Step 1: Check USDC balance, exchange allowance and gas concurrently
+        wallet_address = self._wallet_address
         
-        sufficient, balance = await self.balance_checker.check_sufficient_balance(
+        (
+            sufficient,
+            approved,
+            balance,
+            allowance,
+            gas_prices,
+        ) = await self.balance_checker.preflight(
             wallet_address,
+            self.config.ctf_exchange_address,
             opportunity.total_investment
         )
         
@@ -125,7 +155,31 @@ class OrderExecutor:
                 execution_time_ms=execution_time_ms,
             )
         
-        logger.info(f"Balance check passed: ${balance:.2f} USDC available")
+        if not approved:
+            logger.error(
+                f"Insufficient USDC allowance: ${allowance:.2f} < "
+                f"${opportunity.total_investment:.2f}"
+            )
+            
+            execution_time_ms = (time.time() - start_time) * 1000
+            
+            return ExecutionResult(
+                success=False,
+                yes_order_id=None,
+                no_order_id=None,
+                yes_filled=False,
+                no_filled=False,
+                yes_status="insufficient_allowance",
+                no_status="insufficient_allowance",
+                yes_error="Insufficient USDC allowance",
+                no_error="Insufficient USDC allowance",
+                execution_time_ms=execution_time_ms,
+            )
+        
+        logger.info(
+            f"Balance check passed: ${balance:.2f} USDC available "
+            f"(allowance: ${allowance:.2f}, gas: {gas_prices['fast_gwei']} gwei)"
+        )
         
         # Step 2: Create orders
         try:
@@ -170,22 +224,12 @@ class OrderExecutor:
         no_error = None
         
         try:
-            # Submit both orders in parallel
-            results = await asyncio.gather(
-                self.clob_client.create_and_post_order(
-                    yes_order_args,
-                    OrderType.FOK
-                ),
-                self.clob_client.create_and_post_order(
-                    no_order_args,
-                    OrderType.FOK
-                ),
-                return_exceptions=True
+            # Sign both legs in parallel, then submit them together
+            yes_result, no_result = await self.clob_client.create_and_post_orders_batch(
+                [yes_order_args, no_order_args],
+                OrderType.FOK
             )
             
-            yes_result = results[0]
-            no_result = results[1]
-            
             # Check if either returned an exception
             if isinstance(yes_result, Exception):
                 yes_error = str(yes_result)
@@ -326,20 +370,22 @@ class OrderExecutor:
 
 async def test_order_executor():
     """Test order executor (without real trading)."""
-    from config import Config
+    from config import load_config
     from market_manager import Market
     
     print("Testing OrderExecutor...")
     
     # Create config
     try:
-        config = Config()
+        config = load_config()
     except Exception as e:
         print(f"⚠️  Config error: {e}")
         print("   Cannot test OrderExecutor without valid config")
         return
     
     # Create components
+    from clob_client_wrapper import ClobClientWrapper
+    
     clob_client = ClobClientWrapper(config)
     balance_checker = BalanceChecker(config)
     
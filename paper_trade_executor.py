@@ -125,7 +125,7 @@ class PaperTradeExecutor:
         market = opportunity.market
         
         logger.info(
-            f"📝 [PAPER TRADE] Simulating arbitrage for: {market.question[:60]}..."
+            f"📝 [PAPER TRADE] Simulating arbitrage for: {market.question_display}..."
         )
         
         # Simulate successful execution (both orders filled)
@@ -178,7 +178,7 @@ class PaperTradeExecutor:
         
         logger.success(
             f"📝 [PAPER TRADE] Trade simulated successfully!\n"
-            f"  Market: {market.question[:60]}...\n"
+            f"  Market: {market.question_display}...\n"
             f"  Investment: ${opportunity.total_investment:.2f}\n"
             f"  Expected Profit: ${expected_profit_usd:.2f} ({opportunity.expected_profit_pct * 100:.2f}%)\n"
             f"  YES: {opportunity.yes_size:.2f} @ ${opportunity.yes_price:.4f}\n"
@@ -5,7 +5,6 @@ Implements token bucket algorithm to respect API rate limits.
 
 import time
 import asyncio
-from collections import deque
 from typing import Optional
 from loguru import logger
 
@@ -14,6 +13,11 @@ class RateLimiter:
     """
     Token bucket rate limiter for API calls.
     
+    The bucket holds up to max_calls tokens and refills continuously at
+    max_calls / period tokens per second, so bursts are capped at the bucket
+    size and sustained traffic is spread evenly instead of draining a whole
+    window's quota at once.
+    
     Polymarket API limits:
     - REST API: 100 requests per minute
     - WebSocket: 100 subscriptions per connection
@@ -24,58 +28,62 @@ class RateLimiter:
         Initialize rate limiter.
         
         Args:
-            max_calls: Maximum number of calls allowed in the period
+            max_calls: Maximum number of calls allowed in the period (bucket size)
             period: Time period in seconds (default: 60 seconds)
         """
         self.max_calls = max_calls
         self.period = period
-        self.calls = deque()
+        self.capacity = float(max_calls)
+        self.refill_rate = max_calls / period  # tokens per second
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
         self._lock = asyncio.Lock()
         
         logger.debug(f"RateLimiter initialized: {max_calls} calls per {period}s")
     
-    async def acquire(self, endpoint: str = "API"):
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last refill, up to capacity."""
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._last_refill) * self.refill_rate
+        )
+        self._last_refill = now
+    
+    async def acquire(self, endpoint: str = "API", tokens: int = 1):
         """
         Acquire permission to make an API call.
         Blocks if rate limit is exceeded until capacity is available.
         
         Args:
             endpoint: Name of the endpoint (for logging purposes)
+            tokens: Number of tokens to take (e.g. for batch endpoints)
+        
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds
         """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens from a bucket of {self.max_calls}"
+            )
+        
         async with self._lock:
-            now = time.time()
-            
-            # Remove calls outside the time window
-            while self.calls and self.calls[0] < now - self.period:
-                self.calls.popleft()
+            self._refill(time.monotonic())
             
-            # Check if we've hit the rate limit
-            if len(self.calls) >= self.max_calls:
-                # Calculate sleep time needed
-                oldest_call = self.calls[0]
-                sleep_time = self.period - (now - oldest_call)
-                
-                if sleep_time > 0:
-                    logger.warning(
-                        f"Rate limit reached for {endpoint}: "
-                        f"{len(self.calls)}/{self.max_calls} calls. "
-                        f"Sleeping for {sleep_time:.2f}s"
-                    )
-                    await asyncio.sleep(sleep_time)
-                    
-                    # Clean up old calls after sleeping
-                    now = time.time()
-                    while self.calls and self.calls[0] < now - self.period:
-                        self.calls.popleft()
+            # Wait exactly as long as the missing tokens take to accrue
+            if self._tokens < tokens:
+                sleep_time = (tokens - self._tokens) / self.refill_rate
+                logger.warning(
+                    f"Rate limit reached for {endpoint}: "
+                    f"{self._tokens:.2f}/{self.max_calls} tokens left. "
+                    f"Sleeping for {sleep_time:.2f}s"
+                )
+                await asyncio.sleep(sleep_time)
+                self._refill(time.monotonic())
             
-            # Record this call
-            self.calls.append(now)
+            self._tokens -= tokens
             
-            # Log current rate limit usage
-            usage_pct = (len(self.calls) / self.max_calls) * 100
             logger.debug(
-                f"Rate limit usage: {len(self.calls)}/{self.max_calls} "
-                f"({usage_pct:.1f}%)"
+                "Rate limit tokens left: {:.2f}/{}", self._tokens, self.max_calls
             )
     
     def get_current_usage(self) -> tuple[int, int, float]:
@@ -83,22 +91,19 @@ class RateLimiter:
         Get current rate limit usage.
         
         Returns:
-            Tuple of (current_calls, max_calls, usage_percentage)
+            Tuple of (tokens_in_use, max_calls, usage_percentage)
         """
-        now = time.time()
-        
-        # Remove expired calls
-        while self.calls and self.calls[0] < now - self.period:
-            self.calls.popleft()
+        self._refill(time.monotonic())
         
-        current = len(self.calls)
-        usage_pct = (current / self.max_calls) * 100
+        current = int(self.capacity - self._tokens)
+        usage_pct = ((self.capacity - self._tokens) / self.capacity) * 100
         
         return current, self.max_calls, usage_pct
     
     def reset(self):
-        """Reset rate limiter (clear all recorded calls)."""
-        self.calls.clear()
+        """Reset rate limiter (refill the bucket)."""
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
         logger.info("Rate limiter reset")
     
     async def wait_if_needed(self, endpoint: str = "API"):
@@ -107,25 +112,20 @@ class RateLimiter:
         
         Args:
             endpoint: Name of the endpoint (for logging purposes)
+        
+        Returns:
+            Seconds until a token is available (0 if one is available now)
         """
         async with self._lock:
-            now = time.time()
+            self._refill(time.monotonic())
             
-            # Remove calls outside the time window
-            while self.calls and self.calls[0] < now - self.period:
-                self.calls.popleft()
-            
-            # Check if we need to wait
-            if len(self.calls) >= self.max_calls:
-                oldest_call = self.calls[0]
-                sleep_time = self.period - (now - oldest_call)
-                
-                if sleep_time > 0:
-                    logger.warning(
-                        f"Rate limit check for {endpoint}: "
-                        f"Need to wait {sleep_time:.2f}s"
-                    )
-                    return sleep_time
+            if self._tokens < 1:
+                sleep_time = (1 - self._tokens) / self.refill_rate
+                logger.warning(
+                    f"Rate limit check for {endpoint}: "
+                    f"Need to wait {sleep_time:.2f}s"
+                )
+                return sleep_time
             
             return 0
 
@@ -233,18 +233,18 @@ Order Details:
 
 def test_transaction_decoder():
     """Test transaction decoder with a known transaction."""
-    from config import Config
+    from config import load_config
     
     print("Testing TransactionDecoder...")
     
     # Create config
     try:
-        config = Config()
+        config = load_config()
     except Exception as e:
         print(f"⚠️  Config error: {e}")
         import os
         os.environ["POLY_PRIVATE_KEY"] = "test"
-        config = Config()
+        config = load_config()
     
     # Create decoder
     decoder = TransactionDecoder(config)
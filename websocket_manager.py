@@ -6,7 +6,11 @@ Handles real-time orderbook updates and event parsing.
 import asyncio
 import json
 import time
-from typing import Dict, List, Optional, Callable, Any
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Deque, Dict, List, Optional, Callable, Any, Tuple
+import numpy as np
 import websockets
 from websockets.client import WebSocketClientProtocol
 from loguru import logger
@@ -14,9 +18,40 @@ from loguru import logger
 from config import Config
 from market_manager import Market
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to a JSON text frame with orjson."""
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+# Raw messages buffered between the WebSocket reader and the processor
+WS_INBOX_SIZE = 4096
+
+# Minimum seconds between inbox-overflow warnings / resubscriptions
+WS_RESYNC_INTERVAL = 5.0
+
+# Depth kept per side; deeper levels are irrelevant for sizing our orders
+MAX_BOOK_LEVELS = 50
+
 
 class OrderbookSnapshot:
-    """Represents an orderbook snapshot for a token."""
+    """
+    Represents an orderbook snapshot for a token.
+    
+    Levels are stored as parallel float64 arrays per side, best price first
+    (bids descending, asks ascending), capped at MAX_BOOK_LEVELS.
+    """
+    
+    __slots__ = (
+        "asset_id", "timestamp", "hash", "seq",
+        "bids_px", "bids_sz", "asks_px", "asks_sz",
+    )
     
     def __init__(self, asset_id: str, event_data: Dict[str, Any]):
         """
@@ -29,28 +64,64 @@ class OrderbookSnapshot:
         self.asset_id = asset_id
         self.timestamp = event_data.get("timestamp", "")
         self.hash = event_data.get("hash", "")
+        self.seq = 0  # Assigned by WebSocketManager when the book is cached
         
         # Parse bids and asks
-        self.bids = self._parse_orders(event_data.get("bids", []))
-        self.asks = self._parse_orders(event_data.get("asks", []))
-    
-    def _parse_orders(self, orders: List[Dict]) -> List[Dict[str, float]]:
-        """Parse order list to standardized format."""
-        return [
-            {
-                "price": float(order["price"]),
-                "size": float(order["size"]),
-            }
-            for order in orders
-        ]
+        self.bids_px, self.bids_sz = self._parse_orders(event_data.get("bids", []), descending=True)
+        self.asks_px, self.asks_sz = self._parse_orders(event_data.get("asks", []), descending=False)
+    
+    @staticmethod
+    def _parse_orders(
+        orders: List[Dict],
+        descending: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Parse order list into (prices, sizes) arrays sorted best first."""
+        levels = np.array(
+            [(order["price"], order["size"]) for order in orders],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        
+        order = np.argsort(-levels[:, 0] if descending else levels[:, 0], kind="stable")
+        order = order[:MAX_BOOK_LEVELS]
+        return levels[order, 0], levels[order, 1]
     
     def get_best_bid(self) -> Optional[Dict[str, float]]:
         """Get best bid (highest buy price)."""
-        return self.bids[0] if self.bids else None
+        if not self.bids_px.size:
+            return None
+        return {"price": float(self.bids_px[0]), "size": float(self.bids_sz[0])}
     
     def get_best_ask(self) -> Optional[Dict[str, float]]:
         """Get best ask (lowest sell price)."""
-        return self.asks[0] if self.asks else None
+        if not self.asks_px.size:
+            return None
+        return {"price": float(self.asks_px[0]), "size": float(self.asks_sz[0])}
+    
+    def fillable_ask_size(self, limit: float) -> float:
+        """
+        Size available to buy at or below a limit price.
+        
+        Args:
+            limit: Worst acceptable ask price
+        
+        Returns:
+            Total ask size priced <= limit
+        """
+        idx = np.searchsorted(self.asks_px, limit, side="right")
+        return float(self.asks_sz[:idx].sum())
+    
+    def fillable_bid_size(self, limit: float) -> float:
+        """
+        Size available to sell at or above a limit price.
+        
+        Args:
+            limit: Worst acceptable bid price
+        
+        Returns:
+            Total bid size priced >= limit
+        """
+        idx = np.searchsorted(-self.bids_px, -limit, side="right")
+        return float(self.bids_sz[:idx].sum())
     
     def __repr__(self) -> str:
         best_bid = self.get_best_bid()
@@ -62,6 +133,14 @@ class OrderbookSnapshot:
         )
 
 
+@dataclass(slots=True)
+class L1Snapshot:
+    """Top-of-book view of a token, updated in place on every book change."""
+    
+    best_ask: float  # NaN when the book has no asks
+    seq: int
+
+
 class WebSocketManager:
     """
     Manages WebSocket connection to Polymarket Market Channel.
@@ -78,12 +157,28 @@ class WebSocketManager:
         self.config = config
         self.ws: Optional[WebSocketClientProtocol] = None
         self.orderbooks: Dict[str, OrderbookSnapshot] = {}  # asset_id -> orderbook
+        self._l1: Dict[str, L1Snapshot] = {}  # asset_id -> top of book
+        self._seq = 0  # Bumped on every orderbook mutation
         self.subscribed_markets: List[str] = []
         self.subscribed_assets: List[str] = []
         
         # Callbacks
         self.on_book_update: Optional[Callable] = None
+        # asset_id -> callback(asset_id, orderbook) with its Market pre-bound
+        self._asset_callbacks: Dict[str, Callable] = {}
         self.on_price_change: Optional[Callable] = None
+        # Optional async callback(market) fired when a cached Market is
+        # updated from the stream (e.g. tick size change)
+        self.on_market_update: Optional[Callable] = None
+        # asset_id -> Market, so stream events can update market state in place
+        self._asset_markets: Dict[str, Market] = {}
+        
+        # Reader -> processor hand-off (see listen)
+        self._inbox: Deque[str] = deque(maxlen=WS_INBOX_SIZE)
+        self._inbox_event = asyncio.Event()
+        self.dropped_messages = 0  # Oldest raw messages evicted from a full inbox
+        self._reported_drops = 0  # dropped_messages at the last warning
+        self._last_resync = 0.0  # time.monotonic() of the last resubscription
         
         # Connection management
         self._running = False
@@ -114,12 +209,20 @@ class WebSocketManager:
             logger.error(f"Failed to connect to WebSocket: {e}")
             raise
     
-    async def subscribe_to_markets(self, markets: List[Market]):
+    async def subscribe_to_markets(
+        self,
+        markets: List[Market],
+        callback: Optional[Callable] = None
+    ):
         """
         Subscribe to Market Channel for multiple markets.
         
         Args:
             markets: List of Market objects to subscribe to
+            callback: Optional async callback(market, asset_id, orderbook).
+                The Market object is bound per asset at subscription time, so
+                updates for these assets skip market lookups and bypass
+                on_book_update.
         """
         if not self.ws:
             await self.connect()
@@ -158,11 +261,24 @@ class WebSocketManager:
         )
         
         try:
-            await self.ws.send(json.dumps(subscribe_msg))
+            await self.ws.send(_json_dumps(subscribe_msg))
             
             self.subscribed_assets = asset_ids
             self.subscribed_markets = market_ids
             
+            subscribed = set(asset_ids)
+            for market in markets:
+                for token_id in (market.yes_token_id, market.no_token_id):
+                    if token_id in subscribed:
+                        self._asset_markets[token_id] = market
+            
+            if callback:
+                for market in markets:
+                    bound = partial(callback, market)
+                    for token_id in (market.yes_token_id, market.no_token_id):
+                        if token_id in subscribed:
+                            self._asset_callbacks[token_id] = bound
+            
             logger.success(
                 f"Subscribed to {len(market_ids)} markets successfully"
             )
@@ -175,9 +291,25 @@ class WebSocketManager:
         """
         Listen for WebSocket messages and handle events.
         
+        Receiving and processing run as separate tasks: the reader only pulls
+        frames off the socket into an inbox, so slow event handling never
+        delays the next recv() during bursts.
+        
         This runs in a loop until stopped.
         """
         self._running = True
+        processor = asyncio.create_task(self._process_messages())
+        try:
+            await self._read_messages()
+        finally:
+            processor.cancel()
+            try:
+                await processor
+            except asyncio.CancelledError:
+                pass
+    
+    async def _read_messages(self):
+        """Reader half of listen(): receive frames and queue them raw."""
         reconnect_delay = self._reconnect_delay
         last_ping_time = time.time()
         ping_interval = 10.0  # Send PING every 10 seconds
@@ -191,11 +323,7 @@ class WebSocketManager:
                     
                     # Resubscribe to markets if we had subscriptions
                     if self.subscribed_assets:
-                        subscribe_msg = {
-                            "type": "market",
-                            "assets_ids": self.subscribed_assets,
-                        }
-                        await self.ws.send(json.dumps(subscribe_msg))
+                        await self._resubscribe()
                         logger.info("Resubscribed to markets after reconnection")
                         last_ping_time = time.time()
                 
@@ -220,8 +348,14 @@ class WebSocketManager:
                     # Reset reconnect delay on successful receive
                     reconnect_delay = self._reconnect_delay
                     
-                    # Parse and handle message
-                    await self._handle_message(message)
+                    # Hand off to the processor; no parsing on the reader
+                    if len(self._inbox) == WS_INBOX_SIZE:
+                        self.dropped_messages += 1
+                    self._inbox.append(message)
+                    self._inbox_event.set()
+                    
+                    if self.dropped_messages != self._reported_drops:
+                        await self._resync_after_drops()
                     
                 except asyncio.TimeoutError:
                     # Timeout is OK, we'll check for PING and continue
@@ -229,6 +363,7 @@ class WebSocketManager:
                 
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("WebSocket connection closed")
+                self.ws = None
                 
                 if self._running:
                     logger.info(f"Reconnecting in {reconnect_delay}s...")
@@ -246,15 +381,115 @@ class WebSocketManager:
                 if self._running:
                     await asyncio.sleep(reconnect_delay)
     
-    async def _handle_message(self, message: str):
+    async def _resubscribe(self):
+        """Resend the market subscription; the server answers with fresh book snapshots."""
+        subscribe_msg = {
+            "type": "market",
+            "assets_ids": self.subscribed_assets,
+        }
+        await self.ws.send(_json_dumps(subscribe_msg))
+    
+    async def _resync_after_drops(self):
+        """
+        Warn about evicted inbox messages and resubscribe for fresh books.
+        
+        An evicted frame may have been a book snapshot or price change, so
+        cached books can be stale. Runs at most once per WS_RESYNC_INTERVAL;
+        drops in between are reported on the next run.
+        """
+        now = time.monotonic()
+        if now - self._last_resync < WS_RESYNC_INTERVAL:
+            return
+        self._last_resync = now
+        
+        dropped = self.dropped_messages - self._reported_drops
+        self._reported_drops = self.dropped_messages
+        logger.warning(
+            "WebSocket inbox full: dropped {} messages ({} total), resubscribing for fresh books",
+            dropped, self.dropped_messages
+        )
+        
+        if self.subscribed_assets:
+            await self._resubscribe()
+    
+    async def _process_messages(self):
+        """
+        Processor half of listen(): parse and dispatch queued messages.
+        
+        Each wake-up drains everything the reader has queued so far.
+        """
+        inbox = self._inbox
+        
+        while True:
+            await self._inbox_event.wait()
+            self._inbox_event.clear()
+            
+            events: List[Dict[str, Any]] = []
+            while inbox:
+                events.extend(self._parse_message(inbox.popleft()))
+            
+            await self._handle_events(events)
+            
+            # Let the reader run between batches
+            await asyncio.sleep(0)
+    
+    def _parse_message(self, message: str) -> List[Dict[str, Any]]:
         """
-        Handle incoming WebSocket message.
+        Parse a raw WebSocket message into its events.
         
         Args:
-            message: Raw message string
+            message: Raw message string (one event object or an array of them)
+        
+        Returns:
+            List of event dicts (empty if the message is not valid JSON)
+        """
+        try:
+            data = _json_loads(message)
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse WebSocket message: {}", e)
+            return []
+        
+        if isinstance(data, list):
+            return [event for event in data if isinstance(event, dict)]
+        return [data] if isinstance(data, dict) else []
+    
+    async def _handle_events(self, events: List[Dict[str, Any]]):
+        """
+        Handle a batch of events in arrival order.
+        
+        A full book snapshot replaces everything before it, so only the
+        newest snapshot per asset in the batch is applied.
+        
+        Args:
+            events: Parsed events
+        """
+        if len(events) > 1:
+            latest_book = {
+                event.get("asset_id"): i
+                for i, event in enumerate(events)
+                if event.get("event_type") == "book"
+            }
+        else:
+            latest_book = None
+        
+        for i, event in enumerate(events):
+            # Skip book snapshots superseded later in this batch
+            if (
+                latest_book
+                and event.get("event_type") == "book"
+                and latest_book[event.get("asset_id")] != i
+            ):
+                continue
+            await self._handle_event(event)
+    
+    async def _handle_event(self, data: Dict[str, Any]):
+        """
+        Handle a single WebSocket event.
+        
+        Args:
+            data: Parsed event
         """
         try:
-            data = json.loads(message)
             event_type = data.get("event_type")
             
             if event_type == "book":
@@ -268,10 +503,8 @@ class WebSocketManager:
             else:
                 pass
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse WebSocket message: {e}")
         except Exception as e:
-            logger.error(f"Error handling WebSocket message: {e}")
+            logger.error("Error handling WebSocket message: {}", e)
     
     async def _handle_book_event(self, data: Dict[str, Any]):
         """
@@ -287,14 +520,17 @@ class WebSocketManager:
         orderbook = OrderbookSnapshot(asset_id, data)
         
         # Cache orderbook
-        self.orderbooks[asset_id] = orderbook
+        self._store_orderbook(asset_id, orderbook)
         
         # Trigger callback
-        if self.on_book_update:
-            try:
+        callback = self._asset_callbacks.get(asset_id)
+        try:
+            if callback:
+                await callback(asset_id, orderbook)
+            elif self.on_book_update:
                 await self.on_book_update(market, asset_id, orderbook)
-            except Exception as e:
-                logger.error(f"Error in book update callback: {e}")
+        except Exception as e:
+            logger.error("Error in book update callback: {}", e)
     
     async def _handle_price_change_event(self, data: Dict[str, Any]):
         """
@@ -322,24 +558,71 @@ class WebSocketManager:
                         "hash": change.get("hash", ""),
                     }
                     orderbook = OrderbookSnapshot(asset_id, event_data)
-                    self.orderbooks[asset_id] = orderbook
+                    self._store_orderbook(asset_id, orderbook)
                     
                     # Trigger same callback as book event - bot will check arbitrage
-                    if self.on_book_update:
-                        try:
+                    callback = self._asset_callbacks.get(asset_id)
+                    try:
+                        if callback:
+                            await callback(asset_id, orderbook)
+                        elif self.on_book_update:
                             await self.on_book_update(market, asset_id, orderbook)
-                        except Exception as e:
-                            logger.error(f"Error in price change -> book callback: {e}")
+                    except Exception as e:
+                        logger.error("Error in price change -> book callback: {}", e)
                 except (ValueError, TypeError) as e:
-                    logger.debug(f"Invalid price_change data for {asset_id[:16]}: {e}")
+                    logger.debug("Invalid price_change data for {:.16}: {}", asset_id, e)
     
     async def _handle_last_trade_event(self, data: Dict[str, Any]):
         """Handle 'last_trade_price' event (market trades - not our executions)."""
         pass
     
     async def _handle_tick_size_change(self, data: Dict[str, Any]):
-        """Handle 'tick_size_change' event (suppress - not trade related)."""
-        pass
+        """
+        Handle 'tick_size_change' event.
+        
+        Updates the cached Market's tick size in place and notifies
+        on_market_update, so callers never need to re-fetch the market
+        from the Gamma API to pick up the change.
+        
+        Args:
+            data: Parsed event
+        """
+        market = self._asset_markets.get(data.get("asset_id"))
+        new_tick_size = data.get("new_tick_size")
+        if market is None or not new_tick_size or market.tick_size == new_tick_size:
+            return
+        
+        logger.info(
+            "Tick size changed for {}: {} -> {}",
+            market.question_short, market.tick_size, new_tick_size
+        )
+        market.tick_size = new_tick_size
+        
+        if self.on_market_update:
+            try:
+                await self.on_market_update(market)
+            except Exception as e:
+                logger.error("Error in market update callback: {}", e)
+    
+    def _store_orderbook(self, asset_id: str, orderbook: OrderbookSnapshot):
+        """
+        Cache an orderbook and stamp it with the next sequence number.
+        
+        Args:
+            asset_id: Token ID
+            orderbook: New orderbook snapshot
+        """
+        self._seq += 1
+        orderbook.seq = self._seq
+        self.orderbooks[asset_id] = orderbook
+        
+        best_ask = float(orderbook.asks_px[0]) if orderbook.asks_px.size else np.nan
+        l1 = self._l1.get(asset_id)
+        if l1 is None:
+            self._l1[asset_id] = L1Snapshot(best_ask, self._seq)
+        else:
+            l1.best_ask = best_ask
+            l1.seq = self._seq
     
     def get_orderbook(self, asset_id: str) -> Optional[OrderbookSnapshot]:
         """
@@ -357,7 +640,7 @@ class WebSocketManager:
         self,
         yes_token_id: str,
         no_token_id: str
-    ) -> Optional[Dict[str, float]]:
+    ) -> Optional[Tuple[float, float]]:
         """
         Get best ask prices for YES and NO tokens.
         
@@ -366,24 +649,75 @@ class WebSocketManager:
             no_token_id: NO token ID
         
         Returns:
-            Dictionary with yes_ask and no_ask prices or None
+            Tuple of (yes_ask, no_ask) or None
+        """
+        quote = self.get_best_prices_seq(yes_token_id, no_token_id)
+        return quote[:2] if quote else None
+    
+    def get_best_prices_seq(
+        self,
+        yes_token_id: str,
+        no_token_id: str
+    ) -> Optional[Tuple[float, float, int, int]]:
         """
-        yes_book = self.orderbooks.get(yes_token_id)
-        no_book = self.orderbooks.get(no_token_id)
+        Get best ask prices and book sequence numbers for YES and NO tokens.
+        
+        Args:
+            yes_token_id: YES token ID
+            no_token_id: NO token ID
         
-        if not yes_book or not no_book:
+        Returns:
+            Tuple of (yes_ask, no_ask, yes_seq, no_seq) or None
+        """
+        yes_l1 = self._l1.get(yes_token_id)
+        no_l1 = self._l1.get(no_token_id)
+        
+        if yes_l1 is None or no_l1 is None:
             return None
         
-        yes_ask = yes_book.get_best_ask()
-        no_ask = no_book.get_best_ask()
+        yes_ask = yes_l1.best_ask
+        no_ask = no_l1.best_ask
         
-        if not yes_ask or not no_ask:
+        # NaN (empty side) is the only value not equal to itself
+        if yes_ask != yes_ask or no_ask != no_ask:
             return None
         
-        return {
-            "yes_ask": yes_ask["price"],
-            "no_ask": no_ask["price"],
-        }
+        return yes_ask, no_ask, yes_l1.seq, no_l1.seq
+    
+    def get_best_prices_batch(
+        self,
+        yes_token_ids: List[str],
+        no_token_ids: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get best ask prices for many YES/NO token pairs in one pass.
+        
+        Args:
+            yes_token_ids: YES token IDs (one per market)
+            no_token_ids: NO token IDs (aligned with yes_token_ids)
+        
+        Returns:
+            Tuple of (yes_asks, no_asks, valid) arrays aligned with the inputs.
+            Rows without both best asks are NaN and marked invalid.
+        """
+        count = len(yes_token_ids)
+        yes_asks = np.full(count, np.nan, dtype=np.float64)
+        no_asks = np.full(count, np.nan, dtype=np.float64)
+        l1_books = self._l1
+        
+        for i in range(count):
+            yes_l1 = l1_books.get(yes_token_ids[i])
+            no_l1 = l1_books.get(no_token_ids[i])
+            
+            if yes_l1 is None or no_l1 is None:
+                continue
+            
+            yes_asks[i] = yes_l1.best_ask
+            no_asks[i] = no_l1.best_ask
+        
+        valid = ~(np.isnan(yes_asks) | np.isnan(no_asks))
+        
+        return yes_asks, no_asks, valid
     
     async def stop(self):
         """Stop listening and close WebSocket connection."""
@@ -401,7 +735,7 @@ class WebSocketManager:
 
 async def test_websocket_manager():
     """Test WebSocket manager functionality."""
-    from config import Config
+    from config import load_config
     from market_manager import MarketManager
     from rate_limiter import RateLimiter
     
@@ -409,12 +743,12 @@ async def test_websocket_manager():
     
     # Create config
     try:
-        config = Config()
+        config = load_config()
     except Exception as e:
         print(f"⚠️  Config error: {e}")
         import os
         os.environ["POLY_PRIVATE_KEY"] = "test"
-        config = Config()
+        config = load_config()
     
     # Create managers
     rate_limiter = RateLimiter(max_calls=10, period=60.0)